@@ -0,0 +1 @@
+"""Custom components of Home Assistant (needed to run tests)."""
@@ -6,13 +6,77 @@ https://github.com/brenard/hass-enslaved-thermostat
 """
 from enum import IntFlag
 
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
 from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    CONF_FLEET_CONTROL,
+    CONF_FLEET_INTERVAL,
+    CONF_TPI_CYCLE,
+    CONF_TRACE,
+    CONF_TRACE_MAX_SIZE,
+    CONF_TRACE_PATH,
+    CONF_TRACE_SAMPLE_RATE,
+    DATA_CONFIG,
+    DEFAULT_FLEET_INTERVAL,
+    DEFAULT_TPI_CYCLE,
+    DEFAULT_TRACE_MAX_SIZE,
+    DEFAULT_TRACE_SAMPLE_RATE,
+    DOMAIN,
+)
+from .profiler import async_get_startup_profile, async_register_profile_service
+from .trace import async_get_decision_trace
+from .websocket_api import async_register_websocket_commands
 
-DOMAIN = "enslaved_thermostat"
 PLATFORMS = [Platform.CLIMATE]
 
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN, default={}): vol.Schema(
+            {
+                vol.Optional(CONF_TPI_CYCLE, default=DEFAULT_TPI_CYCLE): cv.positive_time_period,
+                vol.Optional(CONF_FLEET_CONTROL, default=False): cv.boolean,
+                vol.Optional(
+                    CONF_FLEET_INTERVAL, default=DEFAULT_FLEET_INTERVAL
+                ): cv.positive_time_period,
+                vol.Optional(CONF_TRACE, default=False): cv.boolean,
+                vol.Optional(CONF_TRACE_PATH): cv.string,
+                vol.Optional(CONF_TRACE_SAMPLE_RATE, default=DEFAULT_TRACE_SAMPLE_RATE): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=1)
+                ),
+                vol.Optional(CONF_TRACE_MAX_SIZE, default=DEFAULT_TRACE_MAX_SIZE): cv.positive_int,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 
 class EnslavedThermostatEntityFeature(IntFlag):
     """Supported features of the enslaved thermostat entity."""
 
     ENSLAVES_MODE = 1
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the enslaved thermostat integration."""
+    profile = async_get_startup_profile(hass)
+    with profile.measure("setup"):
+        hass.data.setdefault(DOMAIN, {})[DATA_CONFIG] = config.get(DOMAIN, {})
+        async_register_websocket_commands(hass)
+        async_register_profile_service(hass)
+        async_get_decision_trace(hass).async_start()
+        # Load the diagnostic sensors exposing the integration metrics
+        hass.async_create_task(async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config))
+
+    @callback
+    def _async_hass_started(_hass: HomeAssistant) -> None:
+        profile.async_hass_started()
+
+    async_at_started(hass, _async_hass_started)
+    return True
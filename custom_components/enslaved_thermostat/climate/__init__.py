@@ -22,27 +22,52 @@ from homeassistant.components.generic_thermostat.climate import (
     PLATFORM_SCHEMA,
 )
 from homeassistant.const import CONF_NAME, CONF_UNIQUE_ID
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, SupportsResponse, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback, async_get_current_platform
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .. import DOMAIN, PLATFORMS
 from ..const import (
+    CONF_CONTROL_MODE,
     CONF_ENSLAVED_THERMOSTATS,
     CONF_INITIAL_ENSLAVED_MODE,
     CONF_INITIAL_MANUAL_HVAC_MODE,
     CONF_INITIAL_MANUAL_TARGET_TEMP,
+    CONF_MAX_PREHEAT,
+    CONF_MEMBER_CALL_TIMEOUT,
+    CONF_MEMBER_COOL_DOWN,
+    CONF_MEMBER_FAILURE_THRESHOLD,
+    CONF_SENSOR_FILTER,
+    CONF_SENSOR_FILTER_ALPHA,
+    CONF_SENSOR_FILTER_WINDOW,
+    CONF_SENSOR_FUSION,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_SENSOR_STALE_AFTER,
+    CONF_SENSOR_WEIGHTS,
+    CONF_TPI_COEF,
     CONF_TYPE,
+    CONF_UNRECORDED_ATTRIBUTES,
+    DEFAULT_UNRECORDED_ATTRIBUTES,
+    ENSLAVED_STATE_ATTRS,
+    SERVICE_RESTORE_ENSLAVED_STATE,
+    SERVICE_RESTORE_GROUP,
     SERVICE_RESTORE_MANUAL_STATE,
+    SERVICE_SCHEDULE_SCHEDULER_MODE,
     SERVICE_SET_ENSLAVED_HVAC_MODE,
     SERVICE_SET_ENSLAVED_MODE,
     SERVICE_SET_ENSLAVED_TARGET_TEMP,
     SERVICE_SET_MANUAL_STATE,
+    SERVICE_SNAPSHOT_GROUP,
     SERVICE_START_SCHEDULER_MODE,
     SERVICE_STOP_SCHEDULER_MODE,
+    SERVICE_UPDATE_SCHEDULER_TARGET,
+    ControlMode,
     EnslavedType,
+    SensorFilter,
+    SensorFusionMethod,
 )
+from ..profiler import async_get_startup_profile
 from .enslaved import EnslavedMode, EnslavedThermostat
 from .master import MasterThermostat
 from .schedulable import SchedulableThermostat
@@ -53,17 +78,42 @@ log = logging.getLogger(__name__)
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Optional(CONF_HEATER): cv.entity_id,
-        vol.Optional(CONF_SENSOR): cv.entity_id,
+        vol.Optional(CONF_SENSOR): vol.All(cv.ensure_list, [cv.entity_id]),
         vol.Required(CONF_TYPE, default=EnslavedType.ENSLAVED): vol.Coerce(EnslavedType),
         vol.Optional(CONF_NAME): cv.string,
+        vol.Optional(CONF_UNRECORDED_ATTRIBUTES, default=DEFAULT_UNRECORDED_ATTRIBUTES): vol.All(
+            cv.ensure_list, [vol.In(ENSLAVED_STATE_ATTRS)]
+        ),
         # For enslaved thermostats
         vol.Optional(CONF_INITIAL_ENSLAVED_MODE): vol.Coerce(EnslavedMode),
+        vol.Optional(CONF_SENSOR_FILTER, default=SensorFilter.NONE): vol.Coerce(SensorFilter),
+        vol.Optional(CONF_SENSOR_FILTER_WINDOW): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_SENSOR_FILTER_ALPHA): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False, max=1)
+        ),
+        vol.Optional(CONF_SENSOR_MIN_INTERVAL): cv.positive_time_period,
+        vol.Optional(CONF_SENSOR_FUSION, default=SensorFusionMethod.MEAN): vol.Coerce(
+            SensorFusionMethod
+        ),
+        vol.Optional(CONF_SENSOR_WEIGHTS): {
+            cv.entity_id: vol.All(vol.Coerce(float), vol.Range(min=0, min_included=False))
+        },
+        vol.Optional(CONF_SENSOR_STALE_AFTER): cv.positive_time_period,
+        vol.Optional(CONF_CONTROL_MODE, default=ControlMode.HYSTERESIS): vol.Coerce(ControlMode),
+        vol.Optional(CONF_TPI_COEF): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
         # For master thermostats
         vol.Optional(CONF_ENSLAVED_THERMOSTATS, default=[]): vol.All(
             cv.ensure_list, [cv.entity_id]
         ),
         vol.Optional(CONF_INITIAL_MANUAL_TARGET_TEMP): vol.Coerce(float),
         vol.Optional(CONF_INITIAL_MANUAL_HVAC_MODE): vol.Coerce(HVACMode),
+        vol.Optional(CONF_MEMBER_CALL_TIMEOUT): cv.positive_time_period,
+        vol.Optional(CONF_MEMBER_FAILURE_THRESHOLD): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_MEMBER_COOL_DOWN): cv.positive_time_period,
+        # For schedulable thermostats
+        vol.Optional(CONF_MAX_PREHEAT): cv.positive_time_period,
     }
 )
 
@@ -75,9 +125,21 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the generic thermostat platform."""
+    profile = async_get_startup_profile(hass)
+    with profile.measure("platform_setup"):
+        _async_add_entity(hass, config, async_add_entities)
 
-    await async_setup_reload_service(hass, DOMAIN, PLATFORMS)
+    # Note: services are shared by all platforms, they are only registered by the first one
+    with profile.measure("register_services"):
+        await async_setup_reload_service(hass, DOMAIN, PLATFORMS)
+        await async_register_services(async_get_current_platform())
 
+
+@callback
+def _async_add_entity(
+    hass: HomeAssistant, config: ConfigType, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Create the configured thermostat entity and add it."""
     kwargs = {
         "name": config.get(CONF_NAME),
         "min_temp": config.get(CONF_MIN_TEMP),
@@ -94,39 +156,59 @@ async def async_setup_platform(
         "initial_manual_hvac_mode": config.get(CONF_INITIAL_MANUAL_HVAC_MODE),
     }
 
+    unrecorded_attributes = config.get(CONF_UNRECORDED_ATTRIBUTES, DEFAULT_UNRECORDED_ATTRIBUTES)
     dev_type = config.get(CONF_TYPE)
     if dev_type == EnslavedType.ENSLAVED:
+        sensors = config.get(CONF_SENSOR) or []
         kwargs.update(
             {
                 "heater_entity_id": config.get(CONF_HEATER),
-                "sensor_entity_id": config.get(CONF_SENSOR),
+                "sensor_entity_id": sensors[0] if sensors else None,
+                "sensor_entity_ids": sensors,
+                "sensor_fusion": config.get(CONF_SENSOR_FUSION),
+                "sensor_weights": config.get(CONF_SENSOR_WEIGHTS),
+                "sensor_stale_after": config.get(CONF_SENSOR_STALE_AFTER),
+                "control_mode": config.get(CONF_CONTROL_MODE),
+                "tpi_coef": config.get(CONF_TPI_COEF),
                 "min_cycle_duration": config.get(CONF_MIN_DUR),
                 "cold_tolerance": config.get(CONF_COLD_TOLERANCE),
                 "hot_tolerance": config.get(CONF_HOT_TOLERANCE),
                 "keep_alive": config.get(CONF_KEEP_ALIVE),
                 "initial_enslaved_mode": config.get(CONF_INITIAL_ENSLAVED_MODE),
+                "sensor_filter": config.get(CONF_SENSOR_FILTER),
+                "sensor_filter_window": config.get(CONF_SENSOR_FILTER_WINDOW),
+                "sensor_filter_alpha": config.get(CONF_SENSOR_FILTER_ALPHA),
+                "sensor_min_interval": config.get(CONF_SENSOR_MIN_INTERVAL),
             }
         )
-        async_add_entities([EnslavedThermostat(**kwargs)])
+        async_add_entities(
+            [EnslavedThermostat.with_unrecorded_attributes(unrecorded_attributes)(**kwargs)]
+        )
     elif dev_type == EnslavedType.MASTER:
         kwargs.update(
             {
                 "enslaved_thermostats": config.get(CONF_ENSLAVED_THERMOSTATS),
+                "member_call_timeout": config.get(CONF_MEMBER_CALL_TIMEOUT),
+                "member_failure_threshold": config.get(CONF_MEMBER_FAILURE_THRESHOLD),
+                "member_cool_down": config.get(CONF_MEMBER_COOL_DOWN),
             }
         )
-        async_add_entities([MasterThermostat(**kwargs)])
+        async_add_entities(
+            [MasterThermostat.with_unrecorded_attributes(unrecorded_attributes)(**kwargs)]
+        )
     elif dev_type == EnslavedType.SCHEDULABLE:
         kwargs.update(
             {
                 "enslaved_thermostats": config.get(CONF_ENSLAVED_THERMOSTATS),
+                "member_call_timeout": config.get(CONF_MEMBER_CALL_TIMEOUT),
+                "member_failure_threshold": config.get(CONF_MEMBER_FAILURE_THRESHOLD),
+                "member_cool_down": config.get(CONF_MEMBER_COOL_DOWN),
+                "max_preheat": config.get(CONF_MAX_PREHEAT),
             }
         )
-        async_add_entities([SchedulableThermostat(**kwargs)])
-
-    log.debug("Register enslaved thermostats services")
-    platform = async_get_current_platform()
-
-    await async_register_services(platform)
+        async_add_entities(
+            [SchedulableThermostat.with_unrecorded_attributes(unrecorded_attributes)(**kwargs)]
+        )
 
 
 async def async_register_services(platform) -> None:
@@ -141,6 +223,7 @@ async def async_register_services(platform) -> None:
             vol.Optional("hvac_mode"): vol.Coerce(HVACMode),
         },
         "async_set_enslaved_mode",
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     platform.async_register_entity_service(
@@ -149,6 +232,7 @@ async def async_register_services(platform) -> None:
             vol.Required("temperature"): vol.Coerce(float),
         },
         "async_set_enslaved_target_temp",
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     platform.async_register_entity_service(
@@ -157,6 +241,7 @@ async def async_register_services(platform) -> None:
             vol.Required("mode"): vol.Coerce(HVACMode),
         },
         "async_set_enslaved_hvac_mode",
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     platform.async_register_entity_service(
@@ -166,12 +251,35 @@ async def async_register_services(platform) -> None:
             vol.Optional("hvac_mode"): vol.Coerce(HVACMode),
         },
         "async_start_scheduler_mode",
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     platform.async_register_entity_service(
         SERVICE_STOP_SCHEDULER_MODE,
         {},
         "async_stop_scheduler_mode",
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    platform.async_register_entity_service(
+        SERVICE_UPDATE_SCHEDULER_TARGET,
+        {
+            vol.Optional("temperature"): vol.Coerce(float),
+            vol.Optional("hvac_mode"): vol.Coerce(HVACMode),
+        },
+        "async_update_scheduler_target",
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    platform.async_register_entity_service(
+        SERVICE_SCHEDULE_SCHEDULER_MODE,
+        {
+            vol.Required("start_at"): cv.datetime,
+            vol.Required("temperature"): vol.Coerce(float),
+            vol.Optional("hvac_mode"): vol.Coerce(HVACMode),
+        },
+        "async_schedule_scheduler_mode",
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     platform.async_register_entity_service(
@@ -188,3 +296,32 @@ async def async_register_services(platform) -> None:
         {},
         "async_restore_manual_state",
     )
+
+    platform.async_register_entity_service(
+        SERVICE_RESTORE_ENSLAVED_STATE,
+        {
+            vol.Optional("enslaved_mode"): vol.Any(None, vol.Coerce(EnslavedMode)),
+            vol.Optional("enslaved_target_temp"): vol.Any(None, vol.Coerce(float)),
+            vol.Optional("enslaved_hvac_mode"): vol.Any(None, vol.Coerce(HVACMode)),
+            vol.Optional("manual_target_temp"): vol.Any(None, vol.Coerce(float)),
+            vol.Optional("manual_hvac_mode"): vol.Any(None, vol.Coerce(HVACMode)),
+            vol.Optional("temperature"): vol.Any(None, vol.Coerce(float)),
+            vol.Optional("hvac_mode"): vol.Any(None, vol.Coerce(HVACMode)),
+            vol.Optional("scheduler_previous_target_temp"): vol.Any(None, vol.Coerce(float)),
+            vol.Optional("scheduler_previous_hvac_mode"): vol.Any(None, vol.Coerce(HVACMode)),
+        },
+        "async_restore_enslaved_state",
+    )
+
+    platform.async_register_entity_service(
+        SERVICE_SNAPSHOT_GROUP,
+        {},
+        "async_snapshot_group",
+    )
+
+    platform.async_register_entity_service(
+        SERVICE_RESTORE_GROUP,
+        {},
+        "async_restore_group",
+        supports_response=SupportsResponse.OPTIONAL,
+    )
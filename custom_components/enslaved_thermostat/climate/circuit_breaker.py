@@ -0,0 +1,44 @@
+"""Circuit breaker of calls to the members of master and schedulable thermostats"""
+import time
+
+from ..const import CircuitState
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of calls to a member thermostat: after failure_threshold consecutive failures
+    (or timeouts), the circuit is open and calls are skipped during cool_down seconds. After that,
+    only one probe call is allowed (half-open): the circuit is closed again if it succeeds and open
+    again if it fails.
+    """
+
+    def __init__(self, failure_threshold: int, cool_down: float):
+        """Initialize the circuit breaker."""
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._opened_at = None
+
+    def allow_request(self) -> bool:
+        """Check if a call is allowed (and switch to half-open at the end of the cool down)"""
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.cool_down:
+            self.state = CircuitState.HALF_OPEN
+            return True
+        # Open, or half-open with the probe call in progress
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call (the member responded)"""
+        self.failures = 0
+        self.state = CircuitState.CLOSED
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed call (the member did not respond)"""
+        self.failures += 1
+        if self.state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
@@ -0,0 +1,130 @@
+"""Serialized command queue of enslaved thermostat"""
+import asyncio
+import functools
+import inspect
+from contextvars import ContextVar
+
+from homeassistant.exceptions import HomeAssistantError
+
+# Command queue running the current command (to run nested commands of the same entity directly)
+_running_queue: ContextVar["CommandQueue | None"] = ContextVar(
+    "enslaved_thermostat_running_command_queue", default=None
+)
+
+
+def queued_command(func):
+    """
+    Decorator to run an entity method through the entity command queue (self._command_queue),
+    using the method name and the names of its specified arguments (not None) as command kind.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        return await self._command_queue.async_run(
+            (func.__name__, _command_fields(signature, self, args, kwargs)),
+            functools.partial(func, self, *args, **kwargs),
+        )
+
+    return wrapper
+
+
+def _command_fields(signature, self, args, kwargs) -> frozenset:
+    """Return the names of the arguments (not None) of a command"""
+    fields = set()
+    for name, value in signature.bind(self, *args, **kwargs).arguments.items():
+        if name == "self":
+            continue
+        if signature.parameters[name].kind is inspect.Parameter.VAR_KEYWORD:
+            fields.update(key for key, val in value.items() if val is not None)
+        elif value is not None:
+            fields.add(name)
+    return frozenset(fields)
+
+
+class QueuedCommand:
+    """Command waiting (or running) in a command queue"""
+
+    __slots__ = ("kind", "factory", "future", "callers", "task", "running")
+
+    def __init__(self, kind, factory, future):
+        """Initialize the command."""
+        self.kind = kind
+        self.factory = factory
+        self.future = future
+        # Number of callers waiting for the result of the command
+        self.callers = 1
+        self.task = None
+        self.running = False
+
+
+class CommandQueue:
+    """
+    Per-entity serialized command queue: commands are run one at a time, in their arrival order.
+    A command queued right after a waiting command of the same kind (same method, called with the
+    same specified arguments) replaces it (latest wins): the callers of both commands get the
+    result of the latest one.
+
+    Commands are run in a task of the queue: a cancelled caller does not cancel the command for
+    the other callers, and a command is only dropped if all its callers are cancelled before it
+    starts running.
+
+    Commands called from a running command of the same queue are run directly (no deadlock).
+    """
+
+    def __init__(self):
+        """Initialize the command queue."""
+        self._lock = asyncio.Lock()
+        # Last queued command still waiting to run
+        self._last_waiting = None
+
+    async def async_run(self, kind, factory):
+        """Run a command (a coroutine factory) through the queue and return its result"""
+        if _running_queue.get() is self:
+            return await factory()
+
+        command = self._last_waiting
+        if command is not None and command.kind == kind:
+            # Coalesce with the waiting command of the same kind: only the latest one will run
+            command.factory = factory
+            command.callers += 1
+        else:
+            command = self._last_waiting = QueuedCommand(
+                kind, factory, asyncio.get_running_loop().create_future()
+            )
+            command.task = asyncio.create_task(self._async_process(command))
+
+        try:
+            return await asyncio.shield(command.future)
+        except asyncio.CancelledError:
+            command.callers -= 1
+            if not command.callers and not command.running:
+                # All callers cancelled before the command ran: drop it
+                if self._last_waiting is command:
+                    self._last_waiting = None
+                command.task.cancel()
+            raise
+
+    async def _async_process(self, command: QueuedCommand) -> None:
+        """Wait for the previous commands and run a command, setting its result in its future"""
+        future = command.future
+        try:
+            async with self._lock:
+                if self._last_waiting is command:
+                    self._last_waiting = None
+                command.running = True
+                token = _running_queue.set(self)
+                try:
+                    future.set_result(await command.factory())
+                finally:
+                    _running_queue.reset(token)
+        except asyncio.CancelledError:
+            if not future.done():
+                future.set_exception(HomeAssistantError("Command cancelled"))
+                # Mark the exception as retrieved (all callers may be cancelled)
+                future.exception()
+            raise
+        except Exception as err:  # pylint: disable=broad-except
+            future.set_exception(err)
+            # Mark the exception as retrieved (all callers may be cancelled)
+            future.exception()
@@ -1,8 +1,13 @@
 """Common suff for Enslaved Thermostat device"""
+import asyncio
+import functools
 import logging
-from dataclasses import asdict, dataclass
+import time
+from dataclasses import dataclass
 from typing import Any
 
+import voluptuous as vol
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
 from homeassistant.components.climate.const import (
     ATTR_CURRENT_TEMPERATURE,
     ATTR_HVAC_MODE,
@@ -13,32 +18,82 @@ from homeassistant.components.climate.const import (
 )
 from homeassistant.components.generic_thermostat.climate import GenericThermostat
 from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import EventStateChangedData, async_track_state_change_event
 from homeassistant.helpers.restore_state import ExtraStoredData
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import EventType
 
+try:
+    from homeassistant.exceptions import ServiceValidationError
+except ImportError:
+
+    class ServiceValidationError(HomeAssistantError):
+        """Service call validation error (distinct from the other Home Assistant errors)"""
+
+
 from .. import DOMAIN
 from ..const import (
+    ATTR_GROUP_SNAPSHOT,
     ATTR_MANUAL_HAVC_MODE,
     ATTR_MANUAL_TARGET_TEMP,
+    ATTR_MEMBER_CIRCUITS,
+    ATTR_STORED_DATA_VERSION,
+    DEFAULT_MEMBER_CALL_TIMEOUT,
+    DEFAULT_MEMBER_COOL_DOWN,
+    DEFAULT_MEMBER_FAILURE_THRESHOLD,
+    DEFAULT_UNRECORDED_ATTRIBUTES,
+    ENSLAVED_STATE_SNAPSHOT_ATTRS,
+    SERVICE_RESTORE_ENSLAVED_STATE,
+    SERVICE_RESTORE_MANUAL_STATE,
+    SERVICE_SET_ENSLAVED_HVAC_MODE,
     SERVICE_SET_ENSLAVED_MODE,
+    SERVICE_SET_ENSLAVED_TARGET_TEMP,
+    SERVICE_SET_MANUAL_STATE,
     SERVICE_START_SCHEDULER_MODE,
     SERVICE_STOP_SCHEDULER_MODE,
+    SERVICE_UPDATE_SCHEDULER_TARGET,
+    STORED_DATA_VERSION,
     EnslavedMode,
 )
+from ..helpers import async_get_entity
+from ..metrics import async_get_metrics
+from ..profiler import async_get_startup_profile, profiled
+from ..trace import async_get_decision_trace, get_event_context
+from .circuit_breaker import CircuitBreaker
 
 log = logging.getLogger(__name__)
 
+# Entity methods directly called (instead of the corresponding service) on enslaved thermostats
+# handled by this integration
+DIRECT_DISPATCH_METHODS = {
+    (DOMAIN, SERVICE_SET_ENSLAVED_MODE): "async_set_enslaved_mode",
+    (DOMAIN, SERVICE_SET_ENSLAVED_TARGET_TEMP): "async_set_enslaved_target_temp",
+    (DOMAIN, SERVICE_SET_ENSLAVED_HVAC_MODE): "async_set_enslaved_hvac_mode",
+    (DOMAIN, SERVICE_START_SCHEDULER_MODE): "async_start_scheduler_mode",
+    (DOMAIN, SERVICE_STOP_SCHEDULER_MODE): "async_stop_scheduler_mode",
+    (DOMAIN, SERVICE_UPDATE_SCHEDULER_TARGET): "async_update_scheduler_target",
+    (DOMAIN, SERVICE_SET_MANUAL_STATE): "async_set_manual_state",
+    (DOMAIN, SERVICE_RESTORE_MANUAL_STATE): "async_restore_manual_state",
+    (DOMAIN, SERVICE_RESTORE_ENSLAVED_STATE): "async_restore_enslaved_state",
+}
+
 
 class EnslavedGenericThermostat(GenericThermostat):
     """Common class for Enslaved Thermostat device"""
 
     _default_name = None
 
+    # Custom state attributes excluded from the recorder (see with_unrecorded_attributes())
+    _unrecorded_attributes = frozenset(DEFAULT_UNRECORDED_ATTRIBUTES)
+
     manual_target_temp = None
     manual_hvac_mode = None
 
+    # Performance counters of the entity (see metrics.py, available once added to the platform)
+    _metrics = None
+
     def __init__(self, **kwargs):
         """Initialize the thermostat."""
         kwargs["name"] = kwargs.get("name", self._default_name)
@@ -65,6 +120,40 @@ class EnslavedGenericThermostat(GenericThermostat):
         self.manual_target_temp = kwargs.get("initial_manual_target_temp")
         self.manual_hvac_mode = kwargs.get("initial_manual_hvac_mode")
 
+    async def add_to_platform_finish(self) -> None:
+        """Finish adding the entity to its platform (measured in the startup profile)."""
+        with async_get_startup_profile(self.hass).measure("add_entity", self.entity_id):
+            await super().add_to_platform_finish()
+
+    @callback
+    def _async_register_metrics(self) -> None:
+        """Register the entity in the metrics registry (on addition to Home Assistant)."""
+        registry = async_get_metrics(self.hass)
+        self._metrics = registry.async_add_entity(self)
+        self.async_on_remove(functools.partial(registry.async_remove_entity, self.entity_id))
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine (counted in the metrics)."""
+        if self._metrics is not None:
+            self._metrics.state_writes += 1
+        super().async_write_ha_state()
+
+    @property
+    def _tracing(self) -> bool:
+        """Check if the decision trace is enabled (to skip building costly trace data if not)"""
+        return async_get_decision_trace(self.hass).enabled
+
+    @callback
+    def _trace(self, event: str, **data) -> None:
+        """
+        Record a decision in the decision trace (if enabled, see trace.py), with the context of the
+        event being handled (if any) or the last context set on the entity.
+        """
+        trace = async_get_decision_trace(self.hass)
+        if trace.enabled:
+            trace.async_record(event, self.entity_id, get_event_context() or self._context, **data)
+
     #
     # Implement methods to allow saving and restore custom state attributes
     #
@@ -79,6 +168,7 @@ class EnslavedGenericThermostat(GenericThermostat):
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added."""
+        self._async_register_metrics()
         # Retrieve and restore enslaved mode info from last known state
         await self.async_restore_last_extra_data()
         await super().async_added_to_hass()
@@ -100,7 +190,16 @@ class EnslavedGenericThermostat(GenericThermostat):
     # Append custom state attributes in the entity's state attributes
     #
 
+    @classmethod
+    def with_unrecorded_attributes(cls, attributes) -> type:
+        """
+        Return the variant of the class excluding the specified custom state attributes from the
+        recorder (the recorder only considers the unrecorded attributes defined at class level).
+        """
+        return _get_unrecorded_attributes_class(cls, frozenset(attributes))
+
     @property
+    @profiled("state_attributes")
     def state_attributes(self) -> dict[str, Any]:
         """Return the optional state attributes."""
         log.debug("Compute state attributes")
@@ -141,6 +240,39 @@ class EnslavedGenericThermostat(GenericThermostat):
         if self.manual_hvac_mode is not None:
             await self.async_set_hvac_mode(self.manual_hvac_mode)
 
+    #
+    # Custom integration services only supported by some types of thermostat: the services are
+    # registered for all entities of the platform, so raise a validation error on other ones.
+    #
+
+    async def async_schedule_scheduler_mode(self, start_at, temperature, hvac_mode=None):
+        """Schedule the start of the scheduler mode (only supported by schedulable thermostat)"""
+        raise ServiceValidationError(
+            "This service is only supported by schedulable thermostats, "
+            f"{self.entity_id} is not one of them."
+        )
+
+    async def async_snapshot_group(self):
+        """Snapshot the state of enslaved thermostats (only supported by master thermostats)"""
+        raise ServiceValidationError(
+            "This service is only supported by master and schedulable thermostats, "
+            f"{self.entity_id} is not one of them."
+        )
+
+    async def async_restore_group(self):
+        """Restore the state of enslaved thermostats (only supported by master thermostats)"""
+        raise ServiceValidationError(
+            "This service is only supported by master and schedulable thermostats, "
+            f"{self.entity_id} is not one of them."
+        )
+
+    async def async_restore_enslaved_state(self, **kwargs):
+        """Restore the enslaved state (only supported by enslaved thermostats)"""
+        raise ServiceValidationError(
+            "This service is only supported by enslaved thermostats, "
+            f"{self.entity_id} is not one of them."
+        )
+
 
 class FakeEnslavedGenericThermostat(EnslavedGenericThermostat):
     """
@@ -151,29 +283,72 @@ class FakeEnslavedGenericThermostat(EnslavedGenericThermostat):
 
     _default_name = "Fake Thermostat"
 
-    _enslaved_devices = []
-    _enslaved_devices_temp = {}
-
     _target_temp = None
     _hvac_mode = None
 
+    _group_snapshot = None
+
     def __init__(self, **kwargs):
         """Initialize the thermostat."""
         super().__init__(**kwargs)
 
+        self._enslaved_devices_temp = {}
+        self._enslaved_entities = {}
+
         self._enslaved_thermostats = kwargs["enslaved_thermostats"]
         log.debug(
             "%s %s managed thermostats: %s",
             self.__class__.__name__,
             kwargs["name"],
-            ", ".join(self._enslaved_thermostats),
+            self._enslaved_thermostats,
         )
         assert self._enslaved_thermostats, "No enslaved thermostat configured"
 
+        self._member_call_timeout = (
+            kwargs.get("member_call_timeout") or DEFAULT_MEMBER_CALL_TIMEOUT
+        ).total_seconds()
+        member_cool_down = kwargs.get("member_cool_down") or DEFAULT_MEMBER_COOL_DOWN
+        self._circuit_breakers = {
+            entity_id: CircuitBreaker(
+                kwargs.get("member_failure_threshold") or DEFAULT_MEMBER_FAILURE_THRESHOLD,
+                member_cool_down.total_seconds(),
+            )
+            for entity_id in self._enslaved_thermostats
+        }
+
+    @property
+    def enslaved_thermostats(self):
+        """Return the entity IDs of the enslaved thermostats."""
+        return self._enslaved_thermostats
+
+    @property
+    @profiled("state_attributes")
+    def state_attributes(self) -> dict[str, Any]:
+        """Return the optional state attributes."""
+        data = super().state_attributes
+        data[ATTR_MEMBER_CIRCUITS] = {
+            entity_id: breaker.state for entity_id, breaker in self._circuit_breakers.items()
+        }
+        return data
+
     #
     # Implement methods to allow saving and restore custom state attributes
     #
 
+    @property
+    def extra_restore_state_data(self) -> ExtraStoredData | None:
+        """Return entity extra state data to be restored."""
+        return FakeEnslavedGenericThermostatExtraStoredData(
+            manual_target_temp=self.manual_target_temp,
+            manual_hvac_mode=self.manual_hvac_mode,
+            group_snapshot=self._group_snapshot,
+        )
+
+    def _restore_last_extra_data(self, last_extra_data):
+        """Restore last extra data"""
+        super()._restore_last_extra_data(last_extra_data)
+        self._group_snapshot = last_extra_data.get(ATTR_GROUP_SNAPSHOT)
+
     async def async_added_to_hass(self) -> None:
         """
         Run when entity about to be added.
@@ -181,6 +356,7 @@ class FakeEnslavedGenericThermostat(EnslavedGenericThermostat):
         Note: We can't call parent method because it register trigger on sensor/header entities, so
         do here all other things done and in particular, restore previous state or set initial state
         """
+        self._async_register_metrics()
 
         # Retrieve and restore enslaved mode info from last known state
         await self.async_restore_last_extra_data()
@@ -222,10 +398,29 @@ class FakeEnslavedGenericThermostat(EnslavedGenericThermostat):
         if not self._hvac_mode:
             self._hvac_mode = HVACMode.OFF
 
-        # Also add listener on enslaved thermostats to conpute master thermostat temperature
+        # Seed current temperature from the current state of enslaved thermostats
+        self._async_seed_enslaved_devices_temp()
+
+        # At Home Assistant startup, defer the wiring of the listener on enslaved thermostats state
+        # changes until Home Assistant is started to speed up startup and avoid a cascade of state
+        # writes while they are restored.
+        if self.hass.state == CoreState.running:
+            self._async_track_enslaved_thermostats()
+        else:
+            self.async_on_remove(async_at_started(self.hass, self._async_hass_started))
+
+    @callback
+    def _async_hass_started(self, _hass: HomeAssistant) -> None:
+        """Handle Home Assistant started: compute current temperature from enslaved thermostats."""
+        self._async_track_enslaved_thermostats()
+        self._async_seed_enslaved_devices_temp()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_track_enslaved_thermostats(self) -> None:
+        """Add listener on enslaved thermostats to compute master thermostat temperature"""
         log.debug(
-            "Add listener on enslaved thermostats state changed (%s)",
-            ", ".join(self._enslaved_thermostats),
+            "Add listener on enslaved thermostats state changed (%s)", self._enslaved_thermostats
         )
         self.async_on_remove(
             async_track_state_change_event(
@@ -239,27 +434,48 @@ class FakeEnslavedGenericThermostat(EnslavedGenericThermostat):
     # used to compute the master thermostat.
     #
 
+    @profiled("event_handling")
     async def _async_enslaved_thermostat_changed(
         self, event: EventType[EventStateChangedData]
     ) -> None:
         """Handle enslaved thermostat changes."""
-        if "new_state" not in event.data:
+        if self._metrics is not None:
+            self._metrics.events_received += 1
+        if not self._update_enslaved_device_temp(
+            event.data["entity_id"], event.data.get("new_state")
+        ):
+            # The current temperature of the enslaved thermostats is unchanged: nothing to update
+            if self._metrics is not None:
+                self._metrics.events_skipped += 1
             return
-        entity_id = event.data["new_state"].entity_id
-        is_handled = self._enslaved_thermostat_is_handled(event.data["new_state"])
-        new_temp = event.data["new_state"].attributes.get(ATTR_CURRENT_TEMPERATURE)
-        log.debug(
-            "Enslaved thermostat %s state changed: temperature = %s, is handled = %s\n%s",
-            entity_id,
-            new_temp,
-            is_handled,
-            event,
-        )
+        self.async_write_ha_state()
+
+    @callback
+    def _async_seed_enslaved_devices_temp(self) -> None:
+        """Compute current temperature of enslaved thermostats from their current state."""
+        for entity_id in self._enslaved_thermostats:
+            self._update_enslaved_device_temp(entity_id, self.hass.states.get(entity_id))
+
+    def _update_enslaved_device_temp(self, entity_id, state):
+        """
+        Update the known current temperature of an enslaved thermostat from its state and return
+        True if it changed.
+        """
+        is_handled = state is not None and self._enslaved_thermostat_is_handled(state)
+        new_temp = state.attributes.get(ATTR_CURRENT_TEMPERATURE) if state is not None else None
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Enslaved thermostat %s state: temperature = %s, is handled = %s",
+                entity_id,
+                new_temp,
+                is_handled,
+            )
+        previous_temp = self._enslaved_devices_temp.get(entity_id)
         if is_handled and new_temp is not None:
             self._enslaved_devices_temp[entity_id] = new_temp
         elif entity_id in self._enslaved_devices_temp:
             del self._enslaved_devices_temp[entity_id]
-        self.async_write_ha_state()
+        return self._enslaved_devices_temp.get(entity_id) != previous_temp
 
     @staticmethod
     def _enslaved_thermostat_is_handled(state):
@@ -279,10 +495,11 @@ class FakeEnslavedGenericThermostat(EnslavedGenericThermostat):
                 "can't compute master current temperature"
             )
             return None
-        log.debug(
-            "Compute current temperature from enslaved one (%s)",
-            ", ".join([f"{cid}={temp}" for cid, temp in self._enslaved_devices_temp.items()]),
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Compute current temperature from enslaved one (%s)",
+                ", ".join([f"{cid}={temp}" for cid, temp in self._enslaved_devices_temp.items()]),
+            )
         return sum(self._enslaved_devices_temp.values()) / len(self._enslaved_devices_temp)
 
     #
@@ -309,40 +526,59 @@ class FakeEnslavedGenericThermostat(EnslavedGenericThermostat):
 
     async def async_set_enslaved_mode(self, **kwargs):
         """Set current enslaved mode."""
-        log.debug("async_set_enslaved_mode(%s)", ", ".join([f"{k}={v}" for k, v in kwargs.items()]))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "async_set_enslaved_mode(%s)", ", ".join([f"{k}={v}" for k, v in kwargs.items()])
+            )
+        results = []
         if kwargs.get("mode"):
-            await self._async_call_enslaved_thermostats_service(
-                SERVICE_SET_ENSLAVED_MODE, {"mode": kwargs["mode"]}
+            results.append(
+                await self._async_call_enslaved_thermostats_service(
+                    SERVICE_SET_ENSLAVED_MODE, {"mode": kwargs["mode"]}
+                )
             )
             if kwargs["mode"] == EnslavedMode.MANUAL:
                 # If specified enslaved mode is manual, set enslaved thermostats temperature and
                 # hvac_mode using specified parameters or current manual state
                 if kwargs.get(ATTR_TEMPERATURE, self.manual_target_temp):
-                    await self._async_call_enslaved_thermostats_service(
-                        SERVICE_SET_TEMPERATURE,
-                        {ATTR_TEMPERATURE: kwargs.get(ATTR_TEMPERATURE, self.manual_target_temp)},
+                    results.append(
+                        await self._async_call_enslaved_thermostats_service(
+                            SERVICE_SET_TEMPERATURE,
+                            {
+                                ATTR_TEMPERATURE: kwargs.get(
+                                    ATTR_TEMPERATURE, self.manual_target_temp
+                                )
+                            },
+                            domain=CLIMATE_DOMAIN,
+                        )
                     )
                 if kwargs.get(ATTR_HVAC_MODE, self.manual_hvac_mode):
-                    await self._async_call_enslaved_thermostats_service(
-                        SERVICE_SET_HVAC_MODE,
-                        {ATTR_HVAC_MODE: kwargs.get(ATTR_HVAC_MODE, self.manual_hvac_mode)},
+                    results.append(
+                        await self._async_call_enslaved_thermostats_service(
+                            SERVICE_SET_HVAC_MODE,
+                            {ATTR_HVAC_MODE: kwargs.get(ATTR_HVAC_MODE, self.manual_hvac_mode)},
+                            domain=CLIMATE_DOMAIN,
+                        )
                     )
-                return
+                return self._merge_fan_out_results(*results)
 
         if ATTR_TEMPERATURE in kwargs:
-            await self.async_set_temperature(**{ATTR_TEMPERATURE: kwargs[ATTR_TEMPERATURE]})
+            results.append(
+                await self.async_set_temperature(**{ATTR_TEMPERATURE: kwargs[ATTR_TEMPERATURE]})
+            )
         if ATTR_HVAC_MODE in kwargs:
-            await self.async_set_hvac_mode(kwargs[ATTR_HVAC_MODE])
+            results.append(await self.async_set_hvac_mode(kwargs[ATTR_HVAC_MODE]))
+        return self._merge_fan_out_results(*results)
 
     async def async_set_enslaved_target_temp(self, temperature):
         """Set current enslaved target temperature."""
         log.debug("async_set_enslaved_target_temp(%s)", temperature)
-        await self.async_set_temperature(ATTR_TEMPERATURE=temperature)
+        return await self.async_set_temperature(**{ATTR_TEMPERATURE: temperature})
 
     async def async_set_enslaved_hvac_mode(self, mode):
         """Set current enslaved HVAC mode."""
         log.debug("async_set_enslaved_hvac_mode(%s)", mode)
-        await self.async_set_hvac_mode(mode)
+        return await self.async_set_hvac_mode(mode)
 
     #
     # Implement methods to control scheduler mode on enslaved thermostats
@@ -350,7 +586,7 @@ class FakeEnslavedGenericThermostat(EnslavedGenericThermostat):
 
     async def async_start_scheduler_mode(self, temperature=None, hvac_mode=None):
         """Start scheduler mode on enslaved thermostats"""
-        await self._async_call_enslaved_thermostats_service(
+        return await self._async_call_enslaved_thermostats_service(
             SERVICE_START_SCHEDULER_MODE,
             {
                 "temperature": temperature if temperature is not None else self.target_temperature,
@@ -360,30 +596,294 @@ class FakeEnslavedGenericThermostat(EnslavedGenericThermostat):
 
     async def async_stop_scheduler_mode(self):
         """Stop scheduler mode on enslaved thermostats"""
-        await self._async_call_enslaved_thermostats_service(SERVICE_STOP_SCHEDULER_MODE)
+        return await self._async_call_enslaved_thermostats_service(SERVICE_STOP_SCHEDULER_MODE)
+
+    async def async_update_scheduler_target(self, temperature=None, hvac_mode=None):
+        """Update the scheduler target of enslaved thermostats (already in scheduler mode)"""
+        service_data = {}
+        if temperature is not None:
+            service_data["temperature"] = temperature
+        if hvac_mode is not None:
+            service_data["hvac_mode"] = hvac_mode
+        return await self._async_call_enslaved_thermostats_service(
+            SERVICE_UPDATE_SCHEDULER_TARGET, service_data
+        )
 
     #
-    # Helpers methods
+    # Implement methods to snapshot and restore the state of enslaved thermostats
+    #
+    # Note: these methods are callable through custom integration services registered in
+    # async_setup_platform() and described in services.yaml file.
     #
 
-    async def _async_call_enslaved_thermostats_service(self, service_name, service_data=None):
-        """Set call service on enslaved thermostats."""
-        service_data = service_data if service_data else {}
+    async def async_snapshot_group(self):
+        """Snapshot the full enslaved state of all enslaved thermostats"""
+        log.debug("async_snapshot_group()")
+        group_snapshot = {}
         for entity_id in self._enslaved_thermostats:
-            try:
-                service_data.update(entity_id=entity_id)
-                await self.hass.services.async_call(
-                    DOMAIN,
-                    service_name,
-                    service_data,
+            state = self.hass.states.get(entity_id)
+            if state is None:
+                log.warning("Enslaved thermostat %s not found, skip it in snapshot", entity_id)
+                continue
+            group_snapshot[entity_id] = {
+                attr: state.attributes.get(attr) for attr in ENSLAVED_STATE_SNAPSHOT_ATTRS
+            }
+            group_snapshot[entity_id].update(
+                {
+                    ATTR_TEMPERATURE: state.attributes.get(ATTR_TEMPERATURE),
+                    ATTR_HVAC_MODE: state.state,
+                }
+            )
+        self._group_snapshot = group_snapshot
+
+        # Ensure to update state (and so the stored snapshot) after taking the snapshot
+        self.async_write_ha_state()
+
+    async def async_restore_group(self):
+        """Restore the full enslaved state of all enslaved thermostats from the last snapshot"""
+        log.debug("async_restore_group()")
+        if not self._group_snapshot:
+            raise ServiceValidationError("No snapshot of the enslaved thermostats to restore.")
+        return await self._async_fan_out(
+            SERVICE_RESTORE_ENSLAVED_STATE,
+            {entity_id: dict(state) for entity_id, state in self._group_snapshot.items()},
+        )
+
+    #
+    # Helpers methods
+    #
+
+    async def _async_call_enslaved_thermostats_service(
+        self, service_name, service_data=None, domain=DOMAIN, entity_ids=None
+    ):
+        """
+        Call service concurrently on enslaved thermostats (or only the specified ones) and return
+        the result of the call on each of them (see _async_fan_out()).
+        """
+        return await self._async_fan_out(
+            service_name,
+            {
+                entity_id: dict(service_data) if service_data else {}
+                for entity_id in (
+                    entity_ids if entity_ids is not None else self._enslaved_thermostats
                 )
-            except HomeAssistantError:
-                log.exception(
-                    "Fail to call %s service on enslaved thermostat %s %s",
-                    service_name,
-                    entity_id,
-                    f"with following data: {service_data}" if service_data else "without data",
+            },
+            domain=domain,
+        )
+
+    @profiled("fan_out")
+    async def _async_fan_out(self, service_name, members_data, domain=DOMAIN):
+        """
+        Call service concurrently on enslaved thermostats with their specific service data and
+        return the result of the call on each of them and the total elapsed time (in seconds):
+        {
+            "members": {
+                "climate.kitchen": {"success": True, "error": None, "elapsed": 0.012},
+                [...]
+            },
+            "elapsed": 0.015,
+        }
+        """
+        if tracing := self._tracing:
+            self._trace("broadcast", service=f"{domain}.{service_name}", members=list(members_data))
+        start = time.monotonic()
+        circuits = {
+            entity_id: breaker.state for entity_id, breaker in self._circuit_breakers.items()
+        }
+        results = await asyncio.gather(
+            *[
+                self._async_call_enslaved_thermostat_service(
+                    entity_id, service_name, service_data, domain=domain
                 )
+                for entity_id, service_data in members_data.items()
+            ]
+        )
+        if any(
+            breaker.state != circuits[entity_id]
+            for entity_id, breaker in self._circuit_breakers.items()
+        ):
+            # Ensure to update state (and so the exposed circuits state) after a circuit change
+            self.async_write_ha_state()
+        elapsed = time.monotonic() - start
+        if tracing:
+            for entity_id, result in zip(members_data, results):
+                self._trace("member_result", member=entity_id, service=service_name, **result)
+        if self._metrics is not None:
+            self._metrics.fan_out_latency.record(elapsed)
+            self._metrics.failed_calls += sum(1 for result in results if not result["success"])
+        return {
+            "members": dict(zip(members_data, results)),
+            "elapsed": round(elapsed, 3),
+        }
+
+    async def _async_call_enslaved_thermostat_service(
+        self, entity_id, service_name, service_data, domain=DOMAIN
+    ):
+        """Call service on one enslaved thermostat and return the result of the call."""
+        start = time.monotonic()
+        error = None
+        breaker = self._circuit_breakers.get(entity_id)
+        if breaker is not None and not breaker.allow_request():
+            log.debug(
+                "Circuit of enslaved thermostat %s is %s, skip %s service call",
+                entity_id,
+                breaker.state,
+                service_name,
+            )
+            return {
+                "success": False,
+                "error": f"Enslaved thermostat circuit is {breaker.state}, call skipped",
+                "elapsed": 0.0,
+            }
+        method = DIRECT_DISPATCH_METHODS.get((domain, service_name))
+        if method and (entity := self._async_get_enslaved_entity(entity_id)) is not None:
+            # Our own entity: call its method directly, without going through the service bus
+            if self._context:
+                entity.async_set_context(self._context)
+            call = getattr(entity, method)(**service_data)
+        else:
+            service_data.update(entity_id=entity_id)
+            call = self.hass.services.async_call(
+                domain,
+                service_name,
+                service_data,
+                blocking=True,
+                context=self._context,
+            )
+        task = self.hass.async_create_task(call)
+        try:
+            # Note: shield the call so that a timeout does not cancel the enslaved thermostat in
+            # the middle of its transition (the call goes on, only its result is not waited)
+            async with asyncio.timeout(self._member_call_timeout):
+                await asyncio.shield(task)
+            if breaker is not None:
+                breaker.record_success()
+        except asyncio.CancelledError:
+            # Note: the caller is cancelled but the call goes on, settle the circuit (and so a
+            # possible half-open probe) with its outcome
+            if breaker is not None:
+                task.add_done_callback(functools.partial(self._settle_member_call, breaker))
+            raise
+        except TimeoutError:
+            error = f"Timeout after {self._member_call_timeout}s"
+            log.error(
+                "Timeout calling %s service on enslaved thermostat %s", service_name, entity_id
+            )
+            if breaker is not None:
+                breaker.record_failure()
+            task.add_done_callback(
+                functools.partial(self._member_call_done_late, entity_id, service_name)
+            )
+        except (HomeAssistantError, ValueError, vol.Invalid) as err:
+            # Note: a validation error means the enslaved thermostat responded
+            if breaker is not None:
+                if self._is_member_call_failure(err):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            error = str(err) or err.__class__.__name__
+            log.exception(
+                "Fail to call %s service on enslaved thermostat %s %s",
+                service_name,
+                entity_id,
+                f"with following data: {service_data}" if service_data else "without data",
+            )
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        return {
+            "success": error is None,
+            "error": error,
+            "elapsed": round(time.monotonic() - start, 3),
+        }
+
+    @staticmethod
+    def _is_member_call_failure(err):
+        """
+        Check if an error of a service call on an enslaved thermostat means it did not respond
+        (a validation error means the enslaved thermostat responded)
+        """
+        return not isinstance(err, (ServiceValidationError, ValueError, vol.Invalid))
+
+    @classmethod
+    def _settle_member_call(cls, breaker, task):
+        """Record the outcome of a service call on an enslaved thermostat once finished"""
+        if task.cancelled() or (
+            (err := task.exception()) is not None and cls._is_member_call_failure(err)
+        ):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    @staticmethod
+    def _member_call_done_late(entity_id, service_name, task):
+        """Log the result of a service call on an enslaved thermostat finished after its timeout"""
+        if task.cancelled():
+            return
+        if (err := task.exception()) is not None:
+            log.error(
+                "Service %s on enslaved thermostat %s failed after its timeout: %s",
+                service_name,
+                entity_id,
+                str(err) or err.__class__.__name__,
+            )
+        else:
+            log.debug(
+                "Service %s on enslaved thermostat %s finished after its timeout",
+                service_name,
+                entity_id,
+            )
+
+    @callback
+    def _async_get_enslaved_entity(self, entity_id):
+        """
+        Retrieve the entity object of an enslaved thermostat handled by this integration (or None),
+        resolved once and cached as long as it is still registered in its platform.
+        """
+        entity = self._enslaved_entities.get(entity_id)
+        if (
+            entity is None
+            or entity.platform is None
+            or entity.platform.entities.get(entity_id) is not entity
+        ):
+            entity = async_get_entity(self.hass, entity_id)
+            if not isinstance(entity, EnslavedGenericThermostat):
+                entity = None
+            self._enslaved_entities[entity_id] = entity
+        return entity
+
+    @staticmethod
+    def _merge_fan_out_results(*results):
+        """Merge the results of several calls of services on enslaved thermostats"""
+        results = [result for result in results if result]
+        if len(results) <= 1:
+            return results[0] if results else None
+        merged = {"members": {}, "elapsed": 0.0}
+        for result in results:
+            merged["elapsed"] = round(merged["elapsed"] + result["elapsed"], 3)
+            for entity_id, member_result in result["members"].items():
+                if (merged_result := merged["members"].get(entity_id)) is None:
+                    merged["members"][entity_id] = dict(member_result)
+                    continue
+                merged_result["success"] = merged_result["success"] and member_result["success"]
+                merged_result["error"] = merged_result["error"] or member_result["error"]
+                merged_result["elapsed"] = round(
+                    merged_result["elapsed"] + member_result["elapsed"], 3
+                )
+        return merged
+
+
+@functools.cache
+def _get_unrecorded_attributes_class(cls, attributes: frozenset) -> type:
+    """Retrieve (or create) the subclass of a thermostat class with specific unrecorded attributes"""
+    if attributes == cls._unrecorded_attributes:
+        return cls
+    return type(
+        cls.__name__,
+        (cls,),
+        {"__module__": cls.__module__, "_unrecorded_attributes": attributes},
+    )
 
 
 @dataclass
@@ -394,5 +894,25 @@ class EnslavedGenericThermostatExtraStoredData(ExtraStoredData):
     manual_hvac_mode: HVACMode | None = None
 
     def as_dict(self) -> dict[str, Any]:
-        """Return a dict representation of the text data."""
-        return asdict(self)
+        """
+        Return a flat and versioned dict representation of the extra stored data.
+        Note: do not use dataclasses.asdict() that deep copies all values.
+        """
+        return {
+            ATTR_STORED_DATA_VERSION: STORED_DATA_VERSION,
+            ATTR_MANUAL_TARGET_TEMP: self.manual_target_temp,
+            ATTR_MANUAL_HAVC_MODE: self.manual_hvac_mode,
+        }
+
+
+@dataclass
+class FakeEnslavedGenericThermostatExtraStoredData(EnslavedGenericThermostatExtraStoredData):
+    """Object to hold master and schedulable thermostat extra stored data."""
+
+    group_snapshot: dict | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a flat and versioned dict representation of the extra stored data."""
+        data = super().as_dict()
+        data[ATTR_GROUP_SNAPSHOT] = self.group_snapshot
+        return data
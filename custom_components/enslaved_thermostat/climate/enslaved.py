@@ -1,31 +1,64 @@
 """Adds support for enslaved thermostat."""
 import logging
+import math
 from dataclasses import dataclass
 from typing import Any, final
 
 from homeassistant.components.climate.const import HVACMode
-from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.const import (
+    ATTR_TEMPERATURE,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import HassJob, State, callback
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_call_later,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.restore_state import ExtraStoredData
+from homeassistant.helpers.typing import EventType
 
-try:
-    from homeassistant.exceptions import ServiceValidationError
-except ImportError:
-    from homeassistant.exceptions import HomeAssistantError as ServiceValidationError
-
+from .. import DOMAIN
 from ..const import (
+    ATTR_COOLING_RATE,
     ATTR_ENSLAVED_HVAC_MODE,
     ATTR_ENSLAVED_IN_SCHEDULER_MODE,
     ATTR_ENSLAVED_MODE,
     ATTR_ENSLAVED_SCHEDULER_PREV_HVAC_MODE,
     ATTR_ENSLAVED_SCHEDULER_PREV_TARGET_TEMP,
     ATTR_ENSLAVED_TARGET_TEMP,
+    ATTR_HEATING_RATE,
     ATTR_SCHEDULER_PREV_STATE,
+    ATTR_STORED_DATA_VERSION,
+    CONF_FLEET_CONTROL,
+    DATA_CONFIG,
     DEFAULT_ENSLAVED_MODE,
     DEFAULT_ENSLAVED_THERMOSTAT_NAME,
+    DEFAULT_SENSOR_FILTER_ALPHA,
+    DEFAULT_SENSOR_FILTER_WINDOW,
+    DEFAULT_TPI_COEF,
     ENSLAVED_MODES,
+    ControlMode,
     EnslavedMode,
+    SensorFilter,
+    SensorFusionMethod,
 )
-from .common import EnslavedGenericThermostat, EnslavedGenericThermostatExtraStoredData
+from ..profiler import profiled
+from ..trace import event_context
+from .command_queue import CommandQueue, queued_command
+from .common import (
+    EnslavedGenericThermostat,
+    EnslavedGenericThermostatExtraStoredData,
+    ServiceValidationError,
+)
+from .fleet import async_get_fleet_controller
+from .heating_rate import HeatingRateEstimator
+from .input_stage import SensorInputStage
+from .sensor_fusion import SensorFusion
+from .tpi import async_get_tpi_scheduler
 
 log = logging.getLogger(__name__)
 
@@ -37,7 +70,22 @@ class EnslavedThermostatExtraStoredData(EnslavedGenericThermostatExtraStoredData
     enslaved_mode: str | None = None
     enslaved_target_temp: float | None = None
     enslaved_hvac_mode: HVACMode | None = None
-    scheduler_previous_state: dict | None = None
+    scheduler_previous_target_temp: float | None = None
+    scheduler_previous_hvac_mode: HVACMode | None = None
+    heating_rate: float | None = None
+    cooling_rate: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a flat and versioned dict representation of the extra stored data."""
+        data = super().as_dict()
+        data[ATTR_ENSLAVED_MODE] = self.enslaved_mode
+        data[ATTR_ENSLAVED_TARGET_TEMP] = self.enslaved_target_temp
+        data[ATTR_ENSLAVED_HVAC_MODE] = self.enslaved_hvac_mode
+        data[ATTR_ENSLAVED_SCHEDULER_PREV_TARGET_TEMP] = self.scheduler_previous_target_temp
+        data[ATTR_ENSLAVED_SCHEDULER_PREV_HVAC_MODE] = self.scheduler_previous_hvac_mode
+        data[ATTR_HEATING_RATE] = self.heating_rate
+        data[ATTR_COOLING_RATE] = self.cooling_rate
+        return data
 
 
 class EnslavedThermostat(EnslavedGenericThermostat):
@@ -49,6 +97,12 @@ class EnslavedThermostat(EnslavedGenericThermostat):
     _enslaved_hvac_mode = None
     _scheduler_previous_state = None
 
+    _pending_temp = None
+    _pending_temp_context = None
+    _cancel_pending_temp = None
+
+    _fleet_controlled = False
+
     def __init__(self, **kwargs):
         """Initialize the thermostat."""
         super().__init__(**kwargs)
@@ -69,6 +123,39 @@ class EnslavedThermostat(EnslavedGenericThermostat):
             initial_enslaved_mode if initial_enslaved_mode else DEFAULT_ENSLAVED_MODE
         )
 
+        sensor_entity_ids = kwargs.get("sensor_entity_ids") or [kwargs["sensor_entity_id"]]
+        sensor_stale_after = kwargs.get("sensor_stale_after")
+        self._sensor_fusion = (
+            SensorFusion(
+                sensor_entity_ids,
+                method=kwargs.get("sensor_fusion") or SensorFusionMethod.MEAN,
+                weights=kwargs.get("sensor_weights"),
+                stale_after=sensor_stale_after.total_seconds() if sensor_stale_after else None,
+                last_reported=self._sensor_reported_at,
+            )
+            if len(sensor_entity_ids) > 1
+            else None
+        )
+
+        self._heating_rate = HeatingRateEstimator()
+        self._command_queue = CommandQueue()
+
+        self._control_mode = kwargs.get("control_mode") or ControlMode.HYSTERESIS
+        self._tpi_coef = kwargs.get("tpi_coef") or DEFAULT_TPI_COEF
+
+        sensor_filter = kwargs.get("sensor_filter") or SensorFilter.NONE
+        sensor_min_interval = kwargs.get("sensor_min_interval")
+        self._input_stage = (
+            SensorInputStage(
+                method=sensor_filter,
+                window=kwargs.get("sensor_filter_window") or DEFAULT_SENSOR_FILTER_WINDOW,
+                alpha=kwargs.get("sensor_filter_alpha") or DEFAULT_SENSOR_FILTER_ALPHA,
+                min_interval=(sensor_min_interval.total_seconds() if sensor_min_interval else None),
+            )
+            if sensor_filter != SensorFilter.NONE or sensor_min_interval
+            else None
+        )
+
     #
     # Implement methods to allow saving and restore custom state attributes
     #
@@ -76,12 +163,19 @@ class EnslavedThermostat(EnslavedGenericThermostat):
     @property
     def extra_restore_state_data(self) -> ExtraStoredData | None:
         """Return entity extra state data to be restored."""
+        previous_state = self._scheduler_previous_state
         return EnslavedThermostatExtraStoredData(
+            manual_target_temp=self.manual_target_temp,
+            manual_hvac_mode=self.manual_hvac_mode,
             enslaved_mode=self.enslaved_mode,
             enslaved_target_temp=self.enslaved_target_temp,
             enslaved_hvac_mode=self.enslaved_hvac_mode,
-            scheduler_previous_state=self._scheduler_previous_state,
-            **super().extra_restore_state_data.as_dict(),
+            scheduler_previous_target_temp=(
+                previous_state["temperature"] if previous_state else None
+            ),
+            scheduler_previous_hvac_mode=previous_state["hvac_mode"] if previous_state else None,
+            heating_rate=self._heating_rate.heating_rate,
+            cooling_rate=self._heating_rate.cooling_rate,
         )
 
     def _restore_last_extra_data(self, last_extra_data):
@@ -90,7 +184,308 @@ class EnslavedThermostat(EnslavedGenericThermostat):
         self._enslaved_mode = last_extra_data.get(ATTR_ENSLAVED_MODE)
         self._enslaved_target_temp = last_extra_data.get(ATTR_ENSLAVED_TARGET_TEMP)
         self._enslaved_hvac_mode = last_extra_data.get(ATTR_ENSLAVED_HVAC_MODE)
-        self._scheduler_previous_state = last_extra_data.get(ATTR_SCHEDULER_PREV_STATE)
+        if ATTR_STORED_DATA_VERSION not in last_extra_data:
+            # Legacy format: scheduler previous state stored as a dict
+            self._scheduler_previous_state = last_extra_data.get(ATTR_SCHEDULER_PREV_STATE)
+        elif last_extra_data.get(ATTR_ENSLAVED_SCHEDULER_PREV_HVAC_MODE) is not None:
+            self._scheduler_previous_state = {
+                "temperature": last_extra_data.get(ATTR_ENSLAVED_SCHEDULER_PREV_TARGET_TEMP),
+                "hvac_mode": last_extra_data[ATTR_ENSLAVED_SCHEDULER_PREV_HVAC_MODE],
+            }
+        else:
+            self._scheduler_previous_state = None
+        self._heating_rate.heating_rate = last_extra_data.get(ATTR_HEATING_RATE)
+        self._heating_rate.cooling_rate = last_extra_data.get(ATTR_COOLING_RATE)
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added."""
+        await super().async_added_to_hass()
+        # Note: GenericThermostat only tracks the first sensor, track the other ones
+        if self._sensor_fusion is not None:
+            self.async_on_remove(
+                async_track_state_change_event(
+                    self.hass, self._sensor_fusion.entity_ids[1:], self._async_sensor_changed
+                )
+            )
+        if self._control_mode == ControlMode.TPI:
+            self.async_on_remove(async_get_tpi_scheduler(self.hass).async_add_zone(self))
+        elif self._is_fleet_controllable():
+            self._fleet_controlled = True
+            self.async_on_remove(async_get_fleet_controller(self.hass).async_add_zone(self))
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Run when entity will be removed from hass."""
+        self._async_cancel_pending_temp()
+        await super().async_will_remove_from_hass()
+
+    #
+    # Handle sensor temperature changes through the optional input stage (filtering, suppression of
+    # changes below the precision and throttling of the evaluations)
+    #
+
+    @profiled("event_handling")
+    async def _async_sensor_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Handle temperature changes (decisions are traced with the context of the change)."""
+        with event_context(event.context):
+            await self._async_handle_sensor_change(event)
+
+    async def _async_handle_sensor_change(self, event: EventType[EventStateChangedData]) -> None:
+        """Handle temperature changes."""
+        if self._input_stage is None and self._sensor_fusion is None:
+            await super()._async_sensor_changed(event)
+            return
+        new_state = event.data["new_state"]
+        value = (
+            self._parse_sensor_state(new_state)
+            if new_state is not None and new_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+            else None
+        )
+        if self._sensor_fusion is not None:
+            # Note: an unavailable sensor is removed from the fusion
+            value = self._sensor_fusion.update(
+                event.data["entity_id"],
+                value,
+                self._state_reported_at(new_state) if new_state is not None else None,
+            )
+        if value is None:
+            return
+        if self._input_stage is None:
+            await self._async_apply_temp(value)
+            return
+        temperature, delay = self._input_stage.process(
+            value,
+            self._cur_temp,
+            self.precision,
+            min(self._cold_tolerance, self._hot_tolerance),
+        )
+        if temperature is None:
+            # Back within the precision of the current temperature: the last value wins, drop the
+            # throttled one
+            self._async_cancel_pending_temp()
+            return
+        if delay > 0:
+            # Apply the last temperature at the end of the throttling interval
+            self._pending_temp = temperature
+            self._pending_temp_context = event.context
+            if self._cancel_pending_temp is None:
+                self._cancel_pending_temp = async_call_later(
+                    self.hass, delay, HassJob(self._async_apply_pending_temp)
+                )
+            return
+        await self._async_apply_temp(temperature)
+
+    async def _async_apply_pending_temp(self, _now=None) -> None:
+        """Apply the temperature deferred by the input stage throttling."""
+        self._cancel_pending_temp = None
+        if self._pending_temp is not None:
+            with event_context(self._pending_temp_context):
+                await self._async_apply_temp(self._pending_temp)
+
+    async def _async_apply_temp(self, temperature: float) -> None:
+        """Apply a temperature provided by the input stage (or the fusion) and control the heater."""
+        self._async_cancel_pending_temp()
+        if self._input_stage is not None:
+            self._input_stage.applied()
+        self._cur_temp = temperature
+        await self._async_control_heating()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_pending_temp(self) -> None:
+        """Cancel the temperature deferred by the input stage throttling (if any)."""
+        self._pending_temp = None
+        self._pending_temp_context = None
+        if self._cancel_pending_temp:
+            self._cancel_pending_temp()
+            self._cancel_pending_temp = None
+
+    @callback
+    def _async_update_temp(self, state: State) -> None:
+        """
+        Update thermostat with latest state from sensor (fused with the other sensors and filtered
+        by the input stage).
+        """
+        if self._input_stage is None and self._sensor_fusion is None:
+            super()._async_update_temp(state)
+            return
+        value = self._parse_sensor_state(state)
+        if self._sensor_fusion is not None:
+            self._sensor_fusion.update(state.entity_id, value, self._state_reported_at(state))
+            self._async_seed_sensor_fusion()
+            value = self._sensor_fusion.value()
+        if value is None:
+            return
+        self._cur_temp = self._input_stage.filter(value) if self._input_stage else value
+
+    @callback
+    def _async_seed_sensor_fusion(self) -> None:
+        """Feed the sensor fusion with current state of sensors without known value."""
+        for entity_id in self._sensor_fusion.entity_ids:
+            if self._sensor_fusion.has_value(entity_id):
+                continue
+            state = self.hass.states.get(entity_id)
+            if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                continue
+            if (value := self._parse_sensor_state(state)) is not None:
+                self._sensor_fusion.update(entity_id, value, self._state_reported_at(state))
+
+    def _sensor_reported_at(self, entity_id: str) -> float | None:
+        """Return the timestamp of the last report of a sensor state (None if unknown)."""
+        if self.hass is None or (state := self.hass.states.get(entity_id)) is None:
+            return None
+        return self._state_reported_at(state)
+
+    @staticmethod
+    def _state_reported_at(state: State) -> float:
+        """
+        Return the timestamp of the last report of a state (last_reported is only available since
+        Home Assistant 2024.3, fallback on last_updated)
+        """
+        return getattr(state, "last_reported", state.last_updated).timestamp()
+
+    @staticmethod
+    def _parse_sensor_state(state: State) -> float | None:
+        """Parse the temperature from a sensor state (or None if invalid)."""
+        try:
+            value = float(state.state)
+            if not math.isfinite(value):
+                raise ValueError(f"Sensor has illegal state {state.state}")
+            return value
+        except ValueError as ex:
+            log.error("Unable to update from sensor: %s", ex)
+            return None
+
+    #
+    # Implement time-proportional (TPI) heater control: in this mode, the heater is controlled by the
+    # integration-wide TPI scheduler using the duty ratio of the thermostat.
+    #
+
+    @profiled("heater_control")
+    async def _async_control_heating(self, time=None, force=False):
+        """Check if we need to turn heating on or off."""
+        # Learn heating and cooling rates from the current temperature and heater state
+        self._heating_rate.update(self._cur_temp, bool(self._is_device_active))
+        if self._fleet_controlled:
+            async_get_fleet_controller(self.hass).async_update_zone(self)
+            return
+        if self._control_mode != ControlMode.TPI:
+            await super()._async_control_heating(time=time, force=force)
+            return
+        # Only recompute the duty ratio in the current cycle on forced control (change of target
+        # temperature or HVAC mode) or if it could not be computed yet (unknown temperature).
+        scheduler = async_get_tpi_scheduler(self.hass)
+        if force or not scheduler.is_computed(self):
+            await scheduler.async_refresh_zone(self)
+
+    def tpi_duty_ratio(self) -> float | None:
+        """
+        Return the part of the TPI cycle the heater have to be on (between 0 and 1), or None if it
+        can't be computed yet.
+        """
+        if self._hvac_mode == HVACMode.OFF:
+            return 0.0
+        if self._cur_temp is None or self._target_temp is None:
+            return None
+        delta = (
+            self._cur_temp - self._target_temp
+            if self.ac_mode
+            else self._target_temp - self._cur_temp
+        )
+        return min(1.0, max(0.0, self._tpi_coef * delta))
+
+    async def async_tpi_set_heater(self, on: bool) -> None:
+        """Turn heater on or off (if not already) on TPI scheduler request."""
+        if on == bool(self._is_device_active):
+            return
+        if on:
+            await self._async_heater_turn_on()
+        else:
+            await self._async_heater_turn_off()
+
+    #
+    # Implement batched fleet heater control: when enabled at the integration level, the heater of
+    # thermostats in hysteresis mode (without minimum cycle duration nor keep alive) is controlled
+    # by the integration-wide fleet controller.
+    #
+
+    def _is_fleet_controllable(self) -> bool:
+        """Check if the heater of the thermostat have to be controlled by the fleet controller"""
+        config = self.hass.data.get(DOMAIN, {}).get(DATA_CONFIG, {})
+        return (
+            config.get(CONF_FLEET_CONTROL, False)
+            and self._control_mode == ControlMode.HYSTERESIS
+            and not self.min_cycle_duration
+            and not self._keep_alive
+        )
+
+    def fleet_values(self) -> tuple:
+        """
+        Return the control parameters of the thermostat for the fleet controller: current and
+        target temperatures (NaN if unknown), cold and hot tolerances, and AC mode, enabled and
+        heater active flags.
+        """
+        return (
+            math.nan if self._cur_temp is None else self._cur_temp,
+            math.nan if self._target_temp is None else self._target_temp,
+            self._cold_tolerance,
+            self._hot_tolerance,
+            bool(self.ac_mode),
+            self._hvac_mode not in (None, HVACMode.OFF),
+            bool(self._is_device_active),
+        )
+
+    async def async_fleet_set_heater(self, on: bool) -> None:
+        """Turn heater on or off (if not already) on fleet controller request."""
+        if on == bool(self._is_device_active):
+            return
+        if on:
+            await self._async_heater_turn_on()
+        else:
+            await self._async_heater_turn_off()
+
+    @callback
+    @profiled("event_handling")
+    def _async_switch_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Handle heater switch state changes."""
+        super()._async_switch_changed(event)
+        old_state, new_state = event.data.get("old_state"), event.data.get("new_state")
+        if (
+            self._metrics is not None
+            and old_state is not None
+            and new_state is not None
+            and {old_state.state, new_state.state} == {STATE_ON, STATE_OFF}
+        ):
+            self._metrics.heater_toggles += 1
+        if self._fleet_controlled:
+            # Keep the heater active flag up to date in the fleet, without new evaluation
+            async_get_fleet_controller(self.hass).async_update_zone(self, evaluate=False)
+
+    #
+    # Override GenericThermostat heater methods to record heater toggles in the decision trace
+    #
+
+    async def _async_heater_turn_on(self):
+        """Turn heater toggleable device on."""
+        self._trace_heater_toggle(True)
+        await super()._async_heater_turn_on()
+
+    async def _async_heater_turn_off(self):
+        """Turn heater toggleable device off."""
+        self._trace_heater_toggle(False)
+        await super()._async_heater_turn_off()
+
+    def _trace_heater_toggle(self, on: bool) -> None:
+        """Record a heater toggle with the state which caused it in the decision trace"""
+        if not self._tracing:
+            return
+        self._trace(
+            "heater_toggle",
+            on=on,
+            active=bool(self._is_device_active),
+            current_temperature=self._cur_temp,
+            target_temperature=self._target_temp,
+            control_mode=self._control_mode,
+        )
 
     #
     # Append custom state attributes in the entity's state attributes
@@ -98,6 +493,7 @@ class EnslavedThermostat(EnslavedGenericThermostat):
 
     @final
     @property
+    @profiled("state_attributes")
     def state_attributes(self) -> dict[str, Any]:
         """Return the optional state attributes."""
         log.debug("Compute state attributes")
@@ -118,15 +514,44 @@ class EnslavedThermostat(EnslavedGenericThermostat):
                     if self._scheduler_previous_state
                     else None
                 ),
+                ATTR_HEATING_RATE: (
+                    round(self._heating_rate.heating_rate, 2)
+                    if self._heating_rate.heating_rate is not None
+                    else None
+                ),
+                ATTR_COOLING_RATE: (
+                    round(self._heating_rate.cooling_rate, 2)
+                    if self._heating_rate.cooling_rate is not None
+                    else None
+                ),
             }
         )
         return data
 
+    #
+    # Predict the time needed to reach a target temperature using the learned heating rate
+    #
+
+    def predicted_lead_time(self, temperature: float) -> float | None:
+        """
+        Return the predicted time (in seconds) needed to reach the specified target temperature (0
+        if already reached), or None if unknown.
+        """
+        if self._cur_temp is None:
+            return None
+        delta = temperature - self._cur_temp
+        if (delta > 0) == bool(self.ac_mode) or delta == 0:
+            # Already reached
+            return 0.0
+        return self._heating_rate.lead_time(delta)
+
     #
     # Implement methods to control the enslaved mode
     #
     # Note: these methods are callable through custom integration services registered in
-    # async_setup_platform() and described in services.yaml file.
+    # async_setup_platform() and described in services.yaml file. As all methods changing the
+    # state of the thermostat, they are run one at a time through the command queue of the
+    # thermostat (see queued_command).
     #
 
     @property
@@ -155,9 +580,18 @@ class EnslavedThermostat(EnslavedGenericThermostat):
         """Return current enslaved HVAC mode."""
         return self._enslaved_hvac_mode if self._enslaved_hvac_mode else self.hvac_mode
 
+    @queued_command
     async def async_set_enslaved_mode(self, mode=None, temperature=None, hvac_mode=None):
         """Set current enslaved mode."""
         log.debug("async_set_enslaved_mode(%s, %s, %s)", mode, temperature, hvac_mode)
+        await self._async_set_enslaved_mode(mode=mode, temperature=temperature, hvac_mode=hvac_mode)
+
+        # Ensure to update state after changing the enslaved mode
+        self.async_write_ha_state()
+
+    async def _async_set_enslaved_mode(self, mode=None, temperature=None, hvac_mode=None):
+        """Set current enslaved mode and apply it, without writing the state."""
+        previous_mode = self._enslaved_mode
         if mode is not None:
             if mode not in ENSLAVED_MODES:
                 raise ValueError(
@@ -171,30 +605,35 @@ class EnslavedThermostat(EnslavedGenericThermostat):
                 self._enslaved_mode = mode
                 # Restore the manual
                 if mode == EnslavedMode.MANUAL:
-                    await self.async_restore_manual_state()
+                    await self._async_restore_manual_state()
 
         if temperature is not None:
-            await self.async_set_enslaved_target_temp(temperature)
+            self._set_enslaved_target_temp(temperature)
 
         if hvac_mode is not None:
-            await self.async_set_enslaved_hvac_mode(hvac_mode)
-
-        # Do not apply new state if thermostat is currently in scheduler mode
-        if self.in_scheduler_mode:
-            return
-
-        if self.enslaved_mode == EnslavedMode.AUTO:
-            await self._async_set_temperature(temperature=self.enslaved_target_temp)
-            await self._async_set_hvac_mode(self.enslaved_hvac_mode)
-        elif self.enslaved_mode == EnslavedMode.OFF:
-            await self._async_set_hvac_mode(HVACMode.OFF)
-
-        # Ensure to update state after changing the enslaved mode
-        self.async_write_ha_state()
+            self._set_enslaved_hvac_mode(hvac_mode)
+
+        self._trace(
+            "enslaved_mode",
+            previous_mode=previous_mode,
+            mode=self._enslaved_mode,
+            temperature=temperature,
+            hvac_mode=hvac_mode,
+        )
+        await self._async_apply_enslaved_state()
 
+    @queued_command
     async def async_set_enslaved_target_temp(self, temperature):
         """Set current enslaved target temperature."""
         log.debug("async_set_enslaved_target_temp(%s)", temperature)
+        self._set_enslaved_target_temp(temperature)
+        await self._async_apply_enslaved_state()
+
+        # Ensure to update state after changing the enslaved target temperature
+        self.async_write_ha_state()
+
+    def _set_enslaved_target_temp(self, temperature):
+        """Check and set current enslaved target temperature, without applying it."""
         if self.min_temp > temperature or self.max_temp < temperature:
             raise ValueError(
                 f"Got unsupported enslaved_target_temp {temperature}. Must be between"
@@ -202,32 +641,36 @@ class EnslavedThermostat(EnslavedGenericThermostat):
             )
         self._enslaved_target_temp = temperature
 
-        # Do not apply new state if thermostat is currently in scheduler mode
-        if self.in_scheduler_mode:
-            return
-
-        if self.enslaved_mode == EnslavedMode.AUTO:
-            await self._async_set_temperature(temperature=temperature)
-        # Ensure to update state after changing the enslaved target temperature
-        self.async_write_ha_state()
-
+    @queued_command
     async def async_set_enslaved_hvac_mode(self, mode):
         """Set current enslaved HVAC mode."""
         log.debug("async_set_enslaved_hvac_mode(%s)", mode)
+        self._set_enslaved_hvac_mode(mode)
+        await self._async_apply_enslaved_state()
+
+        # Ensure to update state after changing the enslaved HVAC mode
+        self.async_write_ha_state()
+
+    def _set_enslaved_hvac_mode(self, mode):
+        """Check and set current enslaved HVAC mode, without applying it."""
         if mode not in self.hvac_modes:
             raise ValueError(
                 f"Got unsupported enslaved_hvac_mode {mode}. Must be one of {self.hvac_modes}."
             )
         self._enslaved_hvac_mode = mode
 
+    async def _async_apply_enslaved_state(self):
+        """Apply current enslaved mode state, without writing the state."""
         # Do not apply new state if thermostat is currently in scheduler mode
         if self.in_scheduler_mode:
             return
 
         if self.enslaved_mode == EnslavedMode.AUTO:
-            await self._async_set_hvac_mode(mode)
-        # Ensure to update state after changing the enslaved HVAC mode
-        self.async_write_ha_state()
+            await self._async_apply_state(
+                temperature=self.enslaved_target_temp, hvac_mode=self.enslaved_hvac_mode
+            )
+        elif self.enslaved_mode == EnslavedMode.OFF:
+            await self._async_apply_state(hvac_mode=HVACMode.OFF)
 
     #
     # Implement methods to control the scheduler mode
@@ -252,6 +695,7 @@ class EnslavedThermostat(EnslavedGenericThermostat):
                 " this mode first."
             )
 
+    @queued_command
     async def async_start_scheduler_mode(self, temperature, hvac_mode=None):
         """
         Start scheduler mode: apply specified heating parameters and store current state in
@@ -262,26 +706,39 @@ class EnslavedThermostat(EnslavedGenericThermostat):
             "temperature": self._target_temp,
             "hvac_mode": self.hvac_mode,
         }
-        try:
-            await self._async_set_temperature(temperature=temperature)
-            await self._async_set_hvac_mode(hvac_mode if hvac_mode is not None else HVACMode.HEAT)
-        except ValueError:
-            log.warning(
-                "Fail to start scheduler mode with provided parameters, restore previous state"
-            )
-            await self._async_set_temperature(temperature=current_state["temperature"])
-            await self._async_set_hvac_mode(current_state["hvac_mode"])
-            raise
+        # Note: parameters are checked before being applied, so nothing to restore on error
+        await self._async_apply_state(
+            temperature=temperature,
+            hvac_mode=hvac_mode if hvac_mode is not None else HVACMode.HEAT,
+        )
 
         if not self._scheduler_previous_state:
             self._scheduler_previous_state = current_state
-
-        # Apply enslaved mode state if it changed during thermostat was in scheduler mode
-        await self.async_set_enslaved_mode()
+        self._trace("scheduler_start", temperature=self._target_temp, hvac_mode=self._hvac_mode)
 
         # Ensure to update state after changing the enslaved mode
         self.async_write_ha_state()
 
+    @queued_command
+    async def async_update_scheduler_target(self, temperature=None, hvac_mode=None):
+        """
+        Update in place the target temperature and HVAC mode applied in scheduler mode, without
+        touching the stored previous state.
+        """
+        log.debug("async_update_scheduler_target(%s, %s)", temperature, hvac_mode)
+        if not self._scheduler_previous_state:
+            raise ServiceValidationError("This thermostat is not currently in scheduler mode.")
+        if (temperature is None or temperature == self._target_temp) and (
+            hvac_mode is None or hvac_mode == self._hvac_mode
+        ):
+            # Nothing changed
+            return
+        await self._async_apply_state(temperature=temperature, hvac_mode=hvac_mode)
+
+        # Ensure to update state after changing the scheduler target
+        self.async_write_ha_state()
+
+    @queued_command
     async def async_stop_scheduler_mode(self):
         """
         Start scheduler mode: restore previous state from self._scheduler_previous_state and clean
@@ -290,25 +747,15 @@ class EnslavedThermostat(EnslavedGenericThermostat):
         log.debug("async_stop_scheduler_mode()")
         if not self._scheduler_previous_state:
             raise ServiceValidationError("This thermostat is not currently in scheduler mode.")
-        current_state = {
-            "temperature": self._target_temp,
-            "hvac_mode": self.hvac_mode,
-        }
-        try:
-            await self._async_set_temperature(
-                temperature=self._scheduler_previous_state["temperature"]
-            )
-            await self._async_set_hvac_mode(self._scheduler_previous_state["hvac_mode"])
-        except ValueError:
-            log.warning(
-                "Fail to restore the state before the scheduler was stated, restore previous state"
-            )
-            await self._async_set_temperature(temperature=current_state["temperature"])
-            await self._async_set_hvac_mode(current_state["hvac_mode"])
-            raise
+        # Note: parameters are checked before being applied, so nothing to restore on error
+        await self._async_apply_state(
+            temperature=self._scheduler_previous_state["temperature"],
+            hvac_mode=self._scheduler_previous_state["hvac_mode"],
+        )
 
         # Clean previous state to leave scheduler mode
         self._scheduler_previous_state = None
+        self._trace("scheduler_stop", temperature=self._target_temp, hvac_mode=self._hvac_mode)
 
         # Ensure to update state after changing the enslaved mode
         self.async_write_ha_state()
@@ -318,38 +765,51 @@ class EnslavedThermostat(EnslavedGenericThermostat):
     # current scheduler and enslaved mode in case on manual action on the thermostat:
     # - forbidden change in scheduler mode or in force OFF enslaved mode
     # - switch in manual enslaved mode otherwise
-    # Note: Keep access to original methods by adding private methods.
+    # Note: State is applied using the _async_apply_state() helper method to control the heater and
+    # write the state only once.
     #
 
+    @queued_command
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode."""
         self.assert_not_in_scheduler_mode()
         self.assert_not_in_enslaved_off_mode()
         log.debug("Set HVAC mode to %s and enslaved mode to manual", hvac_mode)
-        await self._async_set_hvac_mode(hvac_mode)
-        await self.async_set_enslaved_mode(EnslavedMode.MANUAL)
+        await self._async_apply_state(hvac_mode=hvac_mode)
+        self._switch_to_manual_mode()
 
-    async def _async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
-        """Original GenericThermostat set HVAC mode."""
-        await super().async_set_hvac_mode(hvac_mode)
+        # Ensure to update state after changing the HVAC mode
+        self.async_write_ha_state()
 
+    @queued_command
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set temperature method"""
         self.assert_not_in_scheduler_mode()
         self.assert_not_in_enslaved_off_mode()
         log.debug("Set temperature to %s and enslaved mode to manual", kwargs.get(ATTR_TEMPERATURE))
-        await self._async_set_temperature(**kwargs)
-        await self.async_set_enslaved_mode(EnslavedMode.MANUAL)
+        await self._async_apply_state(temperature=kwargs.get(ATTR_TEMPERATURE))
+        self._switch_to_manual_mode()
 
-    async def _async_set_temperature(self, **kwargs: Any) -> None:
-        """Original GenericThermostat set temperature method"""
-        await super().async_set_temperature(**kwargs)
+        # Ensure to update state after changing the target temperature
+        self.async_write_ha_state()
+
+    def _switch_to_manual_mode(self):
+        """
+        Switch to enslaved manual mode on manual action, without writing the state. The stored
+        manual state is not restored: the state just set by the user is kept.
+        """
+        if self._enslaved_mode != EnslavedMode.MANUAL:
+            self._trace(
+                "enslaved_mode", previous_mode=self._enslaved_mode, mode=EnslavedMode.MANUAL
+            )
+            self._enslaved_mode = EnslavedMode.MANUAL
 
     #
     # Override restore_manual_state() method to respect the scheduler mode and switch to enslaved
     # manual mode if not already set.
     #
 
+    @queued_command
     async def async_restore_manual_state(self):
         """
         Restore manual state if we are not in scheduler mode.
@@ -357,8 +817,17 @@ class EnslavedThermostat(EnslavedGenericThermostat):
         """
         self.assert_not_in_scheduler_mode()
         log.debug("async_restore_manual_state()")
+        await self._async_restore_manual_state()
+
+        # Ensure to update state after restoring the manual state
+        self.async_write_ha_state()
+
+    async def _async_restore_manual_state(self):
+        """Restore manual state, without writing the state."""
         if self.enslaved_mode != EnslavedMode.MANUAL:
-            self.set_enslaved_mode(EnslavedMode.MANUAL)
+            # Note: do not call async_set_enslaved_mode() that call this method when switching
+            # to manual enslaved mode.
+            self._enslaved_mode = EnslavedMode.MANUAL
         # If we are in scheduler mode, do not restore manual state, but override state to restore
         # when we will leave the scheduler mode
         if self.in_scheduler_mode:
@@ -375,4 +844,92 @@ class EnslavedThermostat(EnslavedGenericThermostat):
                 ),
             }
         else:
-            super().restore_manual_state()
+            await self._async_apply_state(
+                temperature=self.manual_target_temp, hvac_mode=self.manual_hvac_mode
+            )
+
+    #
+    # Implement method to restore a full enslaved state (as captured by group snapshot)
+    #
+    # Note: this method is callable through custom integration services registered in
+    # async_setup_platform() and described in services.yaml file.
+    #
+
+    @queued_command
+    async def async_restore_enslaved_state(
+        self,
+        enslaved_mode=None,
+        enslaved_target_temp=None,
+        enslaved_hvac_mode=None,
+        manual_target_temp=None,
+        manual_hvac_mode=None,
+        temperature=None,
+        hvac_mode=None,
+        scheduler_previous_target_temp=None,
+        scheduler_previous_hvac_mode=None,
+    ):
+        """
+        Restore a full enslaved state (enslaved mode and parameters, manual state, scheduler
+        previous state and current state) with only one state write.
+        """
+        log.debug(
+            "async_restore_enslaved_state(%s, %s, %s, %s, %s, %s, %s, %s, %s)",
+            enslaved_mode,
+            enslaved_target_temp,
+            enslaved_hvac_mode,
+            manual_target_temp,
+            manual_hvac_mode,
+            temperature,
+            hvac_mode,
+            scheduler_previous_target_temp,
+            scheduler_previous_hvac_mode,
+        )
+        if enslaved_mode is not None:
+            if enslaved_mode not in ENSLAVED_MODES:
+                raise ValueError(
+                    f"Got unsupported enslaved_mode {enslaved_mode}. Must be one of"
+                    f" {ENSLAVED_MODES}"
+                )
+            self._enslaved_mode = enslaved_mode
+        self._enslaved_target_temp = enslaved_target_temp
+        self._enslaved_hvac_mode = enslaved_hvac_mode
+        self.manual_target_temp = manual_target_temp
+        self.manual_hvac_mode = manual_hvac_mode
+        self._scheduler_previous_state = (
+            {
+                "temperature": scheduler_previous_target_temp,
+                "hvac_mode": scheduler_previous_hvac_mode,
+            }
+            if scheduler_previous_hvac_mode is not None
+            else None
+        )
+        await self._async_apply_state(temperature=temperature, hvac_mode=hvac_mode)
+
+        # Ensure to update state after restoring the enslaved state
+        self.async_write_ha_state()
+
+    #
+    # Helpers methods
+    #
+
+    async def _async_apply_state(self, temperature=None, hvac_mode=None):
+        """
+        Apply target temperature and HVAC mode and control the heater once, without writing
+        the state (contrary to original GenericThermostat methods).
+        """
+        if hvac_mode is not None and hvac_mode not in self.hvac_modes:
+            raise ValueError(
+                f"Got unsupported hvac_mode {hvac_mode}. Must be one of {self.hvac_modes}."
+            )
+        if temperature is not None:
+            self._target_temp = temperature
+        if hvac_mode is not None:
+            self._hvac_mode = hvac_mode
+        if self._hvac_mode == HVACMode.OFF:
+            if self._is_device_active:
+                await self._async_heater_turn_off()
+            if self._fleet_controlled:
+                # Disable the zone in the fleet (a pending evaluation must not turn on its heater)
+                async_get_fleet_controller(self.hass).async_update_zone(self)
+        else:
+            await self._async_control_heating(force=True)
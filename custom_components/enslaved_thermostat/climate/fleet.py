@@ -0,0 +1,230 @@
+"""Batched heater control of enslaved thermostats fleet"""
+import asyncio
+import logging
+import math
+from array import array
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+
+from .. import DOMAIN
+from ..const import CONF_FLEET_INTERVAL, DATA_CONFIG, DATA_FLEET_CONTROLLER, DEFAULT_FLEET_INTERVAL
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+log = logging.getLogger(__name__)
+
+# Minimum number of evaluated zones to use NumPy (below, the pure Python implementation is faster,
+# see scripts/bench_fleet.py)
+NUMPY_MIN_ZONES = 32
+
+
+@callback
+def async_get_fleet_controller(hass: HomeAssistant) -> "FleetController":
+    """Retrieve (or create) the integration-wide fleet controller"""
+    data = hass.data.setdefault(DOMAIN, {})
+    if DATA_FLEET_CONTROLLER not in data:
+        interval = data.get(DATA_CONFIG, {}).get(CONF_FLEET_INTERVAL, DEFAULT_FLEET_INTERVAL)
+        data[DATA_FLEET_CONTROLLER] = FleetController(hass, interval)
+    return data[DATA_FLEET_CONTROLLER]
+
+
+def evaluate_transitions(cur, target, cold, hot, ac_mode, enabled, active, indexes=None):
+    """
+    Evaluate the heater control decision of zones (as a generic thermostat does) and return the
+    indexes of the zones whose heater has to be turned on and the ones whose heater has to be
+    turned off (including the disabled zones whose heater is still active).
+
+    Parameters are arrays of the same length: current and target temperatures (NaN if unknown),
+    cold and hot tolerances, and AC mode, enabled (HVAC mode not off) and heater active flags. Only
+    the zones at the specified indexes are evaluated (all by default, indexes have to be a
+    sequence).
+    """
+    if np is not None and len(cur if indexes is None else indexes) >= NUMPY_MIN_ZONES:
+        return _np_evaluate_transitions(cur, target, cold, hot, ac_mode, enabled, active, indexes)
+    return _py_evaluate_transitions(cur, target, cold, hot, ac_mode, enabled, active, indexes)
+
+
+def _py_evaluate_transitions(cur, target, cold, hot, ac_mode, enabled, active, indexes):
+    """Pure Python implementation of evaluate_transitions()"""
+    turn_on, turn_off = [], []
+    for idx in range(len(cur)) if indexes is None else indexes:
+        if not enabled[idx]:
+            if active[idx]:
+                turn_off.append(idx)
+            continue
+        if math.isnan(cur[idx]) or math.isnan(target[idx]):
+            continue
+        too_cold = target[idx] >= cur[idx] + cold[idx]
+        too_hot = cur[idx] >= target[idx] + hot[idx]
+        if active[idx]:
+            if too_cold if ac_mode[idx] else too_hot:
+                turn_off.append(idx)
+        elif too_hot if ac_mode[idx] else too_cold:
+            turn_on.append(idx)
+    return turn_on, turn_off
+
+
+def _np_evaluate_transitions(cur, target, cold, hot, ac_mode, enabled, active, indexes):
+    """NumPy implementation of evaluate_transitions()"""
+    arrays = [
+        np.frombuffer(cur, dtype=np.float64),
+        np.frombuffer(target, dtype=np.float64),
+        np.frombuffer(cold, dtype=np.float64),
+        np.frombuffer(hot, dtype=np.float64),
+        np.frombuffer(ac_mode, dtype=np.uint8).astype(bool),
+        np.frombuffer(enabled, dtype=np.uint8).astype(bool),
+        np.frombuffer(active, dtype=np.uint8).astype(bool),
+    ]
+    if indexes is not None:
+        indexes = np.fromiter(indexes, dtype=np.intp)
+        arrays = [values[indexes] for values in arrays]
+    cur, target, cold, hot, ac_mode, enabled, active = arrays
+    valid = enabled & ~np.isnan(cur) & ~np.isnan(target)
+    too_cold = target >= cur + cold
+    too_hot = cur >= target + hot
+    turn_on = valid & ~active & np.where(ac_mode, too_hot, too_cold)
+    turn_off = active & (~enabled | (valid & np.where(ac_mode, too_cold, too_hot)))
+    if indexes is not None:
+        return indexes[turn_on].tolist(), indexes[turn_off].tolist()
+    return np.flatnonzero(turn_on).tolist(), np.flatnonzero(turn_off).tolist()
+
+
+class FleetController:
+    """
+    Integration-wide batched heater control of enslaved thermostats.
+
+    The control parameters of all zones are kept in contiguous arrays. On each tick (all zones)
+    or as soon as some zones are marked as dirty (only these zones), the control decision of the
+    zones is evaluated in one batch and only the resulting heater transitions are emitted.
+
+    Zones have to implement the fleet_values() and async_fleet_set_heater() methods.
+    """
+
+    def __init__(self, hass: HomeAssistant, interval):
+        """Initialize the fleet controller."""
+        self.hass = hass
+        self.interval = interval
+        self._zones = []
+        self._indexes = {}
+        self._cur = array("d")
+        self._target = array("d")
+        self._cold = array("d")
+        self._hot = array("d")
+        self._ac_mode = array("B")
+        self._enabled = array("B")
+        self._active = array("B")
+        self._dirty = set()
+        self._cancel_tick = None
+        self._cancel_dirty = None
+        self._cancel_stop = None
+
+    @property
+    def _arrays(self):
+        """Arrays of zones control parameters (in fleet_values() order)"""
+        return (
+            self._cur,
+            self._target,
+            self._cold,
+            self._hot,
+            self._ac_mode,
+            self._enabled,
+            self._active,
+        )
+
+    @callback
+    def async_add_zone(self, zone) -> CALLBACK_TYPE:
+        """Add a zone to the fleet and return the function to remove it"""
+        self._indexes[zone] = len(self._zones)
+        self._zones.append(zone)
+        for values, value in zip(self._arrays, zone.fleet_values()):
+            values.append(value)
+        if self._cancel_tick is None:
+            log.debug("Start fleet control (%s)", self.interval)
+            self._cancel_tick = async_track_time_interval(
+                self.hass, self._async_tick, self.interval
+            )
+            self._cancel_stop = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_stop
+            )
+
+        @callback
+        def _async_remove_zone() -> None:
+            self._async_remove_zone(zone)
+
+        return _async_remove_zone
+
+    @callback
+    def _async_remove_zone(self, zone) -> None:
+        """Remove a zone from the fleet (replacing it by the last one in arrays)"""
+        idx = self._indexes.pop(zone)
+        self._dirty.discard(idx)
+        last = len(self._zones) - 1
+        last_zone = self._zones.pop()
+        for values in self._arrays:
+            last_value = values.pop()
+            if idx != last:
+                values[idx] = last_value
+        if idx != last:
+            self._zones[idx] = last_zone
+            self._indexes[last_zone] = idx
+            if last in self._dirty:
+                self._dirty.discard(last)
+                self._dirty.add(idx)
+        if not self._zones:
+            if self._cancel_stop:
+                self._cancel_stop()
+            self._async_stop()
+
+    @callback
+    def _async_stop(self, _event: Event | None = None) -> None:
+        """Stop fleet control (on Home Assistant stop or when the last zone is removed)"""
+        log.debug("Stop fleet control")
+        for cancel in (self._cancel_tick, self._cancel_dirty):
+            if cancel:
+                cancel()
+        self._cancel_tick = self._cancel_dirty = self._cancel_stop = None
+        self._dirty.clear()
+
+    @callback
+    def async_update_zone(self, zone, evaluate=True) -> None:
+        """Update the control parameters of a zone and mark it as dirty (if evaluate)"""
+        if (idx := self._indexes.get(zone)) is None:
+            return
+        for values, value in zip(self._arrays, zone.fleet_values()):
+            values[idx] = value
+        if not evaluate:
+            return
+        self._dirty.add(idx)
+        if self._cancel_dirty is None:
+            self._cancel_dirty = async_call_later(self.hass, 0, HassJob(self._async_evaluate_dirty))
+
+    async def _async_tick(self, _now=None) -> None:
+        """Evaluate all zones"""
+        self._dirty.clear()
+        await self._async_evaluate(None)
+
+    async def _async_evaluate_dirty(self, _now=None) -> None:
+        """Evaluate dirty zones"""
+        self._cancel_dirty = None
+        indexes, self._dirty = sorted(self._dirty), set()
+        if indexes:
+            await self._async_evaluate(indexes)
+
+    async def _async_evaluate(self, indexes) -> None:
+        """Evaluate zones in one batch and emit resulting heater transitions"""
+        turn_on, turn_off = evaluate_transitions(*self._arrays, indexes=indexes)
+        if not turn_on and not turn_off:
+            return
+        log.debug("Fleet control: turn on %d heater(s), turn off %d", len(turn_on), len(turn_off))
+        zones = [(self._zones[idx], True) for idx in turn_on]
+        zones += [(self._zones[idx], False) for idx in turn_off]
+        for idx in turn_on:
+            self._active[idx] = 1
+        for idx in turn_off:
+            self._active[idx] = 0
+        await asyncio.gather(*[zone.async_fleet_set_heater(on) for zone, on in zones])
@@ -0,0 +1,66 @@
+"""Online estimation of the heating and cooling rates of enslaved thermostat"""
+import time
+
+# Smoothing factor of the exponentially weighted moving average of measured rates
+DEFAULT_ALPHA = 0.2
+# Minimum duration (in seconds) of a measure, to limit the impact of the sensor noise
+DEFAULT_MIN_INTERVAL = 300
+
+
+class HeatingRateEstimator:
+    """
+    Online estimation, in constant memory, of the heating rate (temperature change per hour while
+    the heater is active) and the cooling rate (temperature change per hour while it's inactive)
+    of a zone: the rates measured between temperature samples are smoothed using an exponentially
+    weighted moving average. Only the last sample is kept, and a measure is dropped if the heater
+    state changed during it.
+    """
+
+    def __init__(
+        self,
+        heating_rate=None,
+        cooling_rate=None,
+        alpha=DEFAULT_ALPHA,
+        min_interval=DEFAULT_MIN_INTERVAL,
+    ):
+        """Initialize the estimator (with previously learned rates, if known)."""
+        self.heating_rate = heating_rate
+        self.cooling_rate = cooling_rate
+        self.alpha = alpha
+        self.min_interval = min_interval
+        self._sample = None
+
+    def update(self, temperature: float | None, active: bool, now: float | None = None) -> None:
+        """Feed the estimator with the current temperature and heater state"""
+        now = time.monotonic() if now is None else now
+        if temperature is None:
+            self._sample = None
+            return
+        if self._sample is None or self._sample[2] != active:
+            self._sample = (temperature, now, active)
+            return
+        last_temperature, last_time, _ = self._sample
+        elapsed = now - last_time
+        if elapsed < self.min_interval:
+            return
+        rate = (temperature - last_temperature) * 3600 / elapsed
+        if active:
+            self.heating_rate = self._smooth(self.heating_rate, rate)
+        else:
+            self.cooling_rate = self._smooth(self.cooling_rate, rate)
+        self._sample = (temperature, now, active)
+
+    def _smooth(self, current: float | None, rate: float) -> float:
+        """Return the new smoothed rate"""
+        return rate if current is None else current + self.alpha * (rate - current)
+
+    def lead_time(self, delta: float) -> float | None:
+        """
+        Return the time (in seconds) needed to change the temperature by delta with the heater
+        active, or None if unknown (no heating rate learned yet or not in the right direction).
+        """
+        if delta == 0:
+            return 0.0
+        if not self.heating_rate or self.heating_rate * delta < 0:
+            return None
+        return delta / self.heating_rate * 3600
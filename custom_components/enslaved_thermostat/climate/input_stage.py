@@ -0,0 +1,58 @@
+"""Sensor input stage for enslaved thermostat"""
+import statistics
+import time
+from collections import deque
+
+from ..const import SensorFilter
+
+
+class SensorInputStage:
+    """
+    Optional input stage applied on sensor temperature values before controlling the heater:
+    - filter values using an exponential moving average or a median of the last values
+    - suppress changes below the thermostat precision
+    - throttle evaluations to at most one every min_interval seconds, except for changes larger
+      than the thermostat tolerance that are applied immediately
+    """
+
+    def __init__(self, method=SensorFilter.NONE, window=None, alpha=None, min_interval=None):
+        """Initialize the input stage."""
+        self.method = method
+        self.alpha = alpha
+        self.min_interval = min_interval
+        self._values = deque(maxlen=window) if method == SensorFilter.MEDIAN else None
+        self._ema = None
+        self._last_applied = None
+
+    def filter(self, value: float) -> float:
+        """Feed the filter with a new value and return the filtered one"""
+        if self.method == SensorFilter.EMA:
+            self._ema = value if self._ema is None else self._ema + self.alpha * (value - self._ema)
+            return self._ema
+        if self.method == SensorFilter.MEDIAN:
+            self._values.append(value)
+            return statistics.median(self._values)
+        return value
+
+    def process(
+        self, value: float, current: float | None, precision: float, bypass_delta: float
+    ) -> tuple[float | None, float]:
+        """
+        Process a new sensor value and return the temperature to apply (or None if the change is
+        suppressed) and the delay (in seconds) to wait before applying it.
+        """
+        temperature = self.filter(value)
+        if current is None:
+            return temperature, 0
+        delta = abs(temperature - current)
+        if delta < precision:
+            return None, 0
+        if self.min_interval and self._last_applied is not None and delta < bypass_delta:
+            delay = self._last_applied + self.min_interval - time.monotonic()
+            if delay > 0:
+                return temperature, delay
+        return temperature, 0
+
+    def applied(self) -> None:
+        """Mark a temperature as applied (start of the throttling interval)"""
+        self._last_applied = time.monotonic()
@@ -32,18 +32,18 @@ class MasterThermostat(FakeEnslavedGenericThermostat):
     # thermostats
     #
 
-    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> dict[str, Any] | None:
         """Set HVAC mode."""
         log.debug("Set HVAC mode to %s", hvac_mode)
         await super().async_set_hvac_mode(hvac_mode)
-        await self._async_call_enslaved_thermostats_service(
+        return await self._async_call_enslaved_thermostats_service(
             SERVICE_SET_ENSLAVED_HVAC_MODE, {"mode": self.hvac_mode}
         )
 
-    async def async_set_temperature(self, **kwargs: Any) -> None:
+    async def async_set_temperature(self, **kwargs: Any) -> dict[str, Any] | None:
         """Set temperature method"""
         log.debug("Set temperature to %s", kwargs.get(ATTR_TEMPERATURE))
         await super().async_set_temperature(**kwargs)
-        await self._async_call_enslaved_thermostats_service(
+        return await self._async_call_enslaved_thermostats_service(
             SERVICE_SET_ENSLAVED_TARGET_TEMP, {"temperature": self.target_temperature}
         )
@@ -1,21 +1,51 @@
 """Adds support for schedulable thermostat."""
 import logging
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.components.climate.const import HVACMode
 from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_point_in_utc_time, async_track_time_interval
+from homeassistant.util import dt as dt_util
 
-from ..const import ATTR_ENSLAVED_IN_SCHEDULER_MODE, DEFAULT_SCHEDULABLE_THERMOSTAT_NAME
+from ..const import (
+    ATTR_ENSLAVED_IN_SCHEDULER_MODE,
+    ATTR_PREDICTED_LEAD_TIME,
+    ATTR_SCHEDULED_START,
+    DEFAULT_MAX_PREHEAT,
+    DEFAULT_SCHEDULABLE_THERMOSTAT_NAME,
+    SERVICE_START_SCHEDULER_MODE,
+    SERVICE_UPDATE_SCHEDULER_TARGET,
+)
+from ..profiler import profiled
 from .common import FakeEnslavedGenericThermostat
 
 log = logging.getLogger(__name__)
 
+# Interval between two checks of the enslaved thermostats to start early before a scheduled start
+PREHEAT_CHECK_INTERVAL = timedelta(minutes=1)
+
 
 class SchedulableThermostat(FakeEnslavedGenericThermostat):
     """Representation of an Schedulable Thermostat device"""
 
     _default_name = DEFAULT_SCHEDULABLE_THERMOSTAT_NAME
 
+    _scheduled_start = None
+    _predicted_lead_time = None
+
+    def __init__(self, **kwargs):
+        """Initialize the thermostat."""
+        super().__init__(**kwargs)
+        self._max_preheat = kwargs.get("max_preheat") or DEFAULT_MAX_PREHEAT
+        self._cancel_scheduled_start = []
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Run when entity will be removed from hass."""
+        self._async_cancel_scheduled_start()
+        await super().async_will_remove_from_hass()
+
     @staticmethod
     def _enslaved_thermostat_is_handled(state):
         """Check if the enslaved thermostat is handled based on its current state"""
@@ -26,18 +56,193 @@ class SchedulableThermostat(FakeEnslavedGenericThermostat):
     # thermostats
     #
 
-    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> dict[str, Any] | None:
         """Set HVAC mode."""
         log.debug("Set HVAC mode to %s", hvac_mode)
         await super().async_set_hvac_mode(hvac_mode)
         if self.hvac_mode == HVACMode.OFF:
-            await self.async_stop_scheduler_mode()
-        else:
-            await self.async_start_scheduler_mode()
+            return await self.async_stop_scheduler_mode()
+        return await self._async_update_scheduler_target()
 
-    async def async_set_temperature(self, **kwargs: Any) -> None:
+    async def async_set_temperature(self, **kwargs: Any) -> dict[str, Any] | None:
         """Set temperature method"""
         log.debug("Set temperature to %s", kwargs.get(ATTR_TEMPERATURE))
         await super().async_set_temperature(**kwargs)
         if self.hvac_mode != HVACMode.OFF:
-            await self.async_start_scheduler_mode()
+            return await self._async_update_scheduler_target()
+        return None
+
+    async def _async_update_scheduler_target(self) -> dict[str, Any] | None:
+        """
+        Apply the current target temperature and HVAC mode on enslaved thermostats: update in place
+        the scheduler target of the ones already in scheduler mode and start it on the other ones.
+        """
+        if self._async_cancel_scheduled_start():
+            self.async_write_ha_state()
+        in_scheduler_mode, others = [], []
+        for entity_id in self._enslaved_thermostats:
+            state = self.hass.states.get(entity_id)
+            if state is not None and state.attributes.get(ATTR_ENSLAVED_IN_SCHEDULER_MODE):
+                in_scheduler_mode.append(entity_id)
+            else:
+                others.append(entity_id)
+        data = {"temperature": self.target_temperature, "hvac_mode": self.hvac_mode}
+        results = []
+        if in_scheduler_mode:
+            results.append(
+                await self._async_call_enslaved_thermostats_service(
+                    SERVICE_UPDATE_SCHEDULER_TARGET, data, entity_ids=in_scheduler_mode
+                )
+            )
+        if others:
+            results.append(
+                await self._async_call_enslaved_thermostats_service(
+                    SERVICE_START_SCHEDULER_MODE, data, entity_ids=others
+                )
+            )
+        return self._merge_fan_out_results(*results)
+
+    #
+    # Append custom state attributes in the entity's state attributes
+    #
+
+    @property
+    @profiled("state_attributes")
+    def state_attributes(self) -> dict[str, Any]:
+        """Return the optional state attributes."""
+        data = super().state_attributes
+        data.update(
+            {
+                ATTR_SCHEDULED_START: (
+                    self._scheduled_start["start_at"].isoformat() if self._scheduled_start else None
+                ),
+                ATTR_PREDICTED_LEAD_TIME: self._predicted_lead_time,
+            }
+        )
+        return data
+
+    #
+    # Implement methods to control scheduler mode on enslaved thermostats: a manual start or stop
+    # cancels the scheduled start (if any)
+    #
+
+    async def async_start_scheduler_mode(self, temperature=None, hvac_mode=None):
+        """Start scheduler mode on enslaved thermostats"""
+        if self._async_cancel_scheduled_start():
+            self.async_write_ha_state()
+        return await super().async_start_scheduler_mode(
+            temperature=temperature, hvac_mode=hvac_mode
+        )
+
+    async def async_stop_scheduler_mode(self):
+        """Stop scheduler mode on enslaved thermostats"""
+        if self._async_cancel_scheduled_start():
+            self.async_write_ha_state()
+        return await super().async_stop_scheduler_mode()
+
+    #
+    # Implement predictive scheduled start of the scheduler mode: each enslaved thermostat is
+    # started early regarding its predicted lead time to reach the target temperature (using its
+    # learned heating rate, limited to max_preheat), and all remaining ones at the scheduled time.
+    #
+    # Note: this method is callable through custom integration services registered in
+    # async_setup_platform() and described in services.yaml file.
+    #
+
+    async def async_schedule_scheduler_mode(
+        self, start_at: datetime, temperature: float, hvac_mode: HVACMode | None = None
+    ) -> dict[str, Any] | None:
+        """Schedule the start of the scheduler mode on enslaved thermostats"""
+        log.debug("async_schedule_scheduler_mode(%s, %s, %s)", start_at, temperature, hvac_mode)
+        start_at = dt_util.as_utc(start_at)
+        self._async_cancel_scheduled_start()
+        self._scheduled_start = {
+            "start_at": start_at,
+            "temperature": temperature,
+            "hvac_mode": hvac_mode if hvac_mode is not None else HVACMode.HEAT,
+            "pending": list(self._enslaved_thermostats),
+        }
+        self._cancel_scheduled_start = [
+            async_track_time_interval(
+                self.hass, self._async_scheduled_start_timer, PREHEAT_CHECK_INTERVAL
+            ),
+            async_track_point_in_utc_time(self.hass, self._async_scheduled_start_timer, start_at),
+        ]
+        result = await self._async_check_scheduled_start()
+
+        # Ensure to update state after scheduling the start
+        self.async_write_ha_state()
+        return result
+
+    async def _async_scheduled_start_timer(self, _now=None) -> None:
+        """Check the scheduled start on timer"""
+        previous_lead_time = self._predicted_lead_time
+        result = await self._async_check_scheduled_start()
+        if result or self._predicted_lead_time != previous_lead_time:
+            self.async_write_ha_state()
+
+    async def _async_check_scheduled_start(self) -> dict[str, Any] | None:
+        """
+        Start scheduler mode on enslaved thermostats whose predicted lead time is reached and
+        return the result of the calls (or None if no enslaved thermostat started).
+        """
+        if not self._scheduled_start:
+            return None
+        scheduled_start = self._scheduled_start
+        remaining = (scheduled_start["start_at"] - dt_util.utcnow()).total_seconds()
+        lead_times = {
+            entity_id: self._predict_lead_time(entity_id, scheduled_start["temperature"])
+            for entity_id in scheduled_start["pending"]
+        }
+        known_lead_times = [lead_time for lead_time in lead_times.values() if lead_time is not None]
+        self._predicted_lead_time = round(max(known_lead_times)) if known_lead_times else None
+        due = [
+            entity_id
+            for entity_id, lead_time in lead_times.items()
+            if remaining <= (lead_time or 0)
+        ]
+        if not due:
+            return None
+        log.debug("Start scheduler mode on %s (%ds before scheduled start)", due, remaining)
+        scheduled_start["pending"] = [
+            entity_id for entity_id in scheduled_start["pending"] if entity_id not in due
+        ]
+        if not scheduled_start["pending"]:
+            # All enslaved thermostats started: the schedulable thermostat is now in this state
+            self._async_cancel_scheduled_start()
+            self._target_temp = scheduled_start["temperature"]
+            self._hvac_mode = scheduled_start["hvac_mode"]
+        return await self._async_fan_out(
+            SERVICE_START_SCHEDULER_MODE,
+            {
+                entity_id: {
+                    "temperature": scheduled_start["temperature"],
+                    "hvac_mode": scheduled_start["hvac_mode"],
+                }
+                for entity_id in due
+            },
+        )
+
+    def _predict_lead_time(self, entity_id, temperature):
+        """
+        Return the predicted lead time (in seconds) of an enslaved thermostat to reach the specified
+        temperature (limited to max_preheat), or None if unknown.
+        """
+        entity = self._async_get_enslaved_entity(entity_id)
+        if entity is None or not hasattr(entity, "predicted_lead_time"):
+            return None
+        lead_time = entity.predicted_lead_time(temperature)
+        if lead_time is None:
+            return None
+        return min(lead_time, self._max_preheat.total_seconds())
+
+    @callback
+    def _async_cancel_scheduled_start(self) -> bool:
+        """Cancel the scheduled start (if any) and return True if it was"""
+        for cancel in self._cancel_scheduled_start:
+            cancel()
+        self._cancel_scheduled_start = []
+        cancelled = self._scheduled_start is not None
+        self._scheduled_start = None
+        self._predicted_lead_time = None
+        return cancelled
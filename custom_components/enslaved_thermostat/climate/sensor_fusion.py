@@ -0,0 +1,92 @@
+"""Fusion of the temperature of several sensors for enslaved thermostat"""
+import time
+
+from ..const import SensorFusionMethod
+
+
+class SensorFusion:
+    """
+    Incremental fusion of the temperature of several sensors: mean (optionally weighted), min or
+    max of the last known values of the sensors, ignoring the ones not reported since stale_after
+    seconds.
+
+    Note: Home Assistant does not fire state change events when a sensor reports the same value, so
+    the optional last_reported callable is used to retrieve the timestamp of the last report of a
+    sensor before ignoring its value.
+    """
+
+    def __init__(
+        self,
+        entity_ids,
+        method=SensorFusionMethod.MEAN,
+        weights=None,
+        stale_after=None,
+        last_reported=None,
+    ):
+        """Initialize the sensor fusion."""
+        self.entity_ids = entity_ids
+        self.method = method
+        self.stale_after = stale_after
+        self._last_reported = last_reported
+        self._weights = {entity_id: (weights or {}).get(entity_id, 1.0) for entity_id in entity_ids}
+        self._values = {}
+        self._weighted_sum = 0.0
+        self._weight_sum = 0.0
+
+    def has_value(self, entity_id: str) -> bool:
+        """Check if a value is known for the specified sensor"""
+        return entity_id in self._values
+
+    def update(
+        self, entity_id: str, value: float | None, reported_at: float | None = None
+    ) -> float | None:
+        """
+        Update the value of a sensor (None if it is unavailable), reported at the specified
+        timestamp (default: now), and return the fused temperature (None if no sensor value is
+        available).
+        """
+        if entity_id not in self._weights:
+            return self.value()
+        self._remove(entity_id)
+        if value is not None:
+            weight = self._weights[entity_id]
+            self._values[entity_id] = (
+                value,
+                reported_at if reported_at is not None else time.time(),
+            )
+            self._weighted_sum += weight * value
+            self._weight_sum += weight
+        return self.value()
+
+    def value(self) -> float | None:
+        """Return the fused temperature (None if no sensor value is available)"""
+        if self.stale_after:
+            limit = time.time() - self.stale_after
+            for entity_id, (value, reported_at) in list(self._values.items()):
+                if reported_at >= limit:
+                    continue
+                if self._last_reported is not None:
+                    reported_at = self._last_reported(entity_id)
+                    if reported_at is not None and reported_at >= limit:
+                        self._values[entity_id] = (value, reported_at)
+                        continue
+                self._remove(entity_id)
+        if not self._values:
+            return None
+        if self.method == SensorFusionMethod.MIN:
+            return min(value for value, _ in self._values.values())
+        if self.method == SensorFusionMethod.MAX:
+            return max(value for value, _ in self._values.values())
+        return self._weighted_sum / self._weight_sum
+
+    def _remove(self, entity_id: str) -> None:
+        """Remove the known value of a sensor"""
+        if (known := self._values.pop(entity_id, None)) is None:
+            return
+        if not self._values:
+            # Reset sums to avoid accumulating floating point errors
+            self._weighted_sum = self._weight_sum = 0.0
+            return
+        weight = self._weights[entity_id]
+        self._weighted_sum -= weight * known[0]
+        self._weight_sum -= weight
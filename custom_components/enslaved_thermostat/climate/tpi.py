@@ -0,0 +1,158 @@
+"""Time-proportional (TPI) heating engine for enslaved thermostats"""
+import asyncio
+import heapq
+import logging
+import time
+from datetime import timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+
+from .. import DOMAIN
+from ..const import CONF_TPI_CYCLE, DATA_CONFIG, DATA_TPI_SCHEDULER, DEFAULT_TPI_CYCLE
+
+log = logging.getLogger(__name__)
+
+
+@callback
+def async_get_tpi_scheduler(hass: HomeAssistant) -> "TpiScheduler":
+    """Retrieve (or create) the integration-wide TPI scheduler"""
+    data = hass.data.setdefault(DOMAIN, {})
+    if DATA_TPI_SCHEDULER not in data:
+        cycle = data.get(DATA_CONFIG, {}).get(CONF_TPI_CYCLE, DEFAULT_TPI_CYCLE)
+        data[DATA_TPI_SCHEDULER] = TpiScheduler(hass, cycle)
+    return data[DATA_TPI_SCHEDULER]
+
+
+class TpiScheduler:
+    """
+    Integration-wide scheduler of time-proportional heating cycles.
+
+    At the start of each cycle, the duty ratio of all TPI zones is computed in one pass: heaters of
+    zones with a positive ratio are turned on and their turn off edges are put on one shared
+    timeline, handled by only one timer (whatever the number of zones).
+
+    Zones have to implement the tpi_duty_ratio() and async_tpi_set_heater() methods.
+    """
+
+    def __init__(self, hass: HomeAssistant, cycle: timedelta):
+        """Initialize the TPI scheduler."""
+        self.hass = hass
+        self.cycle = cycle
+        self._zones = set()
+        self._computed_zones = set()
+        self._cycle_start = None
+        # Turn off edges: heap of (time, sequence, zone) and current turn off time of each zone
+        # (heap entries not matching the current turn off time of the zone are obsolete)
+        self._edges = []
+        self._edge_times = {}
+        self._edge_sequence = 0
+        self._cancel_cycle = None
+        self._cancel_edge = None
+
+    @callback
+    def async_add_zone(self, zone) -> CALLBACK_TYPE:
+        """Add a zone to the scheduler and return the function to remove it"""
+        self._zones.add(zone)
+        if self._cancel_cycle is None:
+            log.debug("Start TPI cycles (%s)", self.cycle)
+            self._cancel_cycle = async_track_time_interval(
+                self.hass, self._async_run_cycle, self.cycle
+            )
+            self._cycle_start = time.monotonic()
+
+        @callback
+        def _async_remove_zone() -> None:
+            self._zones.discard(zone)
+            self._computed_zones.discard(zone)
+            self._edge_times.pop(zone, None)
+            if not self._zones:
+                self._async_stop()
+
+        return _async_remove_zone
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop TPI cycles (no more zones)"""
+        log.debug("Stop TPI cycles")
+        if self._cancel_cycle:
+            self._cancel_cycle()
+            self._cancel_cycle = None
+        if self._cancel_edge:
+            self._cancel_edge()
+            self._cancel_edge = None
+        self._edges.clear()
+        self._edge_times.clear()
+
+    async def _async_run_cycle(self, _now=None) -> None:
+        """Start a new cycle: compute the duty ratio of all zones and switch their heater"""
+        self._cycle_start = time.monotonic()
+        self._computed_zones.clear()
+        self._edges.clear()
+        self._edge_times.clear()
+        await asyncio.gather(*[self._async_schedule_zone(zone) for zone in list(self._zones)])
+        self._async_schedule_next_edge()
+
+    async def async_refresh_zone(self, zone) -> None:
+        """
+        Recompute the duty ratio of a zone in the current cycle (for instance, after a change of
+        its target temperature or on its first known temperature).
+        """
+        if zone not in self._zones:
+            return
+        await self._async_schedule_zone(zone)
+        self._async_schedule_next_edge()
+
+    def is_computed(self, zone) -> bool:
+        """Check if the duty ratio of a zone is already computed in the current cycle"""
+        return zone in self._computed_zones
+
+    async def _async_schedule_zone(self, zone) -> None:
+        """Compute the duty ratio of a zone, switch its heater and put its turn off edge"""
+        ratio = zone.tpi_duty_ratio()
+        if ratio is not None:
+            self._computed_zones.add(zone)
+        on_time = (ratio or 0) * self.cycle.total_seconds()
+        off_at = self._cycle_start + on_time
+        self._edge_times.pop(zone, None)
+        if off_at <= time.monotonic():
+            await zone.async_tpi_set_heater(False)
+            return
+        if ratio < 1:
+            self._edge_sequence += 1
+            self._edge_times[zone] = off_at
+            heapq.heappush(self._edges, (off_at, self._edge_sequence, zone))
+        await zone.async_tpi_set_heater(True)
+
+    @callback
+    def _async_schedule_next_edge(self) -> None:
+        """Arm the shared timer on the next turn off edge"""
+        if self._cancel_edge:
+            self._cancel_edge()
+            self._cancel_edge = None
+        while self._edges:
+            off_at, _, zone = self._edges[0]
+            if self._edge_times.get(zone) == off_at:
+                break
+            # Obsolete edge
+            heapq.heappop(self._edges)
+        if not self._edges:
+            return
+        self._cancel_edge = async_call_later(
+            self.hass,
+            max(0, self._edges[0][0] - time.monotonic()),
+            HassJob(self._async_process_edges),
+        )
+
+    async def _async_process_edges(self, _now=None) -> None:
+        """Turn off heaters of zones whose edge is reached"""
+        self._cancel_edge = None
+        now = time.monotonic()
+        zones = []
+        while self._edges and self._edges[0][0] <= now:
+            off_at, _, zone = heapq.heappop(self._edges)
+            if self._edge_times.get(zone) == off_at:
+                del self._edge_times[zone]
+                zones.append(zone)
+        await asyncio.gather(*[zone.async_tpi_set_heater(False) for zone in zones])
+        self._async_schedule_next_edge()
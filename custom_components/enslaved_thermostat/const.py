@@ -1,7 +1,10 @@
 """Component constants"""
 
+from datetime import timedelta
 from enum import StrEnum
 
+DOMAIN = "enslaved_thermostat"
+
 DEFAULT_ENSLAVED_THERMOSTAT_NAME = "Enslaved Thermostat"
 DEFAULT_MASTER_THERMOSTAT_NAME = "Master Thermostat"
 DEFAULT_SCHEDULABLE_THERMOSTAT_NAME = "Schedulable Thermostat"
@@ -11,6 +14,57 @@ CONF_TYPE = "type"
 CONF_ENSLAVED_THERMOSTATS = "enslaved_thermostats"
 CONF_INITIAL_MANUAL_TARGET_TEMP = "initial_manual_target_temp"
 CONF_INITIAL_MANUAL_HVAC_MODE = "initial_manual_hvac_mode"
+CONF_SENSOR_FILTER = "sensor_filter"
+CONF_SENSOR_FILTER_WINDOW = "sensor_filter_window"
+CONF_SENSOR_FILTER_ALPHA = "sensor_filter_alpha"
+CONF_SENSOR_MIN_INTERVAL = "sensor_min_interval"
+CONF_SENSOR_FUSION = "sensor_fusion"
+CONF_SENSOR_WEIGHTS = "sensor_weights"
+CONF_SENSOR_STALE_AFTER = "sensor_stale_after"
+CONF_CONTROL_MODE = "control_mode"
+CONF_TPI_COEF = "tpi_coef"
+CONF_TPI_CYCLE = "tpi_cycle"
+CONF_FLEET_CONTROL = "fleet_control"
+CONF_FLEET_INTERVAL = "fleet_interval"
+CONF_UNRECORDED_ATTRIBUTES = "unrecorded_attributes"
+CONF_MAX_PREHEAT = "max_preheat"
+CONF_MEMBER_CALL_TIMEOUT = "member_call_timeout"
+CONF_MEMBER_FAILURE_THRESHOLD = "member_failure_threshold"
+CONF_MEMBER_COOL_DOWN = "member_cool_down"
+CONF_TRACE = "trace"
+CONF_TRACE_PATH = "trace_path"
+CONF_TRACE_SAMPLE_RATE = "trace_sample_rate"
+CONF_TRACE_MAX_SIZE = "trace_max_size"
+
+DEFAULT_SENSOR_FILTER_WINDOW = 5
+DEFAULT_SENSOR_FILTER_ALPHA = 0.3
+DEFAULT_TPI_COEF = 0.6
+DEFAULT_TPI_CYCLE = timedelta(minutes=10)
+DEFAULT_FLEET_INTERVAL = timedelta(seconds=30)
+DEFAULT_MAX_PREHEAT = timedelta(hours=3)
+DEFAULT_MEMBER_CALL_TIMEOUT = timedelta(seconds=10)
+DEFAULT_MEMBER_FAILURE_THRESHOLD = 3
+DEFAULT_MEMBER_COOL_DOWN = timedelta(minutes=5)
+DEFAULT_PROFILE_DURATION = timedelta(minutes=1)
+DEFAULT_PROFILE_PATH = "enslaved_thermostat_profile.json"
+DEFAULT_TRACE_PATH = "enslaved_thermostat_trace.jsonl"
+DEFAULT_TRACE_SAMPLE_RATE = 1.0
+DEFAULT_TRACE_MAX_SIZE = 10 * 1024 * 1024
+
+# Keys of integration data stored in hass.data[DOMAIN]
+DATA_CONFIG = "config"
+DATA_TPI_SCHEDULER = "tpi_scheduler"
+DATA_FLEET_CONTROLLER = "fleet_controller"
+DATA_STARTUP_PROFILE = "startup_profile"
+DATA_HOT_PATH_PROFILER = "hot_path_profiler"
+DATA_METRICS = "metrics"
+DATA_DECISION_TRACE = "decision_trace"
+DATA_WS_RATE_LIMITERS = "ws_rate_limiters"
+
+# Dispatcher signals of the metrics registry
+SIGNAL_METRICS_UPDATED = "enslaved_thermostat_metrics_updated"
+SIGNAL_METRICS_GROUP_ADDED = "enslaved_thermostat_metrics_group_added"
+SIGNAL_METRICS_GROUP_REMOVED = "enslaved_thermostat_metrics_group_removed"
 
 ATTR_ENSLAVED_MODE = "enslaved_mode"
 ATTR_ENSLAVED_TARGET_TEMP = "enslaved_target_temp"
@@ -21,6 +75,55 @@ ATTR_ENSLAVED_SCHEDULER_PREV_HVAC_MODE = "scheduler_previous_hvac_mode"
 ATTR_MANUAL_TARGET_TEMP = "manual_target_temp"
 ATTR_MANUAL_HAVC_MODE = "manual_hvac_mode"
 ATTR_SCHEDULER_PREV_STATE = "scheduler_previous_state"
+ATTR_GROUP_SNAPSHOT = "group_snapshot"
+ATTR_HEATING_RATE = "heating_rate"
+ATTR_COOLING_RATE = "cooling_rate"
+ATTR_SCHEDULED_START = "scheduled_start"
+ATTR_PREDICTED_LEAD_TIME = "predicted_lead_time"
+ATTR_MEMBER_CIRCUITS = "member_circuits"
+ATTR_STORED_DATA_VERSION = "version"
+
+# Version of the extra stored data format (data stored without version use the legacy format with
+# the scheduler previous state stored as a dict)
+STORED_DATA_VERSION = 2
+
+# State attributes of enslaved thermostats captured by group snapshot (in addition to their
+# current target temperature and HVAC mode)
+ENSLAVED_STATE_SNAPSHOT_ATTRS = [
+    ATTR_ENSLAVED_MODE,
+    ATTR_ENSLAVED_TARGET_TEMP,
+    ATTR_ENSLAVED_HVAC_MODE,
+    ATTR_MANUAL_TARGET_TEMP,
+    ATTR_MANUAL_HAVC_MODE,
+    ATTR_ENSLAVED_SCHEDULER_PREV_TARGET_TEMP,
+    ATTR_ENSLAVED_SCHEDULER_PREV_HVAC_MODE,
+]
+
+
+# Custom state attributes of enslaved thermostats that could be excluded from the recorder
+ENSLAVED_STATE_ATTRS = [
+    ATTR_ENSLAVED_MODE,
+    ATTR_ENSLAVED_TARGET_TEMP,
+    ATTR_ENSLAVED_HVAC_MODE,
+    ATTR_ENSLAVED_IN_SCHEDULER_MODE,
+    ATTR_ENSLAVED_SCHEDULER_PREV_TARGET_TEMP,
+    ATTR_ENSLAVED_SCHEDULER_PREV_HVAC_MODE,
+    ATTR_MANUAL_TARGET_TEMP,
+    ATTR_MANUAL_HAVC_MODE,
+    ATTR_HEATING_RATE,
+    ATTR_COOLING_RATE,
+]
+
+# Custom state attributes excluded from the recorder by default: they are only useful to restore
+# the thermostat state and are already stored with it (or change often, as the learned rates)
+DEFAULT_UNRECORDED_ATTRIBUTES = [
+    ATTR_ENSLAVED_SCHEDULER_PREV_TARGET_TEMP,
+    ATTR_ENSLAVED_SCHEDULER_PREV_HVAC_MODE,
+    ATTR_MANUAL_TARGET_TEMP,
+    ATTR_MANUAL_HAVC_MODE,
+    ATTR_HEATING_RATE,
+    ATTR_COOLING_RATE,
+]
 
 
 class EnslavedType(StrEnum):
@@ -47,6 +150,57 @@ class EnslavedMode(StrEnum):
 ENSLAVED_MODES = [cls.value for cls in EnslavedMode]
 DEFAULT_ENSLAVED_MODE = EnslavedMode.MANUAL
 
+
+class SensorFilter(StrEnum):
+    """Filters of sensor temperature values for enslaved thermostat devices."""
+
+    # None: use raw sensor values
+    NONE = "none"
+
+    # EMA: exponential moving average of sensor values
+    EMA = "ema"
+
+    # Median: median of the last sensor values
+    MEDIAN = "median"
+
+
+class SensorFusionMethod(StrEnum):
+    """Fusion methods of the temperature of several sensors for enslaved thermostat devices."""
+
+    # Mean: (weighted) mean of the sensors temperature
+    MEAN = "mean"
+
+    # Min: lowest sensors temperature
+    MIN = "min"
+
+    # Max: highest sensors temperature
+    MAX = "max"
+
+
+class ControlMode(StrEnum):
+    """Heater control modes for enslaved thermostat devices."""
+
+    # Hysteresis: turn heater on/off regarding cold/hot tolerance (as a generic thermostat)
+    HYSTERESIS = "hysteresis"
+
+    # TPI: time-proportional heating, the heater is on during a part of each cycle proportional to
+    # the difference between target and current temperatures
+    TPI = "tpi"
+
+
+class CircuitState(StrEnum):
+    """States of the circuit breaker of calls to a member of master and schedulable thermostats."""
+
+    # Closed: calls are allowed
+    CLOSED = "closed"
+
+    # Open: calls are skipped until the end of the cool down
+    OPEN = "open"
+
+    # Half-open: one probe call is allowed to check if the member responds again
+    HALF_OPEN = "half_open"
+
+
 SERVICE_SET_ENSLAVED_MODE = "set_enslaved_mode"
 SERVICE_SET_ENSLAVED_TARGET_TEMP = "set_enslaved_target_temperature"
 SERVICE_SET_ENSLAVED_HVAC_MODE = "set_enslaved_hvac_mode"
@@ -54,3 +208,13 @@ SERVICE_START_SCHEDULER_MODE = "start_scheduler_mode"
 SERVICE_STOP_SCHEDULER_MODE = "stop_scheduler_mode"
 SERVICE_SET_MANUAL_STATE = "set_manual_state"
 SERVICE_RESTORE_MANUAL_STATE = "restore_manual_state"
+SERVICE_RESTORE_ENSLAVED_STATE = "restore_enslaved_state"
+SERVICE_SNAPSHOT_GROUP = "snapshot_group"
+SERVICE_RESTORE_GROUP = "restore_group"
+SERVICE_SCHEDULE_SCHEDULER_MODE = "schedule_scheduler_mode"
+SERVICE_UPDATE_SCHEDULER_TARGET = "update_scheduler_target"
+SERVICE_PROFILE = "profile"
+
+WS_TYPE_SUBSCRIBE_GROUP = "enslaved_thermostat/subscribe_group"
+WS_TYPE_STARTUP_PROFILE = "enslaved_thermostat/startup_profile"
+DEFAULT_WS_MIN_INTERVAL = 1.0
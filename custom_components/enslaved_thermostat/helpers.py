@@ -0,0 +1,18 @@
+"""Helpers for enslaved thermostat integration"""
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import async_get_platforms
+
+from . import DOMAIN
+
+
+@callback
+def async_get_entity(hass: HomeAssistant, entity_id: str) -> Entity | None:
+    """Retrieve one of our climate entity object from its entity ID (or None if not found)"""
+    for platform in async_get_platforms(hass, DOMAIN):
+        if platform.domain != Platform.CLIMATE:
+            continue
+        if (entity := platform.entities.get(entity_id)) is not None:
+            return entity
+    return None
@@ -0,0 +1,207 @@
+"""Performance metrics of enslaved thermostat integration"""
+import bisect
+import logging
+from collections import deque
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+
+from . import DOMAIN
+from .const import (
+    DATA_METRICS,
+    SIGNAL_METRICS_GROUP_ADDED,
+    SIGNAL_METRICS_GROUP_REMOVED,
+    SIGNAL_METRICS_UPDATED,
+)
+
+log = logging.getLogger(__name__)
+
+# Interval between two computations of the exposed metrics (the counters are per minute)
+METRICS_INTERVAL = timedelta(minutes=1)
+# Number of per minute counters kept to compute the hourly metrics
+METRICS_HISTORY = 60
+# Upper bounds (in seconds) of the buckets of the latency histograms (plus an overflow bucket)
+LATENCY_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10)
+
+# Counters of an entity
+COUNTERS = (
+    "events_received",
+    "events_skipped",
+    "state_writes",
+    "failed_calls",
+    "heater_toggles",
+)
+
+
+@callback
+def async_get_metrics(hass: HomeAssistant) -> "MetricsRegistry":
+    """Retrieve (or create) the integration metrics registry"""
+    data = hass.data.setdefault(DOMAIN, {})
+    if DATA_METRICS not in data:
+        data[DATA_METRICS] = MetricsRegistry(hass)
+    return data[DATA_METRICS]
+
+
+class LatencyHistogram:
+    """Latency histogram with fixed buckets (see LATENCY_BUCKETS)"""
+
+    __slots__ = ("counts",)
+
+    def __init__(self, counts=None):
+        """Initialize the histogram."""
+        self.counts = counts or [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, value: float) -> None:
+        """Record a latency (in seconds)"""
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Merge the counts of another histogram in this one"""
+        for idx, count in enumerate(other.counts):
+            self.counts[idx] += count
+
+    def percentile(self, percent: float) -> float | None:
+        """
+        Return the estimated percentile (in seconds: the upper bound of the matching bucket), or
+        None if no latency recorded.
+        """
+        total = sum(self.counts)
+        if not total:
+            return None
+        rank = total * percent / 100
+        seen = 0
+        for idx, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                break
+        return LATENCY_BUCKETS[min(idx, len(LATENCY_BUCKETS) - 1)]
+
+
+class EntityMetrics:
+    """
+    Performance counters of an entity, incremented in place on hot paths and rolled every minute
+    in a one hour history.
+    """
+
+    __slots__ = COUNTERS + ("fan_out_latency", "history")
+
+    def __init__(self):
+        """Initialize the counters."""
+        for counter in COUNTERS:
+            setattr(self, counter, 0)
+        self.fan_out_latency = LatencyHistogram()
+        # Counters (and latency histogram) of the last minutes
+        self.history = deque(maxlen=METRICS_HISTORY)
+
+    def roll(self) -> None:
+        """Roll the counters of the last minute in the history"""
+        counts = {counter: getattr(self, counter) for counter in COUNTERS}
+        counts["fan_out_latency"] = self.fan_out_latency
+        self.history.append(counts)
+        for counter in COUNTERS:
+            setattr(self, counter, 0)
+        self.fan_out_latency = LatencyHistogram()
+
+    def last_minute(self, counter: str) -> int:
+        """Return the value of a counter during the last minute"""
+        return self.history[-1][counter] if self.history else 0
+
+    def last_hour(self, counter: str) -> int:
+        """Return the value of a counter during the last hour"""
+        return sum(counts[counter] for counts in self.history)
+
+
+class MetricsRegistry:
+    """
+    Integration-wide registry of the performance metrics of enslaved thermostat entities. Every
+    minute, the metrics exposed by the diagnostic sensors of each master/schedulable thermostat
+    (group) and of the integration as a whole are computed from the counters of the entities.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the metrics registry."""
+        self.hass = hass
+        self._entities = {}
+        self.groups = {}
+        self._values = {}
+        self._cancel_interval = None
+
+    @callback
+    def async_add_entity(self, entity) -> EntityMetrics:
+        """Add an entity (and return its counters)"""
+        metrics = self._entities.setdefault(entity.entity_id, EntityMetrics())
+        if hasattr(entity, "enslaved_thermostats"):
+            self.groups[entity.entity_id] = entity
+            async_dispatcher_send(self.hass, SIGNAL_METRICS_GROUP_ADDED, entity)
+        return metrics
+
+    @callback
+    def async_remove_entity(self, entity_id: str) -> None:
+        """Remove an entity"""
+        self._entities.pop(entity_id, None)
+        if self.groups.pop(entity_id, None) is not None:
+            self._values.pop(entity_id, None)
+            async_dispatcher_send(self.hass, SIGNAL_METRICS_GROUP_REMOVED, entity_id)
+
+    @callback
+    def async_start(self) -> None:
+        """Start computing the exposed metrics"""
+        if self._cancel_interval is None:
+            log.debug("Start computing metrics (%s)", METRICS_INTERVAL)
+            self._cancel_interval = async_track_time_interval(
+                self.hass, self._async_compute, METRICS_INTERVAL
+            )
+            self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    @callback
+    def _async_stop(self, _event: Event) -> None:
+        """Stop computing the exposed metrics on Home Assistant stop"""
+        if self._cancel_interval:
+            self._cancel_interval()
+            self._cancel_interval = None
+
+    def value(self, key: str, group_id: str | None = None) -> Any:
+        """Return the last computed value of a metric of a group (or of the integration)"""
+        return self._values.get(group_id, {}).get(key)
+
+    @callback
+    def _async_compute(self, _now=None) -> None:
+        """Roll the entities counters and compute the exposed metrics"""
+        for metrics in self._entities.values():
+            metrics.roll()
+        for group_id, group in self.groups.items():
+            self._values[group_id] = self._compute(
+                [self._entities[group_id]] if group_id in self._entities else [],
+                [
+                    self._entities[entity_id]
+                    for entity_id in group.enslaved_thermostats
+                    if entity_id in self._entities
+                ],
+            )
+        self._values[None] = self._compute(list(self._entities.values()), [])
+        async_dispatcher_send(self.hass, SIGNAL_METRICS_UPDATED)
+
+    @staticmethod
+    def _compute(own: list[EntityMetrics], members: list[EntityMetrics]) -> dict[str, Any]:
+        """
+        Compute the exposed metrics from the counters of the group (or all entities) and of its
+        members (state writes and heater toggles also include the ones of the members)
+        """
+        latency = LatencyHistogram()
+        for metrics in own:
+            if metrics.history:
+                latency.merge(metrics.history[-1]["fan_out_latency"])
+        p50, p95 = latency.percentile(50), latency.percentile(95)
+        return {
+            "events_received": sum(metrics.last_minute("events_received") for metrics in own),
+            "events_skipped": sum(metrics.last_minute("events_skipped") for metrics in own),
+            "state_writes": sum(metrics.last_minute("state_writes") for metrics in own + members),
+            "fan_out_latency_p50": round(p50 * 1000, 1) if p50 is not None else None,
+            "fan_out_latency_p95": round(p95 * 1000, 1) if p95 is not None else None,
+            "failed_calls": sum(metrics.last_hour("failed_calls") for metrics in own),
+            "heater_toggles": sum(metrics.last_hour("heater_toggles") for metrics in own + members),
+        }
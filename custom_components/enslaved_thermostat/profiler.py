@@ -0,0 +1,300 @@
+"""Startup and hot paths profiles of enslaved thermostat integration"""
+import asyncio
+import functools
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.core import (
+    HassJob,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+try:
+    from homeassistant.exceptions import ServiceValidationError
+except ImportError:
+    from homeassistant.exceptions import HomeAssistantError as ServiceValidationError
+
+from . import DOMAIN
+from .const import (
+    DATA_HOT_PATH_PROFILER,
+    DATA_STARTUP_PROFILE,
+    DEFAULT_PROFILE_DURATION,
+    DEFAULT_PROFILE_PATH,
+    SERVICE_PROFILE,
+)
+
+log = logging.getLogger(__name__)
+
+# Keys of the hot path spans currently running (in the current task)
+_running_spans: ContextVar[frozenset] = ContextVar(
+    "enslaved_thermostat_running_spans", default=frozenset()
+)
+
+
+@callback
+def async_get_startup_profile(hass: HomeAssistant) -> "StartupProfile":
+    """Retrieve (or create) the integration startup profile"""
+    data = hass.data.setdefault(DOMAIN, {})
+    if DATA_STARTUP_PROFILE not in data:
+        data[DATA_STARTUP_PROFILE] = StartupProfile()
+    return data[DATA_STARTUP_PROFILE]
+
+
+class StartupProfile:
+    """
+    Time spent by the integration during Home Assistant startup, per phase (integration setup,
+    platforms setup, services registration, entities addition...) and per entity.
+    """
+
+    def __init__(self):
+        """Initialize the startup profile."""
+        self._start = time.monotonic()
+        self._started_after = None
+        self._phases = {}
+        self._entities = {}
+
+    @contextmanager
+    def measure(self, phase: str, entity_id: str | None = None):
+        """Measure the time spent in a phase (optionally for a specific entity)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            count, total = self._phases.get(phase, (0, 0.0))
+            self._phases[phase] = (count + 1, total + elapsed)
+            if entity_id is not None:
+                phases = self._entities.setdefault(entity_id, {})
+                phases[phase] = phases.get(phase, 0.0) + elapsed
+
+    @callback
+    def async_hass_started(self) -> None:
+        """Record the delay between the integration setup and Home Assistant started"""
+        self._started_after = time.monotonic() - self._start
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the startup profile (durations in seconds)"""
+        return {
+            "started_after": (
+                round(self._started_after, 3) if self._started_after is not None else None
+            ),
+            "phases": {
+                phase: {"count": count, "total": round(total, 6)}
+                for phase, (count, total) in self._phases.items()
+            },
+            "entities": {
+                entity_id: {phase: round(elapsed, 6) for phase, elapsed in phases.items()}
+                for entity_id, phases in self._entities.items()
+            },
+        }
+
+
+@callback
+def async_get_hot_path_profiler(hass: HomeAssistant) -> "HotPathProfiler":
+    """Retrieve (or create) the integration hot paths profiler"""
+    data = hass.data.setdefault(DOMAIN, {})
+    if DATA_HOT_PATH_PROFILER not in data:
+        data[DATA_HOT_PATH_PROFILER] = HotPathProfiler()
+    return data[DATA_HOT_PATH_PROFILER]
+
+
+def profiled(span: str):
+    """
+    Decorator to measure the time spent in an entity method (sync or async) as a hot path span,
+    only when the hot paths profiler is enabled.
+    """
+
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                profiler = async_get_hot_path_profiler(self.hass)
+                if not profiler.enabled:
+                    return await func(self, *args, **kwargs)
+                with profiler.measure(span, self.entity_id):
+                    return await func(self, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            profiler = async_get_hot_path_profiler(self.hass)
+            if not profiler.enabled:
+                return func(self, *args, **kwargs)
+            with profiler.measure(span, self.entity_id):
+                return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class HotPathProfiler:
+    """
+    Time spent by the integration in its hot paths (members fan-out, events handling, state
+    attributes building, heater control...), per span and per entity, aggregated while enabled.
+
+    Note: nested spans of the same name and entity (overridden methods calling their parent one)
+    are only measured once.
+    """
+
+    def __init__(self):
+        """Initialize the hot paths profiler."""
+        self.enabled = False
+        self._started_at = None
+        self._spans = {}
+        self._cancel_stop = None
+
+    @contextmanager
+    def measure(self, span: str, entity_id: str | None = None):
+        """Measure the time spent in a span"""
+        key = (span, entity_id)
+        running = _running_spans.get()
+        if key in running:
+            yield
+            return
+        token = _running_spans.set(running | {key})
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            _running_spans.reset(token)
+            stats = self._spans.get(key)
+            if stats is None:
+                self._spans[key] = [1, elapsed, elapsed, elapsed]
+            else:
+                stats[0] += 1
+                stats[1] += elapsed
+                stats[2] = min(stats[2], elapsed)
+                stats[3] = max(stats[3], elapsed)
+
+    @callback
+    def async_start(self, hass: HomeAssistant, duration: float, path: str) -> None:
+        """Start profiling for the specified duration (in seconds), then write the report"""
+        log.info("Start profiling hot paths for %ss (report in %s)", duration, path)
+        self.enabled = True
+        self._started_at = dt_util.utcnow()
+        self._spans = {}
+
+        @callback
+        def _async_stop(_now) -> None:
+            self._cancel_stop = None
+            report = self.async_stop()
+            hass.async_add_executor_job(_write_report, path, report)
+
+        self._cancel_stop = async_call_later(hass, duration, HassJob(_async_stop))
+
+    @callback
+    def async_stop(self) -> dict[str, Any]:
+        """Stop profiling and return the report"""
+        if self._cancel_stop:
+            self._cancel_stop()
+            self._cancel_stop = None
+        self.enabled = False
+        return self.as_dict()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the report of the profiled spans (durations in seconds)"""
+        spans = {}
+        entities = {}
+        for (span, entity_id), stats in self._spans.items():
+            entities.setdefault(entity_id, {})[span] = _format_stats(*stats)
+            if span not in spans:
+                spans[span] = list(stats)
+                continue
+            spans[span][0] += stats[0]
+            spans[span][1] += stats[1]
+            spans[span][2] = min(spans[span][2], stats[2])
+            spans[span][3] = max(spans[span][3], stats[3])
+        return {
+            "started_at": self._started_at.isoformat() if self._started_at else None,
+            "stopped_at": dt_util.utcnow().isoformat(),
+            "spans": {span: _format_stats(*stats) for span, stats in spans.items()},
+            "entities": entities,
+        }
+
+
+def _format_stats(count: int, total: float, minimum: float, maximum: float) -> dict[str, Any]:
+    """Format the stats of a span in the report"""
+    return {
+        "count": count,
+        "total": round(total, 6),
+        "mean": round(total / count, 6),
+        "min": round(minimum, 6),
+        "max": round(maximum, 6),
+    }
+
+
+def _write_report(path: str, report: dict[str, Any]) -> None:
+    """Write the profile report to a file (run in executor, so errors are only logged)"""
+    try:
+        with open(path, "w", encoding="utf-8") as fd:
+            json.dump(report, fd, indent=2)
+    except (OSError, TypeError, ValueError) as err:
+        log.error("Fail to write hot paths profile report in %s: %s", path, err)
+        return
+    log.info("Hot paths profile report written in %s", path)
+
+
+def _get_report_path(hass: HomeAssistant, path: str | None) -> str:
+    """
+    Return the path of the profile report: a JSON file name in the configuration directory, or a
+    JSON file in a directory allowed by the allowlist_external_dirs configuration.
+    """
+    if not path:
+        return hass.config.path(DEFAULT_PROFILE_PATH)
+    if not path.endswith(".json"):
+        raise ServiceValidationError(f"Profile report path must be a JSON file (*.json): {path}")
+    if os.path.basename(path) == path:
+        return hass.config.path(path)
+    if not hass.config.is_allowed_path(path):
+        raise ServiceValidationError(
+            f"Profile report path is not allowed (see allowlist_external_dirs): {path}"
+        )
+    return path
+
+
+@callback
+def async_register_profile_service(hass: HomeAssistant) -> None:
+    """Register the service to profile the integration hot paths."""
+
+    async def async_profile(call: ServiceCall) -> ServiceResponse:
+        """Start profiling the integration hot paths."""
+        profiler = async_get_hot_path_profiler(hass)
+        if profiler.enabled:
+            raise ServiceValidationError("Hot paths profiling is already in progress")
+        duration = call.data["duration"].total_seconds()
+        path = _get_report_path(hass, call.data.get("path"))
+        profiler.async_start(hass, duration, path)
+        return {"path": path, "duration": duration}
+
+    log.debug("Register enslaved thermostats profile service")
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=vol.Schema(
+            {
+                vol.Optional("duration", default=DEFAULT_PROFILE_DURATION): vol.All(
+                    cv.time_period, cv.positive_timedelta
+                ),
+                vol.Optional("path"): cv.string,
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
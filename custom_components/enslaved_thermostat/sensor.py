@@ -0,0 +1,130 @@
+"""Diagnostic sensors exposing the performance metrics of enslaved thermostat integration."""
+import logging
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from . import DOMAIN
+from .const import SIGNAL_METRICS_GROUP_ADDED, SIGNAL_METRICS_GROUP_REMOVED, SIGNAL_METRICS_UPDATED
+from .metrics import MetricsRegistry, async_get_metrics
+
+log = logging.getLogger(__name__)
+
+INTEGRATION_NAME = "Enslaved Thermostat"
+
+METRIC_SENSORS = (
+    SensorEntityDescription(
+        key="events_received",
+        name="events received",
+        native_unit_of_measurement="events/min",
+    ),
+    SensorEntityDescription(
+        key="events_skipped",
+        name="events skipped",
+        native_unit_of_measurement="events/min",
+    ),
+    SensorEntityDescription(
+        key="state_writes",
+        name="state writes",
+        native_unit_of_measurement="writes/min",
+    ),
+    SensorEntityDescription(
+        key="fan_out_latency_p50",
+        name="fan-out latency p50",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+    ),
+    SensorEntityDescription(
+        key="fan_out_latency_p95",
+        name="fan-out latency p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+    ),
+    SensorEntityDescription(
+        key="failed_calls",
+        name="failed member calls",
+        native_unit_of_measurement="calls/h",
+    ),
+    SensorEntityDescription(
+        key="heater_toggles",
+        name="heater toggles",
+        native_unit_of_measurement="toggles/h",
+    ),
+)
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the metrics sensors (loaded by discovery from the integration setup)."""
+    if discovery_info is None:
+        return
+    registry = async_get_metrics(hass)
+
+    @callback
+    def _async_add_group_sensors(group) -> None:
+        async_add_entities(
+            [MetricSensor(registry, description, group) for description in METRIC_SENSORS]
+        )
+
+    async_add_entities([MetricSensor(registry, description) for description in METRIC_SENSORS])
+    for group in registry.groups.values():
+        _async_add_group_sensors(group)
+    async_dispatcher_connect(hass, SIGNAL_METRICS_GROUP_ADDED, _async_add_group_sensors)
+    registry.async_start()
+
+
+class MetricSensor(SensorEntity):
+    """Diagnostic sensor of a performance metric of a group (or of the integration)"""
+
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, registry: MetricsRegistry, description: SensorEntityDescription, group=None):
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._registry = registry
+        self._group_id = group.entity_id if group is not None else None
+        self._attr_name = (
+            f"{group.name if group is not None else INTEGRATION_NAME} {description.name}"
+        )
+        if group is None:
+            self._attr_unique_id = f"{DOMAIN}_{description.key}"
+        elif group.unique_id:
+            self._attr_unique_id = f"{group.unique_id}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added."""
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_METRICS_UPDATED, self.async_write_ha_state)
+        )
+        if self._group_id is not None:
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass, SIGNAL_METRICS_GROUP_REMOVED, self._async_group_removed
+                )
+            )
+
+    @callback
+    def _async_group_removed(self, entity_id: str) -> None:
+        """Remove the sensor with its group"""
+        if entity_id == self._group_id:
+            self.hass.async_create_task(self.async_remove())
+
+    @property
+    def native_value(self):
+        """Return the last computed value of the metric."""
+        return self._registry.value(self.entity_description.key, self._group_id)
@@ -0,0 +1,220 @@
+"""Decision trace of enslaved thermostat integration"""
+import json
+import logging
+import os
+import random
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Context, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from . import DOMAIN
+from .const import (
+    CONF_TRACE,
+    CONF_TRACE_MAX_SIZE,
+    CONF_TRACE_PATH,
+    CONF_TRACE_SAMPLE_RATE,
+    DATA_CONFIG,
+    DATA_DECISION_TRACE,
+    DEFAULT_TRACE_MAX_SIZE,
+    DEFAULT_TRACE_PATH,
+    DEFAULT_TRACE_SAMPLE_RATE,
+)
+
+log = logging.getLogger(__name__)
+
+# Interval between two writes of the buffered trace lines
+TRACE_FLUSH_INTERVAL = timedelta(seconds=10)
+# Number of buffered lines triggering a write before the next interval
+TRACE_FLUSH_SIZE = 500
+# Maximum number of buffered lines (next lines are dropped while a write is in progress)
+TRACE_MAX_BUFFERED = 10000
+# Number of rotated trace files kept
+TRACE_BACKUP_COUNT = 3
+# Number of context IDs whose root context ID is kept (to sample a causal chain as a whole)
+TRACE_MAX_CONTEXTS = 10000
+
+# Context of the event being handled in the current task (to trace the decisions it causes with its
+# causal chain, instead of the last context set on the entity)
+_event_context: ContextVar[Context | None] = ContextVar(
+    "enslaved_thermostat_trace_event_context", default=None
+)
+
+
+@contextmanager
+def event_context(context: Context | None):
+    """Trace the decisions taken in this block with the context of the event being handled"""
+    token = _event_context.set(context)
+    try:
+        yield
+    finally:
+        _event_context.reset(token)
+
+
+def get_event_context() -> Context | None:
+    """Return the context of the event being handled in the current task (if any)"""
+    return _event_context.get()
+
+
+@callback
+def async_get_decision_trace(hass: HomeAssistant) -> "DecisionTrace":
+    """Retrieve (or create) the integration decision trace"""
+    data = hass.data.setdefault(DOMAIN, {})
+    if DATA_DECISION_TRACE not in data:
+        config = data.get(DATA_CONFIG, {})
+        data[DATA_DECISION_TRACE] = DecisionTrace(
+            hass,
+            enabled=config.get(CONF_TRACE, False),
+            path=config.get(CONF_TRACE_PATH) or hass.config.path(DEFAULT_TRACE_PATH),
+            sample_rate=config.get(CONF_TRACE_SAMPLE_RATE, DEFAULT_TRACE_SAMPLE_RATE),
+            max_size=config.get(CONF_TRACE_MAX_SIZE, DEFAULT_TRACE_MAX_SIZE),
+        )
+    return data[DATA_DECISION_TRACE]
+
+
+class DecisionTrace:
+    """
+    Sampled trace of the decisions of the integration (enslaved mode changes, scheduler mode start
+    and stop, master broadcasts and members results, heater toggles), written as compact JSON lines
+    to a size-rotated local file.
+
+    Each line includes the ID of the Home Assistant context of the decision (and of its parent and
+    of the root of its causal chain) to follow the causal chain. The sampling is done per causal
+    chain (using a hash of the root context ID), so a chain is traced entirely or not at all. Lines
+    are buffered and written in executor, off the event loop.
+
+    Note: Home Assistant contexts only know their parent, so the root context ID of the recently
+    seen contexts is kept (a context whose parent was not seen has its parent as root).
+    """
+
+    def __init__(self, hass, enabled, path, sample_rate, max_size):
+        """Initialize the decision trace."""
+        self.hass = hass
+        self.enabled = enabled
+        self.path = path
+        self.sample_rate = sample_rate
+        self.max_size = max_size
+        self.dropped = 0
+        self._buffer = []
+        self._flush_task = None
+        self._cancel_interval = None
+        # Root context ID of the recently seen context IDs
+        self._roots = OrderedDict()
+
+    @callback
+    def async_start(self) -> None:
+        """Start writing buffered lines periodically (and on Home Assistant stop)"""
+        if not self.enabled or self._cancel_interval is not None:
+            return
+        log.debug("Start decision trace in %s (sample rate: %s)", self.path, self.sample_rate)
+        self._cancel_interval = async_track_time_interval(
+            self.hass, self._async_flush, TRACE_FLUSH_INTERVAL
+        )
+        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    def _get_root_id(self, context: Context | None) -> str | None:
+        """Return the ID of the root context of the causal chain of a context"""
+        if context is None:
+            return None
+        if (root_id := self._roots.get(context.id)) is not None:
+            self._roots.move_to_end(context.id)
+            return root_id
+        root_id = (
+            self._roots.get(context.parent_id, context.parent_id)
+            if context.parent_id
+            else context.id
+        )
+        self._roots[context.id] = root_id
+        if len(self._roots) > TRACE_MAX_CONTEXTS:
+            self._roots.popitem(last=False)
+        return root_id
+
+    def _is_sampled(self, root_id: str | None) -> bool:
+        """Check if a decision is sampled (based on the root context ID of its causal chain)"""
+        if self.sample_rate >= 1:
+            return True
+        if root_id is None:
+            return random.random() < self.sample_rate
+        return zlib.crc32(root_id.encode()) / 0x100000000 < self.sample_rate
+
+    @callback
+    def async_record(self, event: str, entity_id: str, context: Context | None, **data) -> None:
+        """Record a decision (if sampled)"""
+        if not self.enabled:
+            return
+        root_id = self._get_root_id(context)
+        if not self._is_sampled(root_id):
+            return
+        if len(self._buffer) >= TRACE_MAX_BUFFERED:
+            self.dropped += 1
+            return
+        self._buffer.append(
+            json.dumps(
+                {
+                    "ts": round(time.time(), 3),
+                    "event": event,
+                    "entity_id": entity_id,
+                    "context_id": context.id if context is not None else None,
+                    "parent_id": context.parent_id if context is not None else None,
+                    "root_id": root_id,
+                    **data,
+                },
+                separators=(",", ":"),
+                default=str,
+            )
+        )
+        if len(self._buffer) >= TRACE_FLUSH_SIZE:
+            self._async_flush()
+
+    @callback
+    def _async_flush(self, _now=None) -> None:
+        """Write the buffered lines in executor (if no write is already in progress)"""
+        if not self._buffer or self._flush_task is not None:
+            return
+        lines, self._buffer = self._buffer, []
+        self._flush_task = self.hass.async_add_executor_job(self._write, lines)
+        self._flush_task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task) -> None:
+        """Handle the end of a write"""
+        self._flush_task = None
+        if not task.cancelled() and task.exception() is not None:
+            log.error("Fail to write decision trace in %s: %s", self.path, task.exception())
+
+    async def _async_stop(self, _event: Event) -> None:
+        """Write the remaining buffered lines on Home Assistant stop"""
+        if self._cancel_interval:
+            self._cancel_interval()
+            self._cancel_interval = None
+        if self._flush_task is not None:
+            await self._flush_task
+        if self._buffer:
+            lines, self._buffer = self._buffer, []
+            await self.hass.async_add_executor_job(self._write, lines)
+        if self.dropped:
+            log.warning("%d decision trace lines dropped (write too slow)", self.dropped)
+
+    def _write(self, lines: list[str]) -> None:
+        """Append lines to the trace file, rotating it if too big (run in executor)"""
+        data = "\n".join(lines) + "\n"
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            size = 0
+        if size and size + len(data) > self.max_size:
+            self._rotate()
+        with open(self.path, "a", encoding="utf-8") as fd:
+            fd.write(data)
+
+    def _rotate(self) -> None:
+        """Rotate the trace file (keeping TRACE_BACKUP_COUNT files)"""
+        for idx in range(TRACE_BACKUP_COUNT - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{idx}"):
+                os.replace(f"{self.path}.{idx}", f"{self.path}.{idx + 1}")
+        os.replace(self.path, f"{self.path}.1")
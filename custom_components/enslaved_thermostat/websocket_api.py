@@ -0,0 +1,254 @@
+"""Websocket API of enslaved thermostat integration."""
+import logging
+import time
+from typing import Any
+
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.components.climate.const import ATTR_CURRENT_TEMPERATURE
+from homeassistant.core import HassJob, HomeAssistant, State, callback
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_call_later,
+    async_track_state_change_event,
+)
+from homeassistant.helpers.typing import EventType
+
+from .const import (
+    ATTR_ENSLAVED_IN_SCHEDULER_MODE,
+    ATTR_ENSLAVED_MODE,
+    ATTR_ENSLAVED_TARGET_TEMP,
+    DATA_WS_RATE_LIMITERS,
+    DEFAULT_WS_MIN_INTERVAL,
+    DOMAIN,
+    WS_TYPE_STARTUP_PROFILE,
+    WS_TYPE_SUBSCRIBE_GROUP,
+)
+from .helpers import async_get_entity
+from .profiler import async_get_startup_profile
+
+log = logging.getLogger(__name__)
+
+# State attributes of group members sent to websocket subscribers
+GROUP_MEMBER_FIELDS = (
+    ATTR_ENSLAVED_MODE,
+    ATTR_ENSLAVED_TARGET_TEMP,
+    ATTR_ENSLAVED_IN_SCHEDULER_MODE,
+    ATTR_CURRENT_TEMPERATURE,
+)
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register enslaved thermostat websocket commands."""
+    log.debug("Register enslaved thermostats websocket commands")
+    websocket_api.async_register_command(hass, websocket_subscribe_group)
+    websocket_api.async_register_command(hass, websocket_startup_profile)
+
+
+def _member_fields(state: State | None) -> dict[str, Any] | None:
+    """Extract the fields sent to subscribers from a group member state"""
+    if state is None:
+        return None
+    return {field: state.attributes.get(field) for field in GROUP_MEMBER_FIELDS}
+
+
+@callback
+def async_get_rate_limiter(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection
+) -> "ConnectionRateLimiter":
+    """Retrieve (or create) the rate limiter of the group subscriptions of a connection"""
+    limiters = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_WS_RATE_LIMITERS, {})
+    if connection not in limiters:
+        limiters[connection] = ConnectionRateLimiter(hass, connection)
+    return limiters[connection]
+
+
+class ConnectionRateLimiter:
+    """
+    Rate limiter of the group subscriptions messages of a websocket connection: whatever the number
+    of its subscriptions, the connection receives at most one message every min_interval seconds
+    (of the subscription to send). Subscriptions with pending changes are sent in turn, their
+    changes being batched meanwhile.
+    """
+
+    def __init__(self, hass, connection):
+        """Initialize the rate limiter."""
+        self.hass = hass
+        self.connection = connection
+        self._subscriptions = set()
+        # Subscriptions with pending changes (in arrival order)
+        self._waiting = {}
+        self._last_sent = 0.0
+        self._cancel_flush = None
+
+    @callback
+    def async_add(self, subscription: "GroupSubscription") -> None:
+        """Add a subscription of the connection"""
+        self._subscriptions.add(subscription)
+
+    @callback
+    def async_remove(self, subscription: "GroupSubscription") -> None:
+        """Remove a subscription of the connection (and the limiter with the last one)"""
+        self._subscriptions.discard(subscription)
+        self._waiting.pop(subscription, None)
+        if self._subscriptions:
+            return
+        if self._cancel_flush:
+            self._cancel_flush()
+            self._cancel_flush = None
+        self.hass.data[DOMAIN][DATA_WS_RATE_LIMITERS].pop(self.connection, None)
+
+    @callback
+    def async_message_sent(self) -> None:
+        """Record a message sent to the connection"""
+        self._last_sent = time.monotonic()
+
+    @callback
+    def async_schedule(self, subscription: "GroupSubscription") -> None:
+        """Send the pending changes of a subscription now or when the rate limit allows it"""
+        self._waiting[subscription] = None
+        self._async_schedule_flush()
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Flush the next waiting subscription now or when the rate limit allows it."""
+        if self._cancel_flush or not self._waiting:
+            return
+        subscription = next(iter(self._waiting))
+        delay = self._last_sent + subscription.min_interval - time.monotonic()
+        if delay <= 0:
+            self._async_flush()
+        else:
+            self._cancel_flush = async_call_later(self.hass, delay, HassJob(self._async_flush))
+
+    @callback
+    def _async_flush(self, _now=None) -> None:
+        """Send the pending changes of the next waiting subscription."""
+        self._cancel_flush = None
+        if self._waiting:
+            subscription = next(iter(self._waiting))
+            del self._waiting[subscription]
+            subscription.async_flush()
+        self._async_schedule_flush()
+
+
+class GroupSubscription:
+    """
+    Websocket subscription on the members of a master/schedulable thermostat.
+
+    A snapshot of all members is sent on subscription, then only the changed fields are sent,
+    batched and rate-limited per connection (see ConnectionRateLimiter).
+    """
+
+    def __init__(self, hass, connection, msg_id, entity_ids, min_interval):
+        """Initialize the subscription."""
+        self.hass = hass
+        self.connection = connection
+        self.msg_id = msg_id
+        self.entity_ids = entity_ids
+        self.min_interval = min_interval
+        self._last_fields = {}
+        self._pending = {}
+        self._limiter = async_get_rate_limiter(hass, connection)
+        self._unsub_track = None
+
+    @callback
+    def async_start(self) -> None:
+        """Send the snapshot of group members and start tracking their changes."""
+        self._limiter.async_add(self)
+        snapshot = {}
+        for entity_id in self.entity_ids:
+            fields = _member_fields(self.hass.states.get(entity_id))
+            self._last_fields[entity_id] = fields
+            snapshot[entity_id] = fields
+        self._send({"snapshot": snapshot})
+        self._unsub_track = async_track_state_change_event(
+            self.hass, self.entity_ids, self._async_member_changed
+        )
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Stop tracking group members changes."""
+        if self._unsub_track:
+            self._unsub_track()
+            self._unsub_track = None
+        self._limiter.async_remove(self)
+
+    @callback
+    def _async_member_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Handle group member state changed: compute and queue the changed fields."""
+        entity_id = event.data["entity_id"]
+        fields = _member_fields(event.data.get("new_state"))
+        last_fields = self._last_fields.get(entity_id)
+        self._last_fields[entity_id] = fields
+        if fields is None or last_fields is None:
+            if fields != last_fields:
+                self._pending[entity_id] = fields
+        else:
+            changes = {
+                field: value for field, value in fields.items() if last_fields.get(field) != value
+            }
+            if not changes:
+                return
+            self._pending.setdefault(entity_id, {}).update(changes)
+        if self._pending:
+            self._limiter.async_schedule(self)
+
+    @callback
+    def async_flush(self) -> None:
+        """Send pending changes to the subscriber (on rate limiter request)."""
+        if not self._pending:
+            return
+        changes, self._pending = self._pending, {}
+        self._send({"changes": changes})
+
+    def _send(self, data: dict[str, Any]) -> None:
+        """Send an event message to the subscriber."""
+        self._limiter.async_message_sent()
+        self.connection.send_message(websocket_api.event_message(self.msg_id, data))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_SUBSCRIBE_GROUP,
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("min_interval", default=DEFAULT_WS_MIN_INTERVAL): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+@callback
+def websocket_subscribe_group(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Subscribe to the members of a master/schedulable thermostat."""
+    group = async_get_entity(hass, msg["entity_id"])
+    if group is None or not hasattr(group, "enslaved_thermostats"):
+        connection.send_error(
+            msg["id"],
+            websocket_api.const.ERR_NOT_FOUND,
+            f"{msg['entity_id']} is not a master or schedulable thermostat",
+        )
+        return
+
+    subscription = GroupSubscription(
+        hass, connection, msg["id"], group.enslaved_thermostats, msg["min_interval"]
+    )
+    connection.subscriptions[msg["id"]] = subscription.async_unsubscribe
+    connection.send_result(msg["id"])
+    subscription.async_start()
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_STARTUP_PROFILE,
+    }
+)
+@callback
+def websocket_startup_profile(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the startup profile of the integration."""
+    connection.send_result(msg["id"], async_get_startup_profile(hass).as_dict())
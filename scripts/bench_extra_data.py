@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the enslaved thermostats extra stored data dumps
+
+Measure, for a fleet of enslaved thermostats, the time spent building and serializing their extra
+stored data (as done by the restore state helper on each periodic dump) and the memory used by the
+built objects, comparing the current flat serialization with the legacy implementation (plain
+dataclass, built by a round trip through the parent data and serialized using
+dataclasses.asdict()).
+
+Usage (from the repository root, in an environment with Home Assistant installed):
+
+    python scripts/bench_extra_data.py [--entities 1000] [--rounds 50]
+"""
+import argparse
+import dataclasses
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+from typing import Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# pylint: disable=wrong-import-position
+from homeassistant.components.climate import HVACMode  # noqa: E402
+from homeassistant.helpers.json import JSONEncoder  # noqa: E402
+from homeassistant.helpers.restore_state import ExtraStoredData  # noqa: E402
+
+from custom_components.enslaved_thermostat.climate.enslaved import (  # noqa: E402
+    EnslavedThermostatExtraStoredData,
+)
+
+# pylint: enable=wrong-import-position
+
+
+@dataclasses.dataclass
+class LegacyGenericExtraStoredData(ExtraStoredData):
+    """Legacy master thermostat extra stored data"""
+
+    manual_target_temp: float | None = None
+    manual_hvac_mode: HVACMode | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the extra stored data."""
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass
+class LegacyExtraStoredData(LegacyGenericExtraStoredData):
+    """Legacy enslaved thermostat extra stored data"""
+
+    enslaved_mode: str | None = None
+    enslaved_target_temp: float | None = None
+    enslaved_hvac_mode: HVACMode | None = None
+    scheduler_previous_state: dict | None = None
+    heating_rate: float | None = None
+    cooling_rate: float | None = None
+
+
+def build_legacy(idx):
+    """Build the legacy extra stored data of an entity"""
+    return LegacyExtraStoredData(
+        enslaved_mode="auto",
+        enslaved_target_temp=19 + idx % 3,
+        enslaved_hvac_mode=HVACMode.HEAT,
+        scheduler_previous_state={"temperature": 18, "hvac_mode": HVACMode.HEAT},
+        heating_rate=1.5,
+        cooling_rate=0.5,
+        **LegacyGenericExtraStoredData(
+            manual_target_temp=17, manual_hvac_mode=HVACMode.OFF
+        ).as_dict(),
+    )
+
+
+def build_current(idx):
+    """Build the current extra stored data of an entity"""
+    return EnslavedThermostatExtraStoredData(
+        manual_target_temp=17,
+        manual_hvac_mode=HVACMode.OFF,
+        enslaved_mode="auto",
+        enslaved_target_temp=19 + idx % 3,
+        enslaved_hvac_mode=HVACMode.HEAT,
+        scheduler_previous_target_temp=18,
+        scheduler_previous_hvac_mode=HVACMode.HEAT,
+        heating_rate=1.5,
+        cooling_rate=0.5,
+    )
+
+
+def dump(build, entities):
+    """Build and serialize the extra stored data of all entities (as a restore state dump)"""
+    return json.dumps([build(idx).as_dict() for idx in range(entities)], cls=JSONEncoder)
+
+
+def memory(build, entities):
+    """Return the memory (in bytes) allocated to keep the built extra stored data objects"""
+    tracemalloc.start()
+    objects = [build(idx) for idx in range(entities)]
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--entities", type=int, default=1000, help="Number of entities")
+    parser.add_argument("--rounds", type=int, default=50, help="Number of measured dumps")
+    args = parser.parse_args()
+
+    print(f"{args.entities} enslaved thermostats, best of {args.rounds} dumps")
+    for name, build in (("legacy", build_legacy), ("current", build_current)):
+        best = min(
+            timeit.repeat(
+                lambda build=build: dump(build, args.entities), number=1, repeat=args.rounds
+            )
+        )
+        print(
+            f"{name:>8}: dump {best * 1000:7.2f} ms, {len(dump(build, args.entities)):7d} bytes, "
+            f"objects {memory(build, args.entities):8d} bytes, "
+            f"has __dict__: {hasattr(build(0), '__dict__')}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the batched heater control of enslaved thermostats fleet
+
+Measure the time to evaluate the heater control decision of a fleet of zones, in one batch (using
+NumPy and the pure Python fallback) and per entity (as each generic thermostat does on its own),
+and check that all implementations return the same transitions.
+
+Usage (from the repository root, in an environment with Home Assistant installed):
+
+    python scripts/bench_fleet.py [--zones 100 1000 5000] [--rounds 20] [--dirty 0.1]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import timeit
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# pylint: disable=wrong-import-position
+from custom_components.enslaved_thermostat.climate import fleet  # noqa: E402
+
+# pylint: enable=wrong-import-position
+
+
+def build_fleet(zones, seed=0):
+    """Build the control parameters arrays of a random fleet (with some unknown temperatures)"""
+    rand = random.Random(seed)
+    return (
+        array(
+            "d", (math.nan if rand.random() < 0.02 else rand.uniform(14, 24) for _ in range(zones))
+        ),
+        array(
+            "d", (math.nan if rand.random() < 0.02 else rand.uniform(16, 22) for _ in range(zones))
+        ),
+        array("d", (rand.choice((0.1, 0.3, 0.5)) for _ in range(zones))),
+        array("d", (rand.choice((0.1, 0.3, 0.5)) for _ in range(zones))),
+        array("B", (rand.random() < 0.1 for _ in range(zones))),
+        array("B", (rand.random() < 0.9 for _ in range(zones))),
+        array("B", (rand.random() < 0.5 for _ in range(zones))),
+    )
+
+
+def evaluate_zone(cur, target, cold, hot, ac_mode, enabled, active):
+    """Evaluate the heater control decision of one zone (None: no transition)"""
+    if not enabled:
+        return False if active else None
+    if cur is None or target is None:
+        return None
+    too_cold = target >= cur + cold
+    too_hot = cur >= target + hot
+    if active:
+        if too_cold if ac_mode else too_hot:
+            return False
+    elif too_hot if ac_mode else too_cold:
+        return True
+    return None
+
+
+def per_entity(zones, indexes=None):
+    """Evaluate the zones one by one, each one reading its own parameters"""
+    turn_on, turn_off = [], []
+    cur, target, cold, hot, ac_mode, enabled, active = zones
+    for idx in range(len(cur)) if indexes is None else indexes:
+        on = evaluate_zone(
+            None if math.isnan(cur[idx]) else cur[idx],
+            None if math.isnan(target[idx]) else target[idx],
+            cold[idx],
+            hot[idx],
+            ac_mode[idx],
+            enabled[idx],
+            active[idx],
+        )
+        if on is not None:
+            (turn_on if on else turn_off).append(idx)
+    return turn_on, turn_off
+
+
+def batched_numpy(zones, indexes=None):
+    """Evaluate the zones in one batch using NumPy"""
+    # pylint: disable=protected-access
+    return fleet._np_evaluate_transitions(*zones, indexes)
+
+
+def batched_python(zones, indexes=None):
+    """Evaluate the zones in one batch using the pure Python fallback"""
+    # pylint: disable=protected-access
+    return fleet._py_evaluate_transitions(*zones, indexes)
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--zones", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--rounds", type=int, default=20, help="Number of measured evaluations")
+    parser.add_argument("--dirty", type=float, default=0.1, help="Ratio of dirty zones")
+    args = parser.parse_args()
+
+    implementations = {"per entity": per_entity, "python batch": batched_python}
+    if fleet.np is not None:
+        implementations["numpy batch"] = batched_numpy
+    else:
+        print("NumPy is not installed, only the pure Python implementations are measured")
+
+    for count in args.zones:
+        zones = build_fleet(count)
+        dirty = sorted(random.Random(1).sample(range(count), max(1, int(count * args.dirty))))
+        for indexes, label in ((None, "all zones"), (dirty, f"{len(dirty)} dirty zones")):
+            expected = per_entity(zones, indexes)
+            print(
+                f"{count} zones, {label} (turn on {len(expected[0])}, turn off "
+                f"{len(expected[1])}):"
+            )
+            for name, evaluate in implementations.items():
+                result = evaluate(zones, indexes)
+                assert result == expected, f"{name} result differs from per entity evaluation"
+                best = min(
+                    timeit.repeat(
+                        lambda evaluate=evaluate, indexes=indexes: evaluate(zones, indexes),
+                        number=1,
+                        repeat=args.rounds,
+                    )
+                )
+                print(f"  {name:>12}: {best * 1000:8.3f} ms")
+    print("All implementations return identical transitions")
+
+
+if __name__ == "__main__":
+    main()
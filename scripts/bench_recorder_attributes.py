@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Measure of the recorder database growth caused by the enslaved thermostats state attributes
+
+Simulate one day of a fleet of enslaved thermostats (temperature updates every 5 minutes, scheduler
+mode from 6:00 to 22:00, one manual change per day and heating and cooling rates learned from the
+temperature updates) and compute the number of rows and bytes
+written by the recorder in its states and state_attributes tables, with and without the custom
+state attributes excluded by default (see DEFAULT_UNRECORDED_ATTRIBUTES).
+
+Like the recorder, the state attributes are serialized without the attributes excluded by the
+climate component and the entity, and a state_attributes row is only written for a combination of
+attributes not already stored.
+
+Usage (from the repository root, in an environment with Home Assistant installed):
+
+    python scripts/bench_recorder_attributes.py [--thermostats 100]
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# pylint: disable=wrong-import-position
+from homeassistant.components.climate import HVACAction, HVACMode  # noqa: E402
+from homeassistant.const import (  # noqa: E402
+    ATTR_ATTRIBUTION,
+    ATTR_RESTORED,
+    ATTR_SUPPORTED_FEATURES,
+)
+from homeassistant.helpers.json import json_bytes  # noqa: E402
+
+from custom_components.enslaved_thermostat.climate.enslaved import EnslavedThermostat  # noqa: E402
+from custom_components.enslaved_thermostat.climate.heating_rate import (  # noqa: E402
+    HeatingRateEstimator,
+)
+from custom_components.enslaved_thermostat.const import DEFAULT_UNRECORDED_ATTRIBUTES  # noqa: E402
+
+# pylint: enable=wrong-import-position
+
+# Attributes excluded by the recorder from all domains
+ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
+
+# Interval between two temperature updates (in minutes)
+TEMPERATURE_INTERVAL = 5
+
+
+def round_rate(rate):
+    """Round a learned rate as exposed in the state attributes"""
+    return round(rate, 2) if rate is not None else None
+
+
+def simulate_day(idx):
+    """Yield the successive (state, attributes) of an enslaved thermostat during one day"""
+    rand = random.Random(idx)
+    temperature = round(rand.uniform(16, 19), 1)
+    target, hvac_mode, enslaved_mode = 17.0, HVACMode.HEAT, "auto"
+    manual_target, manual_hvac_mode = None, None
+    previous = None
+    rates = HeatingRateEstimator()
+    manual_at = rand.randrange(7 * 60, 21 * 60, TEMPERATURE_INTERVAL)
+    for minute in range(0, 24 * 60, TEMPERATURE_INTERVAL):
+        if minute == 6 * 60:
+            previous, target = {"temperature": target, "hvac_mode": hvac_mode}, 20.0
+        elif minute == 22 * 60:
+            target, previous = previous["temperature"], None
+        elif minute == manual_at and previous is None:
+            enslaved_mode, manual_target, manual_hvac_mode = "manual", target + 1, hvac_mode
+            target = manual_target
+        heating = temperature < target
+        new_temperature = round(
+            temperature + rand.choice((-0.1, 0, 0.1)) + (0.1 if heating else 0), 1
+        )
+        if new_temperature != temperature:
+            # The rates are learned on sensor changes
+            temperature = new_temperature
+            rates.update(temperature, heating, now=minute * 60)
+        yield hvac_mode, {
+            "hvac_modes": [HVACMode.HEAT, HVACMode.OFF],
+            "min_temp": 7,
+            "max_temp": 35,
+            "target_temp_step": 0.1,
+            "current_temperature": temperature,
+            "temperature": target,
+            "hvac_action": HVACAction.HEATING if heating else HVACAction.IDLE,
+            "manual_target_temp": manual_target,
+            "manual_hvac_mode": manual_hvac_mode,
+            "enslaved_mode": enslaved_mode,
+            "enslaved_target_temp": 17.0,
+            "enslaved_hvac_mode": HVACMode.HEAT,
+            "in_scheduler_mode": previous is not None,
+            "scheduler_previous_target_temp": previous["temperature"] if previous else None,
+            "scheduler_previous_hvac_mode": previous["hvac_mode"] if previous else None,
+            "heating_rate": round_rate(rates.heating_rate),
+            "cooling_rate": round_rate(rates.cooling_rate),
+            "friendly_name": f"Thermostat {idx}",
+            "supported_features": 385,
+        }
+
+
+def measure(thermostats, unrecorded):
+    """Return the states rows, state_attributes rows and bytes written during one day"""
+    exclude = (
+        ALL_DOMAIN_EXCLUDE_ATTRS
+        | EnslavedThermostat._entity_component_unrecorded_attributes  # pylint: disable=W0212
+        | unrecorded
+    )
+    states_rows = attributes_rows = attributes_bytes = 0
+    stored = set()
+    for idx in range(thermostats):
+        last = None
+        for state, attributes in simulate_day(idx):
+            if (state, attributes) == last:
+                # No state change event
+                continue
+            last = (state, attributes)
+            states_rows += 1
+            shared_attrs = json_bytes({k: v for k, v in attributes.items() if k not in exclude})
+            if shared_attrs not in stored:
+                stored.add(shared_attrs)
+                attributes_rows += 1
+                attributes_bytes += len(shared_attrs)
+    return states_rows, attributes_rows, attributes_bytes
+
+
+def main():
+    """Run the measure"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--thermostats", type=int, default=100, help="Number of thermostats")
+    args = parser.parse_args()
+
+    print(f"{args.thermostats} enslaved thermostats, one day:")
+    results = {}
+    for name, unrecorded in (
+        ("all attributes", frozenset()),
+        ("default unrecorded", frozenset(DEFAULT_UNRECORDED_ATTRIBUTES)),
+    ):
+        results[name] = measure(args.thermostats, unrecorded)
+        states_rows, attributes_rows, attributes_bytes = results[name]
+        print(
+            f"  {name:>18}: {states_rows} states rows, {attributes_rows} state_attributes rows, "
+            f"{attributes_bytes} bytes ({attributes_bytes / attributes_rows:.0f} bytes per row)"
+        )
+    before, after = results.values()
+    print(
+        f"  saved: {before[1] - after[1]} rows and {before[2] - after[2]} bytes per day "
+        f"({(before[2] - after[2]) / before[2]:.0%} of the state_attributes bytes)"
+    )
+
+
+if __name__ == "__main__":
+    main()
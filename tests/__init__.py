@@ -0,0 +1 @@
+"""Tests of enslaved thermostat integration."""
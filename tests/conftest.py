@@ -0,0 +1,122 @@
+"""Fixtures of enslaved thermostat integration tests."""
+from collections import Counter
+from dataclasses import dataclass, field
+
+import pytest
+from homeassistant.const import EVENT_CALL_SERVICE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
+
+from custom_components.enslaved_thermostat import DOMAIN
+from custom_components.enslaved_thermostat.climate.common import EnslavedGenericThermostat
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+MASTER = "climate.master"
+SCHEDULABLE = "climate.schedulable"
+
+
+def zone_entity_id(idx: int) -> str:
+    """Return the entity ID of an enslaved thermostat of the test group"""
+    return f"climate.zone_{idx}"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations in all tests."""
+    yield
+
+
+@dataclass
+class Costs:
+    """Costs of an operation: service calls, state writes and heater toggles"""
+
+    service_calls: Counter = field(default_factory=Counter)
+    state_writes: Counter = field(default_factory=Counter)
+    heater_toggles: int = 0
+
+    def reset(self) -> None:
+        """Reset the costs"""
+        self.service_calls.clear()
+        self.state_writes.clear()
+        self.heater_toggles = 0
+
+
+@pytest.fixture
+def costs(hass: HomeAssistant, monkeypatch) -> Costs:
+    """
+    Count the costs of operations: service calls on the bus, state writes of the integration
+    entities and heater toggles (on a fake heater service registry).
+    """
+    result = Costs()
+
+    @callback
+    def _async_service_called(event) -> None:
+        result.service_calls[f"{event.data['domain']}.{event.data['service']}"] += 1
+
+    hass.bus.async_listen(EVENT_CALL_SERVICE, _async_service_called)
+
+    async def _async_heater_toggled(call) -> None:
+        result.heater_toggles += 1
+        entity_ids = call.data["entity_id"]
+        for entity_id in [entity_ids] if isinstance(entity_ids, str) else entity_ids:
+            hass.states.async_set(entity_id, "on" if call.service == "turn_on" else "off")
+
+    for service in ("turn_on", "turn_off"):
+        hass.services.async_register("homeassistant", service, _async_heater_toggled)
+
+    write_ha_state = EnslavedGenericThermostat.async_write_ha_state
+
+    @callback
+    def _async_write_ha_state(self) -> None:
+        result.state_writes[self.entity_id] += 1
+        write_ha_state(self)
+
+    monkeypatch.setattr(EnslavedGenericThermostat, "async_write_ha_state", _async_write_ha_state)
+    return result
+
+
+async def async_setup_group(hass: HomeAssistant, size: int, temperature: float = 18) -> None:
+    """
+    Set up a group of enslaved thermostats (in auto enslaved mode, with their heater and sensor)
+    controlled by a master and a schedulable thermostat.
+    """
+    zones = []
+    for idx in range(size):
+        hass.states.async_set(f"switch.heater_{idx}", "off")
+        hass.states.async_set(
+            f"sensor.temperature_{idx}", str(temperature), {"unit_of_measurement": "°C"}
+        )
+        zones.append(
+            {
+                "platform": DOMAIN,
+                "name": f"zone {idx}",
+                "unique_id": f"zone_{idx}",
+                "heater": f"switch.heater_{idx}",
+                "target_sensor": f"sensor.temperature_{idx}",
+                "initial_enslaved_mode": "auto",
+            }
+        )
+    members = [zone_entity_id(idx) for idx in range(size)]
+    assert await async_setup_component(
+        hass,
+        "climate",
+        {
+            "climate": zones
+            + [
+                {
+                    "platform": DOMAIN,
+                    "name": "master",
+                    "type": "master",
+                    "enslaved_thermostats": members,
+                },
+                {
+                    "platform": DOMAIN,
+                    "name": "schedulable",
+                    "type": "schedulable",
+                    "enslaved_thermostats": members,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
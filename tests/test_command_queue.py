@@ -0,0 +1,105 @@
+"""Tests of the serialized command queue of enslaved thermostat"""
+import asyncio
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.enslaved_thermostat.climate.command_queue import CommandQueue, queued_command
+
+
+class FakeThermostat:
+    """Fake thermostat recording its commands (blocked until released)"""
+
+    def __init__(self):
+        self._command_queue = CommandQueue()
+        self.release = asyncio.Event()
+        self.commands = []
+
+    @queued_command
+    async def block(self):
+        """Block the queue until released"""
+        await self.release.wait()
+
+    @queued_command
+    async def set_mode(self, mode=None, temperature=None):
+        """Record the command"""
+        self.commands.append((mode, temperature))
+        return (mode, temperature)
+
+    @queued_command
+    async def fail(self):
+        """Fail"""
+        raise HomeAssistantError("Failed")
+
+
+async def async_start(*coroutines):
+    """Start coroutines as tasks and let them reach the queue"""
+    tasks = [asyncio.create_task(coroutine) for coroutine in coroutines]
+    await asyncio.sleep(0)
+    return tasks
+
+
+async def test_coalesce_same_arguments():
+    """Check waiting commands with the same arguments are coalesced (latest wins)"""
+    thermostat = FakeThermostat()
+    blocked, first, second = await async_start(
+        thermostat.block(),
+        thermostat.set_mode(temperature=20),
+        thermostat.set_mode(temperature=21),
+    )
+    thermostat.release.set()
+    assert await asyncio.gather(blocked, first, second) == [None, (None, 21), (None, 21)]
+    assert thermostat.commands == [(None, 21)]
+
+
+async def test_no_coalesce_different_arguments():
+    """Check waiting commands with different arguments are all run, in their arrival order"""
+    thermostat = FakeThermostat()
+    tasks = await async_start(
+        thermostat.block(),
+        thermostat.set_mode(mode="off"),
+        thermostat.set_mode(temperature=20),
+    )
+    thermostat.release.set()
+    await asyncio.gather(*tasks)
+    assert thermostat.commands == [("off", None), (None, 20)]
+
+
+async def test_cancelled_caller_hands_off():
+    """Check a cancelled caller does not cancel the command for the coalesced callers"""
+    thermostat = FakeThermostat()
+    blocked, first, second = await async_start(
+        thermostat.block(),
+        thermostat.set_mode(temperature=20),
+        thermostat.set_mode(temperature=21),
+    )
+    first.cancel()
+    await asyncio.sleep(0)
+    thermostat.release.set()
+    assert await second == (None, 21)
+    assert first.cancelled()
+    await blocked
+    assert thermostat.commands == [(None, 21)]
+
+
+async def test_all_callers_cancelled():
+    """Check a command is dropped if all its callers are cancelled before it runs"""
+    thermostat = FakeThermostat()
+    blocked, cancelled, other = await async_start(
+        thermostat.block(),
+        thermostat.set_mode(temperature=20),
+        thermostat.set_mode(mode="off"),
+    )
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    thermostat.release.set()
+    await asyncio.gather(blocked, other)
+    assert thermostat.commands == [("off", None)]
+
+
+async def test_command_error():
+    """Check the error of a command is raised to its callers, and next commands still run"""
+    thermostat = FakeThermostat()
+    with pytest.raises(HomeAssistantError, match="Failed"):
+        await thermostat.fail()
+    assert await thermostat.set_mode(mode="off") == ("off", None)
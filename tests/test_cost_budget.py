@@ -0,0 +1,137 @@
+"""
+Cost budgets of the public operations of enslaved thermostat integration: each operation on a group
+of N enslaved thermostats must not exceed its budget of service calls (on the bus), state writes
+and heater toggles, linear in N, so a change making a broadcast quadratic or adding redundant state
+writes fails.
+"""
+from typing import NamedTuple
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.enslaved_thermostat import DOMAIN
+
+from .conftest import MASTER, SCHEDULABLE, Costs, async_setup_group, zone_entity_id
+
+GROUP_SIZES = (1, 5, 20)
+
+
+class Budget(NamedTuple):
+    """Budget of an operation: (per member cost, fixed cost) of each kind"""
+
+    service_calls: tuple[int, int]
+    state_writes: tuple[int, int]
+    heater_toggles: tuple[int, int]
+
+
+class Case(NamedTuple):
+    """Operation to measure (after preparation calls) and its budget"""
+
+    prepare: list[tuple[str, str, dict]]
+    operation: tuple[str, str, dict]
+    budget: Budget
+
+
+HEAT_21 = ("climate", "set_temperature", {"entity_id": MASTER, "temperature": 21})
+CASES = {
+    "master_set_temperature": Case(
+        [("climate", "set_hvac_mode", {"entity_id": MASTER, "hvac_mode": "heat"})],
+        HEAT_21,
+        Budget(service_calls=(1, 1), state_writes=(2, 1), heater_toggles=(1, 0)),
+    ),
+    "master_set_hvac_mode": Case(
+        [HEAT_21],
+        ("climate", "set_hvac_mode", {"entity_id": MASTER, "hvac_mode": "heat"}),
+        Budget(service_calls=(1, 1), state_writes=(2, 1), heater_toggles=(1, 0)),
+    ),
+    "master_set_enslaved_mode_auto": Case(
+        [],
+        (
+            DOMAIN,
+            "set_enslaved_mode",
+            {"entity_id": MASTER, "mode": "auto", "temperature": 21, "hvac_mode": "heat"},
+        ),
+        Budget(service_calls=(1, 1), state_writes=(4, 2), heater_toggles=(1, 0)),
+    ),
+    "master_set_enslaved_mode_manual": Case(
+        [HEAT_21],
+        (DOMAIN, "set_enslaved_mode", {"entity_id": MASTER, "mode": "manual"}),
+        Budget(service_calls=(0, 1), state_writes=(2, 1), heater_toggles=(0, 0)),
+    ),
+    "start_scheduler_mode": Case(
+        [],
+        (
+            DOMAIN,
+            "start_scheduler_mode",
+            {"entity_id": SCHEDULABLE, "temperature": 22, "hvac_mode": "heat"},
+        ),
+        Budget(service_calls=(1, 1), state_writes=(3, 1), heater_toggles=(1, 0)),
+    ),
+    "stop_scheduler_mode": Case(
+        [
+            (
+                DOMAIN,
+                "start_scheduler_mode",
+                {"entity_id": SCHEDULABLE, "temperature": 22, "hvac_mode": "heat"},
+            )
+        ],
+        (DOMAIN, "stop_scheduler_mode", {"entity_id": SCHEDULABLE}),
+        Budget(service_calls=(1, 1), state_writes=(3, 1), heater_toggles=(1, 0)),
+    ),
+    "member_set_enslaved_mode": Case(
+        [],
+        (
+            DOMAIN,
+            "set_enslaved_mode",
+            {
+                "entity_id": zone_entity_id(0),
+                "mode": "auto",
+                "temperature": 21,
+                "hvac_mode": "heat",
+            },
+        ),
+        Budget(service_calls=(0, 2), state_writes=(0, 3), heater_toggles=(0, 1)),
+    ),
+    "member_restore_manual_state": Case(
+        [
+            (
+                DOMAIN,
+                "set_manual_state",
+                {"entity_id": zone_entity_id(0), "temperature": 21, "hvac_mode": "heat"},
+            )
+        ],
+        (DOMAIN, "restore_manual_state", {"entity_id": zone_entity_id(0)}),
+        Budget(service_calls=(0, 2), state_writes=(0, 3), heater_toggles=(0, 1)),
+    ),
+}
+
+
+async def async_call(hass: HomeAssistant, domain: str, service: str, data: dict) -> None:
+    """Call a service and wait for all the resulting updates"""
+    await hass.services.async_call(domain, service, data, blocking=True)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize("size", GROUP_SIZES)
+@pytest.mark.parametrize("case", CASES.values(), ids=CASES.keys())
+async def test_operation_cost_budget(
+    hass: HomeAssistant, costs: Costs, case: Case, size: int
+) -> None:
+    """Check the cost of an operation is within its budget"""
+    await async_setup_group(hass, size)
+    for call in case.prepare:
+        await async_call(hass, *call)
+    costs.reset()
+
+    await async_call(hass, *case.operation)
+
+    for kind, cost in (
+        ("service_calls", sum(costs.service_calls.values())),
+        ("state_writes", sum(costs.state_writes.values())),
+        ("heater_toggles", costs.heater_toggles),
+    ):
+        per_member, fixed = getattr(case.budget, kind)
+        assert cost <= per_member * size + fixed, (
+            f"{kind} over budget for a group of {size}: {cost} > {per_member} * {size} + {fixed}"
+            f" ({dict(costs.service_calls)}, {dict(costs.state_writes)})"
+        )
@@ -0,0 +1,36 @@
+"""Tests of the enslaved thermostat services"""
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.enslaved_thermostat import DOMAIN
+
+from .conftest import Costs, async_setup_group, zone_entity_id
+
+
+async def test_restore_manual_state_in_scheduler_mode(hass: HomeAssistant, costs: Costs) -> None:
+    """Check the manual state could not be restored in scheduler mode"""
+    await async_setup_group(hass, 1)
+    entity_id = zone_entity_id(0)
+    await hass.services.async_call(
+        DOMAIN,
+        "set_manual_state",
+        {"entity_id": entity_id, "temperature": 22, "hvac_mode": "heat"},
+        blocking=True,
+    )
+    await hass.services.async_call(
+        DOMAIN, "start_scheduler_mode", {"entity_id": entity_id, "temperature": 19}, blocking=True
+    )
+    before = hass.states.get(entity_id)
+
+    with pytest.raises(ServiceValidationError, match="in scheduler mode"):
+        await hass.services.async_call(
+            DOMAIN, "restore_manual_state", {"entity_id": entity_id}, blocking=True
+        )
+
+    state = hass.states.get(entity_id)
+    assert state.attributes["enslaved_mode"] == before.attributes["enslaved_mode"] == "auto"
+    assert (
+        state.attributes["scheduler_previous_target_temp"]
+        == before.attributes["scheduler_previous_target_temp"]
+    )
@@ -0,0 +1,93 @@
+"""Tests of the batched heater control of enslaved thermostats fleet"""
+import math
+import random
+from array import array
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from custom_components.enslaved_thermostat import DOMAIN
+from custom_components.enslaved_thermostat.climate import fleet
+
+from .conftest import Costs, async_setup_group, zone_entity_id
+
+HEAT = {"hvac_mode": "heat"}
+
+
+def build_fleet(zones, seed=0):
+    """Build the control parameters arrays of a random fleet (with some unknown temperatures)"""
+    rand = random.Random(seed)
+
+    def temperatures(low, high):
+        return array(
+            "d",
+            (math.nan if rand.random() < 0.05 else rand.uniform(low, high) for _ in range(zones)),
+        )
+
+    return (
+        temperatures(14, 24),
+        temperatures(16, 22),
+        array("d", (rand.choice((0.1, 0.3, 0.5)) for _ in range(zones))),
+        array("d", (rand.choice((0.1, 0.3, 0.5)) for _ in range(zones))),
+        array("B", (rand.random() < 0.2 for _ in range(zones))),
+        array("B", (rand.random() < 0.9 for _ in range(zones))),
+        array("B", (rand.random() < 0.5 for _ in range(zones))),
+    )
+
+
+def test_heat_transitions():
+    """Test the heater transitions of zones in heat mode"""
+    zones = (
+        array("d", [18, 18, 22, 22, math.nan, 18, 18]),
+        array("d", [20, 20, 20, 20, 20, 20, 20]),
+        array("d", [0.3] * 7),
+        array("d", [0.3] * 7),
+        array("B", [0] * 7),
+        array("B", [1, 1, 1, 1, 1, 0, 0]),
+        array("B", [0, 1, 0, 1, 0, 0, 1]),
+    )
+    # pylint: disable=protected-access
+    assert fleet._py_evaluate_transitions(*zones, None) == ([0], [3, 6])
+
+
+@pytest.mark.skipif(fleet.np is None, reason="NumPy is not installed")
+@pytest.mark.parametrize("zones", [100, 1000, 5000])
+def test_numpy_python_identical(zones):
+    """Test the NumPy and the pure Python implementations return the same transitions"""
+    arrays = build_fleet(zones)
+    dirty = sorted(random.Random(1).sample(range(zones), zones // 10))
+    for indexes in (None, dirty):
+        # pylint: disable=protected-access
+        assert fleet._np_evaluate_transitions(*arrays, indexes) == fleet._py_evaluate_transitions(
+            *arrays, indexes
+        )
+
+
+async def test_zone_turned_off_disabled(hass: HomeAssistant, costs: Costs) -> None:
+    """Check a zone turned off with its heater already off is disabled in the fleet"""
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {"fleet_control": True}})
+    await async_setup_group(hass, 1)
+    for service, data in (("set_temperature", {"temperature": 21}), ("set_hvac_mode", HEAT)):
+        await hass.services.async_call(
+            "climate", service, {"entity_id": zone_entity_id(0), **data}, blocking=True
+        )
+    await hass.async_block_till_done()
+    assert hass.states.get("switch.heater_0").state == "on"
+
+    # Heater turned off externally, then zone turned off
+    hass.states.async_set("switch.heater_0", "off")
+    await hass.async_block_till_done()
+    await hass.services.async_call(
+        "climate",
+        "set_hvac_mode",
+        {"entity_id": zone_entity_id(0), "hvac_mode": "off"},
+        blocking=True,
+    )
+    costs.reset()
+
+    # pylint: disable=protected-access
+    await fleet.async_get_fleet_controller(hass)._async_tick()
+    await hass.async_block_till_done()
+    assert costs.heater_toggles == 0
+    assert hass.states.get("switch.heater_0").state == "off"
@@ -0,0 +1,51 @@
+"""Tests of the sensor input stage of enslaved thermostat"""
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.enslaved_thermostat import DOMAIN
+
+ZONE = "climate.zone"
+SENSOR = "sensor.temperature"
+
+
+async def async_set_temperature(hass: HomeAssistant, temperature: float) -> None:
+    """Set the temperature of the sensor"""
+    hass.states.async_set(SENSOR, str(temperature), {"unit_of_measurement": "°C"})
+    await hass.async_block_till_done()
+
+
+async def test_throttled_temperature_dropped_when_back(hass: HomeAssistant) -> None:
+    """Check a throttled temperature is not applied once the sensor is back to the current one"""
+    hass.states.async_set("switch.heater", "off")
+    await async_set_temperature(hass, 20.0)
+    assert await async_setup_component(
+        hass,
+        "climate",
+        {
+            "climate": {
+                "platform": DOMAIN,
+                "name": "zone",
+                "heater": "switch.heater",
+                "target_sensor": SENSOR,
+                "precision": 0.1,
+                "sensor_min_interval": "00:01:00",
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    # Applied immediately (larger than the tolerance), start the throttling interval
+    await async_set_temperature(hass, 20.5)
+    assert hass.states.get(ZONE).attributes["current_temperature"] == 20.5
+
+    # Throttled, then back to the current temperature
+    await async_set_temperature(hass, 20.7)
+    await async_set_temperature(hass, 20.5)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=2))
+    await hass.async_block_till_done()
+    assert hass.states.get(ZONE).attributes["current_temperature"] == 20.5
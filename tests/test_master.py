@@ -0,0 +1,133 @@
+"""Tests of the master thermostat fan-out to its enslaved thermostats"""
+import asyncio
+import time
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+
+from custom_components.enslaved_thermostat import DOMAIN
+from custom_components.enslaved_thermostat.const import CircuitState
+from custom_components.enslaved_thermostat.helpers import async_get_entity
+
+from .conftest import MASTER, Costs, async_setup_group, zone_entity_id
+
+
+async def test_manual_mode_uses_climate_services(hass: HomeAssistant, costs: Costs) -> None:
+    """
+    Check the climate services are called on the enslaved thermostats (instead of their methods) to
+    keep the service layer checks (unit conversion, availability)
+    """
+    await async_setup_group(hass, 3)
+    costs.reset()
+
+    await hass.services.async_call(
+        DOMAIN,
+        "set_enslaved_mode",
+        {"entity_id": MASTER, "mode": "manual", "temperature": 21, "hvac_mode": "heat"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert costs.service_calls["climate.set_temperature"] == 3
+    assert costs.service_calls["climate.set_hvac_mode"] == 3
+    for idx in range(3):
+        state = hass.states.get(zone_entity_id(idx))
+        assert state.state == "heat"
+        assert state.attributes["temperature"] == 21
+        assert state.attributes["enslaved_mode"] == "manual"
+
+
+@pytest.mark.parametrize(
+    "entity_id,service,data",
+    [
+        (
+            zone_entity_id(0),
+            "schedule_scheduler_mode",
+            {"start_at": "2024-01-15 07:00:00", "temperature": 20},
+        ),
+        (MASTER, "schedule_scheduler_mode", {"start_at": "2024-01-15 07:00:00", "temperature": 20}),
+        (zone_entity_id(0), "snapshot_group", {}),
+        (zone_entity_id(0), "restore_group", {}),
+        (MASTER, "restore_enslaved_state", {"enslaved_mode": "auto"}),
+    ],
+)
+async def test_unsupported_service(hass: HomeAssistant, entity_id: str, service: str, data: dict):
+    """Check a service not supported by the type of thermostat raises a validation error"""
+    await async_setup_group(hass, 1)
+
+    with pytest.raises(ServiceValidationError, match="only supported by"):
+        await hass.services.async_call(
+            DOMAIN, service, {"entity_id": entity_id, **data}, blocking=True
+        )
+
+
+async def test_member_call_timeout_not_cancelled(hass: HomeAssistant) -> None:
+    """Check a call on an enslaved thermostat is not cancelled when its timeout expires"""
+    await async_setup_group(hass, 1)
+    master = async_get_entity(hass, MASTER)
+    master._member_call_timeout = 0.01  # pylint: disable=protected-access
+    finished = []
+
+    async def _async_slow_set_enslaved_target_temp(temperature):
+        await asyncio.sleep(0.05)
+        finished.append(temperature)
+
+    member = async_get_entity(hass, zone_entity_id(0))
+    member.async_set_enslaved_target_temp = _async_slow_set_enslaved_target_temp
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        "set_enslaved_target_temperature",
+        {"entity_id": MASTER, "temperature": 21},
+        blocking=True,
+        return_response=True,
+    )
+    assert result[MASTER]["members"][zone_entity_id(0)]["error"] == "Timeout after 0.01s"
+    assert not finished
+
+    await hass.async_block_till_done()
+    assert finished == [21]
+
+
+@pytest.mark.parametrize(
+    "error,circuit",
+    [(None, CircuitState.CLOSED), (HomeAssistantError("Unreachable"), CircuitState.OPEN)],
+)
+async def test_cancelled_probe_settles_circuit(
+    hass: HomeAssistant, error: Exception | None, circuit: CircuitState
+) -> None:
+    """Check a half-open probe call is settled with its outcome when its caller is cancelled"""
+    await async_setup_group(hass, 1)
+    master = async_get_entity(hass, MASTER)
+    breaker = master._circuit_breakers[zone_entity_id(0)]  # pylint: disable=protected-access
+    breaker.record_failure()
+    breaker.state = CircuitState.OPEN
+    breaker._opened_at = time.monotonic() - breaker.cool_down  # pylint: disable=protected-access
+    started = asyncio.Event()
+
+    async def _async_slow_set_enslaved_target_temp(temperature):
+        started.set()
+        await asyncio.sleep(0.05)
+        if error:
+            raise error
+
+    member = async_get_entity(hass, zone_entity_id(0))
+    member.async_set_enslaved_target_temp = _async_slow_set_enslaved_target_temp
+
+    call = hass.async_create_task(
+        hass.services.async_call(
+            DOMAIN,
+            "set_enslaved_target_temperature",
+            {"entity_id": MASTER, "temperature": 21},
+            blocking=True,
+        )
+    )
+    await started.wait()
+    assert breaker.state == CircuitState.HALF_OPEN
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+
+    await hass.async_block_till_done()
+    assert breaker.state == circuit
@@ -0,0 +1,28 @@
+"""Tests of the performance metrics of enslaved thermostat integration"""
+from homeassistant.core import HomeAssistant
+
+from custom_components.enslaved_thermostat import DOMAIN
+from custom_components.enslaved_thermostat.helpers import async_get_entity
+from custom_components.enslaved_thermostat.metrics import async_get_metrics
+
+from .conftest import MASTER, SCHEDULABLE, Costs, async_setup_group
+
+
+async def test_entities_registered(hass: HomeAssistant, costs: Costs) -> None:
+    """Check the entities are registered in the metrics registry and their counters updated"""
+    await async_setup_group(hass, 1)
+    registry = async_get_metrics(hass)
+    assert set(registry.groups) == {MASTER, SCHEDULABLE}
+    master = async_get_entity(hass, MASTER)
+    # pylint: disable=protected-access
+    assert master._metrics is registry._entities[MASTER]
+
+    await hass.services.async_call(
+        DOMAIN,
+        "set_enslaved_target_temperature",
+        {"entity_id": MASTER, "temperature": 21},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert master._metrics.fan_out_latency.percentile(100) is not None
+    assert master._metrics.events_received > 0
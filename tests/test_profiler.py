@@ -0,0 +1,44 @@
+"""Tests of the hot paths profile of enslaved thermostat integration"""
+import logging
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.setup import async_setup_component
+
+from custom_components.enslaved_thermostat import DOMAIN
+from custom_components.enslaved_thermostat.profiler import (
+    _write_report,
+    async_get_hot_path_profiler,
+)
+
+
+@pytest.mark.parametrize(
+    "path", ["configuration.yaml", "/etc/enslaved_thermostat_profile.json", "../profile.json"]
+)
+async def test_profile_path_not_allowed(hass: HomeAssistant, path: str) -> None:
+    """Check the profile service refuses to write its report outside of allowed JSON files"""
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    await hass.async_block_till_done()
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(DOMAIN, "profile", {"path": path}, blocking=True)
+
+
+async def test_profile_path_file_name(hass: HomeAssistant) -> None:
+    """Check a report file name is written in the configuration directory"""
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    await hass.async_block_till_done()
+
+    result = await hass.services.async_call(
+        DOMAIN, "profile", {"path": "profile.json"}, blocking=True, return_response=True
+    )
+    assert result["path"] == hass.config.path("profile.json")
+    async_get_hot_path_profiler(hass).async_stop()
+
+
+def test_write_report_error_logged(tmp_path, caplog) -> None:
+    """Check a failure to write the report is logged"""
+    with caplog.at_level(logging.ERROR):
+        _write_report(str(tmp_path / "missing" / "profile.json"), {})
+    assert "Fail to write hot paths profile report" in caplog.text
@@ -0,0 +1,43 @@
+"""Tests of the fusion of the temperature of several sensors"""
+import time
+
+from custom_components.enslaved_thermostat.climate.sensor_fusion import SensorFusion
+from custom_components.enslaved_thermostat.const import SensorFusionMethod
+
+SENSORS = ["sensor.temperature_1", "sensor.temperature_2"]
+
+
+def test_weighted_mean():
+    """Test the weighted mean of the sensors values"""
+    fusion = SensorFusion(SENSORS, weights={SENSORS[0]: 3})
+    fusion.update(SENSORS[0], 20)
+    assert fusion.update(SENSORS[1], 16) == 19
+    assert fusion.update(SENSORS[0], None) == 16
+
+
+def test_min_max():
+    """Test the min and max fusion methods"""
+    for method, expected in ((SensorFusionMethod.MIN, 16), (SensorFusionMethod.MAX, 20)):
+        fusion = SensorFusion(SENSORS, method=method)
+        fusion.update(SENSORS[0], 20)
+        assert fusion.update(SENSORS[1], 16) == expected
+
+
+def test_stale_sensor_ignored():
+    """Test a sensor not reported since stale_after is ignored"""
+    fusion = SensorFusion(SENSORS, stale_after=60)
+    fusion.update(SENSORS[0], 20, time.time() - 120)
+    assert fusion.update(SENSORS[1], 16) == 16
+    assert not fusion.has_value(SENSORS[0])
+
+
+def test_steady_sensor_kept():
+    """Test a sensor reporting the same value (without state change event) is not stale"""
+    now = time.time()
+    fusion = SensorFusion(
+        SENSORS, stale_after=60, last_reported={SENSORS[0]: now, SENSORS[1]: None}.get
+    )
+    fusion.update(SENSORS[0], 20, now - 120)
+    fusion.update(SENSORS[1], 16, now - 120)
+    assert fusion.value() == 20
+    assert fusion.has_value(SENSORS[0])
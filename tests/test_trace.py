@@ -0,0 +1,70 @@
+"""Tests of the decision trace of enslaved thermostat integration"""
+import json
+
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from custom_components.enslaved_thermostat import DOMAIN
+from custom_components.enslaved_thermostat.trace import DecisionTrace, async_get_decision_trace
+
+from .conftest import Costs, async_setup_group, zone_entity_id
+
+HEAT = {"hvac_mode": "heat"}
+
+
+async def test_sampling_on_root_context(hass: HomeAssistant, tmp_path) -> None:
+    """Check a causal chain is sampled on the ID of its root context"""
+    trace = DecisionTrace(
+        hass, enabled=True, path=str(tmp_path / "trace.jsonl"), sample_rate=0.5, max_size=1000
+    )
+    roots = [Context() for _ in range(64)]
+    # pylint: disable=protected-access
+    sampled = next(root for root in roots if trace._is_sampled(root.id))
+    not_sampled = next(root for root in roots if not trace._is_sampled(root.id))
+
+    for root in (sampled, not_sampled):
+        child = Context(parent_id=root.id)
+        grandchild = Context(parent_id=child.id)
+        for context in (root, child, grandchild):
+            trace.async_record("test", "climate.test", context)
+
+    lines = [json.loads(line) for line in trace._buffer]
+    assert len(lines) == 3
+    assert [line["root_id"] for line in lines] == [sampled.id] * 3
+
+
+async def test_heater_toggle_traced_with_sensor_context(
+    hass: HomeAssistant, costs: Costs, tmp_path
+) -> None:
+    """Check a heater toggle caused by a sensor change is traced with the context of the change"""
+    assert await async_setup_component(
+        hass, DOMAIN, {DOMAIN: {"trace": True, "trace_path": str(tmp_path / "trace.jsonl")}}
+    )
+    await async_setup_group(hass, 1)
+    service_context = Context()
+    for service, data in (("set_temperature", {"temperature": 21}), ("set_hvac_mode", HEAT)):
+        await hass.services.async_call(
+            "climate",
+            service,
+            {"entity_id": zone_entity_id(0), **data},
+            blocking=True,
+            context=service_context,
+        )
+    await hass.async_block_till_done()
+
+    sensor_context = Context()
+    hass.states.async_set(
+        "sensor.temperature_0", "22", {"unit_of_measurement": "°C"}, context=sensor_context
+    )
+    await hass.async_block_till_done()
+
+    # pylint: disable=protected-access
+    toggles = [
+        line
+        for line in map(json.loads, async_get_decision_trace(hass)._buffer)
+        if line["event"] == "heater_toggle"
+    ]
+    assert [(line["on"], line["context_id"]) for line in toggles] == [
+        (True, service_context.id),
+        (False, sensor_context.id),
+    ]
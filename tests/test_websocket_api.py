@@ -0,0 +1,50 @@
+"""Tests of the websocket API of enslaved thermostat integration"""
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.enslaved_thermostat import DOMAIN
+from custom_components.enslaved_thermostat.const import DATA_WS_RATE_LIMITERS
+
+from .conftest import MASTER, SCHEDULABLE, async_setup_group
+
+
+async def test_subscriptions_rate_limited_per_connection(hass: HomeAssistant, hass_ws_client):
+    """Check the subscriptions of a connection share its rate limit"""
+    assert await async_setup_component(hass, DOMAIN, {})
+    await async_setup_group(hass, 1)
+    client = await hass_ws_client(hass)
+    for msg_id, entity_id in ((1, MASTER), (2, SCHEDULABLE)):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "enslaved_thermostat/subscribe_group",
+                "entity_id": entity_id,
+                "min_interval": 10,
+            }
+        )
+        assert (await client.receive_json())["success"]
+        assert "snapshot" in (await client.receive_json())["event"]
+
+    hass.states.async_set("sensor.temperature_0", "19.5", {"unit_of_measurement": "°C"})
+    await hass.async_block_till_done()
+
+    # Only one subscription is sent per interval, the other one waits for the next one
+    limiter = next(iter(hass.data[DOMAIN][DATA_WS_RATE_LIMITERS].values()))
+    now = dt_util.utcnow()
+    received = []
+    for seconds, waiting in ((11, 1), (22, 0)):
+        async_fire_time_changed(hass, now + timedelta(seconds=seconds))
+        await hass.async_block_till_done()
+        msg = await client.receive_json()
+        assert msg["event"]["changes"]
+        received.append(msg["id"])
+        assert len(limiter._waiting) == waiting  # pylint: disable=protected-access
+    assert sorted(received) == [1, 2]
+
+    await client.close()
+    await hass.async_block_till_done()
+    assert not hass.data[DOMAIN][DATA_WS_RATE_LIMITERS]